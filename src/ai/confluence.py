@@ -18,7 +18,7 @@ import traceback
 import time
 from collections import deque
 from datetime import datetime, timezone
-from typing import Any, Deque, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
@@ -199,6 +199,10 @@ class ConfluenceDetector:
         self._normalize_weights()
 
         self._last_confluence: Dict[str, ConfluenceSignal] = {}
+        # Per (pair, timeframe) ATR output buffers handed to IndicatorCache;
+        # overwritten by the next scan of the same series and released by
+        # forget_pairs() when a pair rotates out of the universe.
+        self._atr_buffers: Dict[Tuple[str, int], Dict[int, np.ndarray]] = {}
         self._signal_history: Deque[ConfluenceSignal] = deque(maxlen=1000)
         self._cooldown_checker = None
         # Funding rate data injected per scan cycle by the engine
@@ -316,6 +320,13 @@ class ConfluenceDetector:
                 self.strategies.append(cls(**valid_params))
         self._normalize_weights()
 
+    def forget_pairs(self, pairs: Iterable[str]) -> None:
+        """Drop per-pair scan buffers for pairs that left the trading universe."""
+        gone = set(pairs)
+        if gone:
+            for key in [k for k in self._atr_buffers if k[0] in gone]:
+                del self._atr_buffers[key]
+
     def set_cooldown_checker(self, checker) -> None:
         """Inject a cooldown checker: fn(pair, strategy_name, side) -> bool."""
         self._cooldown_checker = checker
@@ -340,11 +351,10 @@ class ConfluenceDetector:
 
     async def analyze_pair(self, pair: str) -> ConfluenceSignal:
         """
-        Run all strategies in parallel on a single pair and detect confluence.
-        
-        Returns a ConfluenceSignal with the aggregated result.
+        Run all strategies in sequence on a single pair and detect confluence.
         
-        # ENHANCEMENT: Added timeout protection per strategy
+        Returns a ConfluenceSignal with the aggregated result. A strategy
+        that raises is logged and skipped; the others still contribute.
         """
         # S3 FIX: Also reject stale data — don't trade on outdated prices
         if not self.market_data.is_warmed_up(pair) or self.market_data.is_stale(pair, max_age_seconds=180):
@@ -391,7 +401,10 @@ class ConfluenceDetector:
             if len(closes) < 50:
                 continue
 
-            indicator_cache = IndicatorCache(closes, highs, lows, volumes, opens)
+            indicator_cache = IndicatorCache(
+                closes, highs, lows, volumes, opens,
+                atr_buffers=self._atr_buffers.setdefault((pair, tf), {}),
+            )
             trend_regime, vol_regime, vol_level, vol_expanding = self._detect_regime(indicator_cache, closes)
 
             # Regime transition prediction (if available)
@@ -448,7 +461,11 @@ class ConfluenceDetector:
         trend_regime: Optional[str] = None,
         vol_regime: Optional[str] = None,
     ) -> List[StrategySignal]:
-        """Run all strategies for a given timeframe with timeout + cooldown filtering."""
+        """Run all strategies for a given timeframe in sequence with cooldown filtering.
+
+        Strategies are synchronous and run one after another; an exception
+        from one is caught and logged, and the rest still run.
+        """
         # Regime-aware binary gating: completely skip strategies that are
         # mismatched with the current regime.  This is stricter than the
         # existing soft weight multipliers.
@@ -473,18 +490,15 @@ class ConfluenceDetector:
             if strategy.name in gated_out:
                 continue
             try:
-                signal = await asyncio.wait_for(
-                    strategy.analyze(
-                        pair, closes, highs, lows, volumes,
-                        opens=opens,
-                        indicator_cache=indicator_cache,
-                        trend_regime=trend_regime,
-                        vol_regime=vol_regime,
-                        round_trip_fee_pct=self.round_trip_fee_pct,
-                        market_data=self.market_data,
-                        funding_rates=self._funding_rates,
-                    ),
-                    timeout=5.0,
+                signal = strategy.analyze(
+                    pair, closes, highs, lows, volumes,
+                    opens=opens,
+                    indicator_cache=indicator_cache,
+                    trend_regime=trend_regime,
+                    vol_regime=vol_regime,
+                    round_trip_fee_pct=self.round_trip_fee_pct,
+                    market_data=self.market_data,
+                    funding_rates=self._funding_rates,
                 )
                 if self._cooldown_checker and signal.direction != SignalDirection.NEUTRAL:
                     side = "buy" if signal.direction == SignalDirection.LONG else "sell"
@@ -506,11 +520,6 @@ class ConfluenceDetector:
                     except Exception:
                         pass
                 signals.append(signal)
-            except asyncio.TimeoutError:
-                logger.warning(
-                    "Strategy timed out",
-                    strategy=strategy.name, pair=pair
-                )
             except Exception as e:
                 logger.error(
                     "Strategy error",
@@ -537,11 +546,11 @@ class ConfluenceDetector:
         if not self.strategy_guardrails_enabled:
             return
 
-        window = list(strategy._recent_trades)[-self.strategy_guardrails_window_trades :]
+        window = strategy.recent_pnls()[-self.strategy_guardrails_window_trades :]
         if len(window) < self.strategy_guardrails_min_trades:
             return
 
-        pnls = [float(t[0]) for t in window]
+        pnls = window.tolist()
         wins = sum(1 for p in pnls if p > 0)
         losses = sum(1 for p in pnls if p < 0)
         win_rate = wins / len(pnls) if pnls else 0.0
@@ -199,8 +199,8 @@ class TFLitePredictor:
             else str(Path(model_path).parent / "normalization.json")
         )
         self._interpreter = None
-        self._input_details = None
-        self._output_details = None
+        self._input_details: List[Dict[str, Any]] = []
+        self._output_details: List[Dict[str, Any]] = []
         self._loaded = False
         self._prediction_cache: Dict[str, Tuple[float, float]] = {}  # hash -> (prob, time)
         self._cache_ttl = 60  # seconds
@@ -280,7 +280,9 @@ class TFLitePredictor:
         """Run inference through the TFLite model."""
         try:
             features = self.features.extract(market_state)
-            input_data = features.reshape(1, -1).astype(np.float32)
+            input_data = self._quantize_input(
+                features.reshape(1, -1).astype(np.float32), self._input_details[0]
+            )
 
             self._interpreter.set_tensor(
                 self._input_details[0]["index"], input_data
@@ -290,13 +292,33 @@ class TFLitePredictor:
             output = self._interpreter.get_tensor(
                 self._output_details[0]["index"]
             )
-            probability = float(output[0][0])
+            probability = self._dequantize_output(output[0][0], self._output_details[0])
             return np.clip(probability, 0.0, 1.0)
 
         except Exception as e:
             logger.error("TFLite inference failed", error=str(e))
             return self._predict_heuristic(market_state)
 
+    @staticmethod
+    def _quantize_input(x: np.ndarray, detail: Dict[str, Any]) -> np.ndarray:
+        """Map float features onto the input tensor's integer domain (full-int8 models)."""
+        dtype = np.dtype(detail["dtype"])
+        scale, zero_point = detail.get("quantization", (0.0, 0))
+        if dtype.kind == "f" or not scale:
+            return x
+        info = np.iinfo(dtype)
+        q = np.round(x / scale + zero_point)
+        quantized: np.ndarray = np.clip(q, info.min, info.max).astype(dtype)
+        return quantized
+
+    @staticmethod
+    def _dequantize_output(value: Any, detail: Dict[str, Any]) -> float:
+        """Convert a (possibly quantized) output element back to a float probability."""
+        scale, zero_point = detail.get("quantization", (0.0, 0))
+        if np.dtype(detail["dtype"]).kind == "f" or not scale:
+            return float(value)
+        return (float(value) - float(zero_point)) * float(scale)
+
     def _predict_heuristic(self, market_state: Dict[str, Any]) -> float:
         """
         Direction-aware heuristic fallback when TFLite model is unavailable.
@@ -3102,6 +3102,11 @@ class DashboardServer:
                     rm.kelly_fraction = cfg.risk.kelly_fraction
                     rm.global_cooldown_seconds_on_loss = cfg.risk.global_cooldown_seconds_on_loss
 
+            if any(k.startswith("monitoring.") for k in changed_paths):
+                apply_monitoring = getattr(engine, "apply_monitoring_config", None)
+                if callable(apply_monitoring):
+                    apply_monitoring()
+
             if any(k.startswith("trading.") for k in changed_paths):
                 engine.scan_interval = cfg.trading.scan_interval_seconds
                 if getattr(engine, "executor", None):
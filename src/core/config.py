@@ -119,6 +119,11 @@ def _apply_env_overrides(config: Dict[str, Any]) -> None:
             lambda v: [s.strip().upper() for s in v.split(",") if s.strip()],
         ),
         "STOCKS_SCAN_INTERVAL_SECONDS": ("stocks", "scan_interval_seconds", int),
+        "STOCKS_SCAN_MARKET_HOURS_ONLY": (
+            "stocks",
+            "scan_market_hours_only",
+            lambda v: v.lower() in ("1", "true", "yes", "on"),
+        ),
         "STOCKS_LOOKBACK_BARS": ("stocks", "lookback_bars", int),
         "STOCKS_MIN_HOLD_DAYS": ("stocks", "min_hold_days", int),
         "STOCKS_MAX_HOLD_DAYS": ("stocks", "max_hold_days", int),
@@ -783,11 +788,22 @@ class MLConfig(BaseModel):
     epochs: int = 50
     batch_size: int = 64
     validation_split: float = 0.2
+    # Which TFLite artifact to deploy: "int8" (CPU / edge integer kernels) or
+    # "fp16" (keeps GPU-delegate compatibility). Both are built every run.
+    tflite_precision: str = "int8"
     features: List[str] = Field(default_factory=lambda: [
         "rsi", "ema_ratio", "bb_position", "adx", "volume_ratio",
         "obi", "atr_pct", "momentum_score", "trend_strength", "spread_pct"
     ])
 
+    @field_validator("tflite_precision", mode="before")
+    @classmethod
+    def validate_tflite_precision(cls, v):
+        v = str(v).strip().lower()
+        if v not in ("int8", "fp16"):
+            raise ValueError("tflite_precision must be 'int8' or 'fp16'")
+        return v
+
 
 class ElasticsearchConfig(BaseModel):
     enabled: bool = False
@@ -875,6 +891,8 @@ class StocksConfig(BaseModel):
     option_symbols: List[str] = Field(default_factory=list)
     option_contract_multiplier: int = 100
     scan_interval_seconds: int = 900
+    # Skip scans outside the regular NYSE session (holidays included).
+    scan_market_hours_only: bool = True
     lookback_bars: int = 120
     min_hold_days: int = 1
     max_hold_days: int = 7
@@ -1148,6 +1166,8 @@ def save_to_yaml(
 
     ``updates`` is a nested dict like ``{"ai": {"confluence_threshold": 3}, "risk": {"max_risk_per_trade": 0.01}}``.
     Only the specified keys are overwritten; everything else is untouched.
+    Nested dicts are merged, so ``{"strategies": {"keltner": {"weight": 0.3}}}``
+    updates the weight without dropping keltner's other parameters.
     """
     from ruamel.yaml import YAML
 
@@ -1161,13 +1181,19 @@ def save_to_yaml(
     else:
         doc = {}
 
+    def _merge(dst: Dict[str, Any], src: Dict[str, Any]) -> None:
+        for key, value in src.items():
+            if isinstance(value, dict) and isinstance(dst.get(key), dict):
+                _merge(dst[key], value)
+            else:
+                dst[key] = value
+
     for section, kvs in updates.items():
         if not isinstance(kvs, dict):
             continue
         if section not in doc or not isinstance(doc[section], dict):
             doc[section] = {}
-        for key, value in kvs.items():
-            doc[section][key] = value
+        _merge(doc[section], kvs)
 
     tmp = config_file.with_suffix(".yaml.tmp")
     with open(tmp, "w") as f:
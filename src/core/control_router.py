@@ -8,7 +8,7 @@ so auth and routing stay in one place. The router delegates to the engine/execut
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, List, Optional, Protocol, runtime_checkable
+from typing import Any, Dict, List, Optional, Protocol, Sequence, runtime_checkable
 
 from src.core.logger import get_logger
 
@@ -27,7 +27,6 @@ class EngineInterface(Protocol):
     tenant_id: str
     mode: str
     exchange_name: str
-    pairs: List[str]
     scan_interval: int
     _running: bool
     _trading_paused: bool
@@ -42,6 +41,10 @@ class EngineInterface(Protocol):
     market_data: Any
     ws_client: Any
 
+    # Read-only so list (crypto) and tuple (stocks) pair holders both match
+    @property
+    def pairs(self) -> Sequence[str]: ...
+
     # --- methods ---
     async def stop(self) -> None: ...
 
@@ -19,7 +19,7 @@ import os
 import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import aiosqlite
 import hashlib
@@ -46,6 +46,10 @@ class DatabaseManager:
 
     # Timeout for acquiring the DB lock to prevent deadlocks.
     _LOCK_TIMEOUT: float = 30.0
+    # Prepared statements kept per connection (sqlite3 LRU, keyed by SQL
+    # text). The single long-lived connection re-uses parsed/planned
+    # statements for the hot trade/thought queries instead of re-preparing.
+    _STATEMENT_CACHE_SIZE: int = 256
 
     def __init__(self, db_path: str = "data/trading.db"):
         self.db_path = db_path
@@ -87,7 +91,11 @@ class DatabaseManager:
         """Initialize database connection and create schema."""
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        self._db = await aiosqlite.connect(self.db_path, timeout=15)
+        self._db = await aiosqlite.connect(
+            self.db_path,
+            timeout=15,
+            cached_statements=self._STATEMENT_CACHE_SIZE,
+        )
 
         # Enable WAL mode for concurrent access
         await self._db.execute("PRAGMA journal_mode=WAL")
@@ -932,6 +940,36 @@ class DatabaseManager:
             )
             await self._db.commit()
 
+    async def insert_thoughts_many(self, thoughts: Sequence[Mapping[str, Any]]) -> None:
+        """Insert a batch of thoughts in one transaction (executemany).
+
+        Each entry carries the log_thought fields plus an optional
+        ``timestamp`` captured when the thought was emitted.
+        """
+        if not thoughts:
+            return
+        db = self._db
+        if db is None:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+        rows = [
+            (
+                t.get("timestamp") or datetime.now(timezone.utc).isoformat(),
+                t["category"],
+                t["message"],
+                t.get("severity", "info"),
+                json.dumps(t.get("metadata") or {}),
+                t.get("tenant_id") or "default",
+            )
+            for t in thoughts
+        ]
+        async with self._timed_lock():
+            await db.executemany(
+                """INSERT INTO thought_log (timestamp, category, message, severity, metadata, tenant_id)
+                VALUES (?, ?, ?, ?, ?, ?)""",
+                rows,
+            )
+            await db.commit()
+
     async def get_thoughts(
         self, limit: int = 50, tenant_id: Optional[str] = "default"
     ) -> List[Dict[str, Any]]:
@@ -1858,6 +1896,17 @@ class DatabaseManager:
             )
             await self._db.commit()
 
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """Connection/lock snapshot for execution stats and health endpoints."""
+        return {
+            "backend": "sqlite",
+            "connected": self._db is not None,
+            "initialized": self._initialized,
+            "statement_cache_size": self._STATEMENT_CACHE_SIZE,
+            "write_lock_held": self._lock.locked(),
+            "read_slots_exhausted": self._read_semaphore.locked(),
+        }
+
     async def close(self) -> None:
         """Close database connection gracefully."""
         if self._db:
@@ -950,6 +950,7 @@ class BotEngine:
                 epochs=self.config.ml.epochs,
                 batch_size=self.config.ml.batch_size,
                 feature_names=self.config.ml.features,
+                tflite_precision=self.config.ml.tflite_precision,
                 tenant_id=self.tenant_id,
             )
             self.retrainer = AutoRetrainer(
@@ -1253,8 +1254,10 @@ class BotEngine:
             except Exception as e:
                 logger.warning("WS unsubscribe failed for removed pairs", error=repr(e))
 
-        # 2. Update the pair list
+        # 2. Update the pair list and release per-pair scan buffers
         self.pairs = new_pairs
+        if removed and self.confluence:
+            self.confluence.forget_pairs(removed)
 
         # 3. Subscribe new pairs to WS
         if added and hasattr(self, "ws_client") and self.ws_client and getattr(self.ws_client, "is_connected", False):
@@ -1487,6 +1490,11 @@ class BotEngine:
                 )
 
         # Now safe to close resources
+        if self.continuous_learner:
+            try:
+                await self.continuous_learner.force_save()
+            except Exception:
+                pass
         if self.es_client:
             try:
                 await self.es_client.close()
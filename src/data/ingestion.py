@@ -86,16 +86,7 @@ class MarketDataIndexer:
     def _compute_indicators(self, pair: str) -> Dict[str, float]:
         """Compute indicator values from cached bars."""
         try:
-            from src.utils.indicators import (
-                atr as compute_atr,
-                atr_percent,
-                adx as compute_adx,
-                bollinger_bands,
-                ema,
-                rsi as compute_rsi,
-                trend_strength as compute_trend_strength,
-                volume_ratio as compute_volume_ratio,
-            )
+            from src.utils.indicator_cache import IndicatorCache
 
             closes = self.market_data.get_closes(pair)
             if closes is None or len(closes) < 30:
@@ -105,15 +96,17 @@ class MarketDataIndexer:
             lows = self.market_data.get_lows(pair)
             volumes = self.market_data.get_volumes(pair)
 
-            rsi_vals = compute_rsi(closes, 14)
-            ema_f = ema(closes, 20)
-            ema_s = ema(closes, 50)
-            atr_vals = compute_atr(highs, lows, closes, 14)
-            atr_pct_vals = atr_percent(highs, lows, closes, 14)
-            adx_vals = compute_adx(highs, lows, closes, 14)
-            bb_upper, _bb_mid, bb_lower = bollinger_bands(closes, 20, 2.0)
-            vol_ratio = compute_volume_ratio(volumes, 20)
-            ts_vals = compute_trend_strength(closes, 5, 13)
+            # Snapshot cache so ATR is computed once for atr and atr_pct
+            ic = IndicatorCache(closes, highs, lows, volumes)
+            rsi_vals = ic.rsi(14)
+            ema_f = ic.ema(20)
+            ema_s = ic.ema(50)
+            atr_vals = ic.atr(14)
+            atr_pct_vals = atr_vals / np.where(closes > 0, closes, 1.0)
+            adx_vals = ic.adx(14)
+            bb_upper, _bb_mid, bb_lower = ic.bollinger_bands(20, 2.0)
+            vol_ratio = ic.volume_ratio(20)
+            ts_vals = ic.trend_strength(5, 13)
 
             def _last_valid(arr: np.ndarray) -> float:
                 for i in range(len(arr) - 1, -1, -1):
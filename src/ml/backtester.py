@@ -36,6 +36,7 @@ from src.strategies.stochastic_divergence import StochasticDivergenceStrategy
 from src.strategies.supertrend import SupertrendStrategy
 from src.strategies.trend import TrendStrategy
 from src.strategies.volatility_squeeze import VolatilitySqueezeStrategy
+from src.utils.indicator_cache import IndicatorCache
 from src.utils.indicators import atr
 
 logger = get_logger("backtester")
@@ -329,6 +330,12 @@ class Backtester:
             hist_highs = highs[:i + 1]
             hist_lows = lows[:i + 1]
             hist_volumes = volumes[:i + 1]
+            hist_opens = opens[:i + 1]
+            # One cache per bar, as in the live confluence scan: indicators
+            # shared by several strategies (ATR, EMAs, ...) are computed once.
+            indicator_cache = IndicatorCache(
+                hist_closes, hist_highs, hist_lows, hist_volumes, hist_opens
+            )
 
             # Get signals from all strategies
             long_votes = 0
@@ -340,9 +347,10 @@ class Backtester:
                 if len(hist_closes) < strategy.min_bars_required():
                     continue
 
-                signal = await strategy.analyze(
+                signal = strategy.analyze(
                     pair, hist_closes, hist_highs, hist_lows, hist_volumes,
-                    opens=opens[:i + 1],
+                    opens=hist_opens,
+                    indicator_cache=indicator_cache,
                 )
 
                 if signal.is_actionable:
@@ -2,7 +2,8 @@
 ContinuousLearner - online, incremental model that improves as trades close.
 
 Design goals:
-- Never block trading (best-effort; bounded work; async lock).
+- Never block trading (best-effort; bounded work; async lock; disk I/O runs
+  in a worker thread).
 - Persist to disk so it keeps improving across restarts.
 - Fail-safe: if anything breaks, return None and the system falls back to
   TFLite/heuristics.
@@ -13,11 +14,15 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import hmac
+import io
+import math
+import operator
 import os
+import pickle
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields, replace
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -26,12 +31,29 @@ from src.core.logger import get_logger
 
 logger = get_logger("continuous_learner")
 
+# Resolved once at import time rather than on every load/save.
+try:
+    import joblib
+except ImportError:
+    joblib = None
+
+# lz4 compresses at near-memcpy speed; fall back to light zlib when it is not
+# installed. joblib.load detects the codec itself, so either format loads.
+try:
+    import lz4  # noqa: F401
+
+    _JOBLIB_COMPRESS: Any = ("lz4", 1)
+except ImportError:
+    _JOBLIB_COMPRESS = 3
+
 
 @dataclass
 class ContinuousStats:
     seen: int = 0
     updates: int = 0
     last_saved_ts: float = 0.0
+    # Wall-clock time of the latest update, refreshed at checkpoint boundaries
+    # rather than per update (keeps clock reads off the hot path).
     last_update_ts: float = 0.0
 
 
@@ -43,9 +65,14 @@ class ContinuousLearner:
     - This is not RL and does not directly optimize portfolio objectives.
     - It is a lightweight online learner intended to steadily improve the
       probability gate as labeled examples accumulate.
+    - Implemented directly in NumPy: a running mean/variance standardizer
+      feeding an L2-regularized logistic regression trained with the same
+      "optimal" learning-rate schedule as sklearn's SGDClassifier, without
+      sklearn's per-call validation overhead.
     """
 
     _SCALER_WARMUP_SAMPLES: int = 200
+    _ALPHA: float = 0.0005
 
     def __init__(
         self,
@@ -57,15 +84,49 @@ class ContinuousLearner:
         self.model_path = Path(model_path)
         self.model_path.parent.mkdir(parents=True, exist_ok=True)
         self.feature_names = [str(n) for n in (feature_names or TradePredictorFeatures.FEATURE_NAMES)]
+        self._n_features = len(self.feature_names)
+        self._getter = operator.itemgetter(*self.feature_names)
+        self._defaults = dict.fromkeys(self.feature_names, 0.0)
+        self._x_buf = np.zeros((1, self._n_features), dtype=np.float32)
+        self._px_buf = np.zeros((1, self._n_features), dtype=np.float32)
         self.save_every_updates = max(1, int(save_every_updates))
         self.min_updates_before_predict = max(1, int(min_updates_before_predict))
 
         self._lock = asyncio.Lock()
-        self._scaler = None
-        self._model = None
+        self._save_lock = asyncio.Lock()
+        # Standardizer state (population mean/variance over the warmup window)
+        self._n = 0
+        self._mean = np.zeros(self._n_features, dtype=np.float64)
+        self._var = np.zeros(self._n_features, dtype=np.float64)
+        self._scale = np.ones(self._n_features, dtype=np.float64)
+        self._z_buf = np.empty(self._n_features, dtype=np.float64)
+        # Logistic regression state
+        self._w = np.zeros(self._n_features, dtype=np.float64)
+        self._b = 0.0
+        self._t = 0
+        # sklearn's "optimal" schedule: eta = 1 / (alpha * (t0 + t)), with t0
+        # from the same typical-weight heuristic (log-loss dloss caps at 1).
+        typw = math.sqrt(1.0 / math.sqrt(self._ALPHA))
+        self._t0 = 1.0 / (typw * self._ALPHA)
+        # Double-buffered (mean, scale, w, b) read by predict_proba without the
+        # lock: update() fills the back buffer, then swaps the published tuple
+        # (a single attribute assignment).
+        self._snap_bufs = [
+            tuple(np.zeros(self._n_features, dtype=np.float64) for _ in range(3)) for _ in range(2)
+        ]
+        self._snap_idx = 0
+        self._predict_snapshot: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, float]] = None
         self.stats = ContinuousStats()
+        self._dirty = False
 
         self._load_best_effort()
+        # Specialize the update path once instead of re-checking the warmup
+        # window on every call; _step_warmup swaps itself out when it closes.
+        self._step = (
+            self._step_steady
+            if self.stats.seen >= self._SCALER_WARMUP_SAMPLES
+            else self._step_warmup
+        )
 
     # Integrity check: HMAC of the serialized model file to detect tampering.
     _HMAC_SUFFIX = ".hmac"
@@ -74,11 +135,14 @@ class ContinuousLearner:
         return self.model_path.with_suffix(self.model_path.suffix + self._HMAC_SUFFIX)
 
     @staticmethod
-    def _compute_file_hmac(path: Path) -> str:
-        """Compute HMAC-SHA256 of a file using a machine-local key."""
+    def _hmac_key() -> bytes:
         # Use hostname + username as key so the model is bound to this machine.
-        key = (os.uname().nodename + os.getenv("USER", "bot")).encode()
-        h = hmac.new(key, digestmod=hashlib.sha256)
+        return (os.uname().nodename + os.getenv("USER", "bot")).encode()
+
+    @classmethod
+    def _compute_file_hmac(cls, path: Path) -> str:
+        """Compute HMAC-SHA256 of a file using a machine-local key."""
+        h = hmac.new(cls._hmac_key(), digestmod=hashlib.sha256)
         with open(path, "rb") as f:
             while chunk := f.read(65536):
                 h.update(chunk)
@@ -100,20 +164,29 @@ class ContinuousLearner:
                     )
                     return
 
-            import joblib
+            if joblib is None:
+                logger.warning("joblib not installed, continuous model not loaded")
+                return
 
             payload = joblib.load(self.model_path)
-            self._scaler = payload.get("scaler")
-            self._model = payload.get("model")
+            if "scaler" in payload or "model" in payload:
+                state = self._state_from_sklearn(payload.get("scaler"), payload.get("model"))
+            else:
+                state = payload.get("state")
+            if not self._restore_state(state):
+                logger.warning(
+                    "Continuous model state incompatible with current features — starting fresh",
+                    path=str(self.model_path),
+                )
+                return
             self.stats = payload.get("stats") or self.stats
             if not isinstance(self.stats, ContinuousStats):
                 try:
-                    from dataclasses import asdict, fields as dc_fields
                     if hasattr(self.stats, '__dataclass_fields__'):
                         raw = asdict(self.stats)
                     else:
                         raw = dict(self.stats)
-                    valid_keys = {f.name for f in dc_fields(ContinuousStats)}
+                    valid_keys = {f.name for f in fields(ContinuousStats)}
                     self.stats = ContinuousStats(**{k: v for k, v in raw.items() if k in valid_keys})
                 except Exception:
                     self.stats = ContinuousStats()
@@ -121,96 +194,246 @@ class ContinuousLearner:
         except Exception as e:
             logger.warning("Continuous model load failed (non-fatal)", error=repr(e))
 
-    def _vectorize(self, features: Dict[str, Any]) -> np.ndarray:
-        x = np.zeros((1, len(self.feature_names)), dtype=np.float32)
+    @staticmethod
+    def _state_from_sklearn(scaler: Any, model: Any) -> Optional[Dict[str, Any]]:
+        """Convert a legacy StandardScaler + SGDClassifier checkpoint."""
+        if scaler is None or model is None:
+            return None
+        return {
+            "n": int(np.max(scaler.n_samples_seen_)),
+            "mean": scaler.mean_,
+            "var": scaler.var_,
+            "w": model.coef_[0],
+            "b": float(model.intercept_[0]),
+            # sklearn's t_ starts at 1 and counts samples seen
+            "t": max(0, int(model.t_) - 1),
+        }
+
+    def _restore_state(self, state: Optional[Dict[str, Any]]) -> bool:
+        if not state:
+            return False
+        mean = np.asarray(state["mean"], dtype=np.float64).ravel()
+        var = np.asarray(state["var"], dtype=np.float64).ravel()
+        w = np.asarray(state["w"], dtype=np.float64).ravel()
+        if not (mean.size == var.size == w.size == self._n_features):
+            return False
+        self._n = int(state["n"])
+        self._mean, self._var, self._w = mean.copy(), var.copy(), w.copy()
+        self._b = float(state["b"])
+        self._t = int(state["t"])
+        self._refresh_scale()
+        self._publish_snapshot()
+        return True
+
+    def _publish_snapshot(self) -> None:
+        """Copy the weights into the back buffer and swap it in for predict_proba."""
+        self._snap_idx ^= 1
+        mean, scale, w = self._snap_bufs[self._snap_idx]
+        np.copyto(mean, self._mean)
+        np.copyto(scale, self._scale)
+        np.copyto(w, self._w)
+        self._predict_snapshot = (mean, scale, w, self._b)
+
+    def _refresh_scale(self) -> None:
+        """Recompute the std divisor; only changes while the scaler is warming up."""
+        np.sqrt(self._var, out=self._scale)
+        # Constant features pass through centered but unscaled (sklearn semantics)
+        self._scale[self._scale < 10 * np.finfo(np.float64).eps] = 1.0
+
+    def _standardize(self, x: np.ndarray) -> np.ndarray:
+        """Standardize ``x`` into the shared float64 scratch row. Caller must hold ``self._lock``."""
+        z = self._z_buf
+        np.subtract(x, self._mean, out=z)
+        np.divide(z, self._scale, out=z)
+        return z
+
+    def _logit(self, z: np.ndarray) -> float:
+        return float(np.dot(self._w, z)) + self._b
+
+    @staticmethod
+    def _sigmoid(v: float) -> float:
+        return 1.0 / (1.0 + math.exp(-max(-35.0, min(35.0, v))))
+
+    def _vectorize(self, features: Dict[str, Any], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Fill and return ``out`` (default: the update scratch row).
+
+        The returned array is overwritten by the next call with the same
+        buffer; consume it before yielding to the event loop.
+        """
+        x = self._x_buf if out is None else out
+        try:
+            # One C-level gather over the ordered feature names; missing keys
+            # fall back to the 0.0 defaults.
+            x[0, :] = self._getter({**self._defaults, **features})
+        except (TypeError, ValueError):
+            self._vectorize_slow(features, x)
+        np.nan_to_num(x, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        return x
+
+    def _vectorize_slow(self, features: Dict[str, Any], out: np.ndarray) -> None:
+        """Per-feature coercion for payloads containing non-numeric values."""
+        out.fill(0.0)
         for i, name in enumerate(self.feature_names):
-            v = features.get(name, 0.0)
             try:
-                fv = float(v)
-                if not np.isfinite(fv):
-                    fv = 0.0
+                out[0, i] = float(features.get(name, 0.0))
             except Exception:
-                fv = 0.0
-            x[0, i] = fv
-        return x
+                pass
 
     async def predict_proba(self, features: Dict[str, Any]) -> Optional[float]:
-        async with self._lock:
-            if self._model is None or self._scaler is None:
-                return None
-            if self.stats.updates < self.min_updates_before_predict:
-                return None
-            try:
-                x = self._vectorize(features)
-                xs = self._scaler.transform(x)
-                # predict_proba returns [P(class0), P(class1)]
-                p = float(self._model.predict_proba(xs)[0, 1])
-                if not np.isfinite(p):
-                    return None
-                return max(0.0, min(1.0, p))
-            except Exception:
+        # Lock-free: read the published snapshot once; update() never mutates it.
+        snap = self._predict_snapshot
+        if snap is None or self.stats.updates < self.min_updates_before_predict:
+            return None
+        try:
+            mean, scale, w, b = snap
+            x = self._vectorize(features, out=self._px_buf)[0]
+            p = self._sigmoid(float(np.dot(w, (x - mean) / scale)) + b)
+            if not np.isfinite(p):
                 return None
+            return max(0.0, min(1.0, p))
+        except Exception:
+            return None
+
+    def _step_warmup(self, x: np.ndarray, y: float) -> None:
+        """Fit the scaler on ``x``, then take an SGD step."""
+        # Welford running mean / population variance
+        self._n += 1
+        delta = x - self._mean
+        self._mean += delta / self._n
+        self._var += (delta * (x - self._mean) - self._var) / self._n
+        self._refresh_scale()
+        self._step_steady(x, y)
+        # Freeze scaler after warmup to avoid distribution drift: `seen` is
+        # pre-increment here, so the 200th sample is the last fitted.
+        if self.stats.seen + 1 >= self._SCALER_WARMUP_SAMPLES:
+            self._step = self._step_steady
+
+    def _step_steady(self, x: np.ndarray, y: float) -> None:
+        """One SGD step on log-loss with L2 penalty against the frozen scaler.
+
+        Same ordering as sklearn: gradient at current weights, decay, then
+        step. z is scratch, so the step is scaled in place (no temporaries).
+        """
+        z = self._standardize(x)
+        g = self._sigmoid(self._logit(z)) - y
+        self._t += 1
+        eta = 1.0 / (self._ALPHA * (self._t0 + self._t - 1))
+        self._w *= max(0.0, 1.0 - eta * self._ALPHA)
+        z *= eta * g
+        self._w -= z
+        self._b -= eta * g
 
     async def update(self, features: Dict[str, Any], label: float) -> None:
-        y = 1 if float(label) > 0 else 0
+        """Fold one labeled example into the model.
+
+        ``self._lock`` covers only the in-memory state mutation; checkpoint
+        I/O runs after it is released. predict_proba never takes the lock and
+        reads the snapshot published here instead.
+        """
+        y = 1.0 if float(label) > 0 else 0.0
+        payload: Optional[Dict[str, Any]] = None
         async with self._lock:
             try:
-                from sklearn.linear_model import SGDClassifier
-                from sklearn.preprocessing import StandardScaler
-
-                if self._scaler is None:
-                    self._scaler = StandardScaler(with_mean=True, with_std=True)
-                if self._model is None:
-                    self._model = SGDClassifier(
-                        loss="log_loss",
-                        alpha=0.0005,
-                        penalty="l2",
-                        learning_rate="optimal",
-                        random_state=42,
-                    )
-
-                x = self._vectorize(features)
-                # Freeze scaler after warmup to avoid distribution drift.
-                # Use `seen` (pre-increment) so the 200th sample is the last fitted.
-                if self.stats.seen < self._SCALER_WARMUP_SAMPLES:
-                    self._scaler.partial_fit(x)
-                xs = self._scaler.transform(x)
-
-                # partial_fit needs classes on first call
-                if self.stats.updates == 0:
-                    self._model.partial_fit(xs, np.array([y], dtype=np.int64), classes=np.array([0, 1], dtype=np.int64))
-                else:
-                    self._model.partial_fit(xs, np.array([y], dtype=np.int64))
+                self._step(self._vectorize(features)[0], y)
+                self._publish_snapshot()
 
                 self.stats.seen += 1
                 self.stats.updates += 1
-                self.stats.last_update_ts = time.time()
+                self._dirty = True
 
                 if (self.stats.updates % self.save_every_updates) == 0:
-                    self._save_locked()
+                    payload = self._snapshot_locked()
             except Exception as e:
                 logger.debug("Continuous update failed (non-fatal)", error=repr(e))
 
-    def _save_locked(self) -> None:
-        try:
-            import joblib
+        # Serialize outside the lock and off the event loop so a slow disk
+        # never stalls trading decisions waiting on predict_proba().
+        if payload is not None:
+            await self._save_async(payload)
+
+    def _snapshot_locked(self) -> Dict[str, Any]:
+        """Capture the persistable state. Caller must hold ``self._lock``."""
+        if self._dirty:
+            self.stats.last_update_ts = time.time()
+            self._dirty = False
+        # Copy: the arrays are tiny, and the worker thread must not pickle
+        # buffers a concurrent update() is mutating.
+        return {
+            "state": {
+                "n": self._n,
+                "mean": self._mean.copy(),
+                "var": self._var.copy(),
+                "w": self._w.copy(),
+                "b": self._b,
+                "t": self._t,
+            },
+            "stats": replace(self.stats),
+        }
+
+    async def _save_async(self, payload: Dict[str, Any], durable: bool = False) -> None:
+        loop = asyncio.get_running_loop()
+        # Serialize writers: both share the same .tmp path.
+        async with self._save_lock:
+            saved_ts = await loop.run_in_executor(
+                None, self._save_payload, payload, self.model_path, durable
+            )
+        if saved_ts is not None:
+            self.stats.last_saved_ts = saved_ts
 
-            tmp = self.model_path.with_suffix(self.model_path.suffix + ".tmp")
-            payload = {"scaler": self._scaler, "model": self._model, "stats": self.stats}
-            joblib.dump(payload, tmp)
-            os.replace(tmp, self.model_path)
+    @staticmethod
+    def _fsync_dir(path: Path) -> None:
+        """Flush directory metadata so a completed rename survives power loss."""
+        try:
+            dir_fd = os.open(path.parent, os.O_RDONLY)
+        except OSError:
+            return  # Platform without directory fds (e.g. Windows)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    @classmethod
+    def _save_payload(cls, payload: Dict[str, Any], path: Path, durable: bool = False) -> Optional[float]:
+        """Write ``payload`` to ``path`` atomically. Returns the save timestamp, or None on failure.
+
+        Periodic checkpoints skip fsync: losing the last few updates on a crash
+        is acceptable. ``durable=True`` (force_save / shutdown) fsyncs the data
+        and the directory entry.
+
+        Runs in a worker thread: must not touch learner state.
+        """
+        if joblib is None:
+            logger.warning("joblib not installed, continuous model not saved")
+            return None
+        try:
+            # Serialize into memory so the HMAC is computed over the bytes we
+            # already hold instead of re-reading the file from disk.
+            buf = io.BytesIO()
+            joblib.dump(payload, buf, compress=_JOBLIB_COMPRESS, protocol=pickle.HIGHEST_PROTOCOL)
+            data = buf.getbuffer()
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            with open(tmp, "wb") as f:
+                f.write(data)
+                if durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp, path)
             # Write HMAC for integrity verification on next load
             try:
-                file_hmac = self._compute_file_hmac(self.model_path)
-                self._hmac_path().write_text(file_hmac)
+                file_hmac = hmac.new(cls._hmac_key(), data, hashlib.sha256).hexdigest()
+                path.with_suffix(path.suffix + cls._HMAC_SUFFIX).write_text(file_hmac)
             except Exception:
                 pass  # Non-fatal: model still saved even if HMAC write fails
-            self.stats.last_saved_ts = time.time()
-            logger.info("Continuous model saved", path=str(self.model_path), updates=self.stats.updates)
+            if durable:
+                cls._fsync_dir(path)
+            logger.info("Continuous model saved", path=str(path), updates=payload["stats"].updates)
+            return time.time()
         except Exception as e:
             logger.warning("Continuous model save failed (non-fatal)", error=repr(e))
+            return None
 
     async def force_save(self) -> None:
+        """Durable checkpoint (fsynced); use on shutdown."""
         async with self._lock:
-            self._save_locked()
-
+            payload = self._snapshot_locked()
+        await self._save_async(payload, durable=True)
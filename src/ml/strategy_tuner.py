@@ -11,9 +11,11 @@ audit trails.
 from __future__ import annotations
 
 import asyncio
-import math
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
 
 from src.core.config import ConfigManager, save_to_yaml
 from src.core.database import DatabaseManager
@@ -53,33 +55,34 @@ class StrategyTuner:
         if not trades:
             return {"changes": [], "reason": "no closed trades"}
 
-        # Group by strategy
-        by_strat: Dict[str, List[Dict[str, Any]]] = {}
-        for t in trades:
-            strat = t.get("strategy")
-            if strat:
-                by_strat.setdefault(strat, []).append(t)
+        df = pd.DataFrame(trades, columns=["strategy", "pnl"])
+        df["pnl"] = pd.to_numeric(df["pnl"], errors="coerce")
+        df = df.dropna(subset=["pnl"])
+        baseline_sharpe = self._sharpe(df["pnl"].to_numpy())
+
+        # Aggregate per strategy in one pass (sort=False keeps first-seen order)
+        df = df[df["strategy"].notna() & (df["strategy"] != "")]
+        by_strat = (
+            df.assign(win=df["pnl"] > 0)
+            .groupby("strategy", sort=False)
+            .agg(n=("pnl", "size"), mean=("pnl", "mean"), std=("pnl", "std"), wins=("win", "sum"))
+        )
 
         # Load current config to read weights/enabled flags
         cfg = ConfigManager()
         strategies_cfg = cfg.config.strategies.model_dump()
 
-        overall_pnls = [float(t.get("pnl", 0)) for t in trades if t.get("pnl") is not None]
-        baseline_sharpe = self._sharpe(overall_pnls) if len(overall_pnls) >= 5 else 0.0
-
         changes: List[Dict[str, Any]] = []
         yaml_updates: Dict[str, Dict[str, Any]] = {"strategies": {}}
 
-        for strat_name, strat_trades in by_strat.items():
-            pnls = [float(t.get("pnl", 0)) for t in strat_trades if t.get("pnl") is not None]
-            n = len(pnls)
+        for row in by_strat.itertuples():
+            strat_name = str(row.Index)
+            n = int(row.n)
             if n < self.min_trades:
                 continue
 
-            wins = sum(1 for p in pnls if p > 0)
-            win_rate = wins / n if n > 0 else 0.0
-            avg_pnl = sum(pnls) / n if n > 0 else 0.0
-            sharpe = self._sharpe(pnls)
+            win_rate = int(row.wins) / n if n > 0 else 0.0
+            sharpe = self._sharpe_from_moments(n, row.mean, row.std)
 
             strat_cfg = strategies_cfg.get(strat_name, {})
             current_weight = float(strat_cfg.get("weight", 0.20))
@@ -137,42 +140,25 @@ class StrategyTuner:
                     "trades": n,
                 })
 
-        # Persist to YAML and hot-reload
+        # Persist only the changed strategy keys and hot-reload
         if yaml_updates["strategies"]:
-            # Flatten nested structure for save_to_yaml
-            flat_updates: Dict[str, Dict[str, Any]] = {}
-            for section, kvs in yaml_updates.items():
-                if section == "strategies":
-                    for sname, skvs in kvs.items():
-                        flat_key = f"strategies"
-                        if flat_key not in flat_updates:
-                            flat_updates[flat_key] = {}
-                        # save_to_yaml expects {"strategies": {"keltner": {...}}}
-                        flat_updates[flat_key][sname] = skvs
-
-            save_to_yaml(flat_updates, self.config_path)
+            save_to_yaml(yaml_updates, self.config_path)
             cfg.reload(self.config_path)
             logger.info("Strategy tuner persisted changes", changes=len(changes))
 
-        # Log all changes to thought_log
+        # Log the outcome to thought_log
         if changes:
-            summary = "; ".join(
-                f"{c['strategy']}: {c['action']}" for c in changes
-            )
-            await self.db.log_thought(
-                "tuner",
-                f"Strategy Tuner made {len(changes)} change(s): {summary}",
-                severity="info",
-                metadata={"changes": changes},
-                tenant_id=self.tenant_id,
-            )
+            summary = "; ".join(f"{c['strategy']}: {c['action']}" for c in changes)
+            message = f"Strategy Tuner made {len(changes)} change(s): {summary}"
         else:
-            await self.db.log_thought(
-                "tuner",
-                "Strategy Tuner: no changes needed",
-                severity="debug",
-                tenant_id=self.tenant_id,
-            )
+            message = "Strategy Tuner: no changes needed"
+        await self.db.log_thought(
+            "tuner",
+            message,
+            severity="info" if changes else "debug",
+            metadata={"changes": changes} if changes else None,
+            tenant_id=self.tenant_id,
+        )
 
         return {"changes": changes, "baseline_sharpe": round(baseline_sharpe, 3)}
 
@@ -180,17 +166,20 @@ class StrategyTuner:
     # Helpers
     # ------------------------------------------------------------------
 
-    @staticmethod
-    def _sharpe(pnls: List[float]) -> float:
+    @classmethod
+    def _sharpe(cls, pnls: Union[List[float], np.ndarray]) -> float:
         """Simple Sharpe-like ratio: mean / std. Returns 0 if insufficient data."""
-        if len(pnls) < 5:
+        arr = np.asarray(pnls, dtype=np.float64)
+        if arr.size < 5:
             return 0.0
-        mean = sum(pnls) / len(pnls)
-        variance = sum((x - mean) ** 2 for x in pnls) / max(len(pnls) - 1, 1)
-        std = math.sqrt(variance) if variance > 0 else 0.0
-        if std < 1e-12:
+        return cls._sharpe_from_moments(arr.size, arr.mean(), arr.std(ddof=1))
+
+    @staticmethod
+    def _sharpe_from_moments(n: int, mean: float, std: float) -> float:
+        """Sharpe-like ratio from a precomputed mean and sample std."""
+        if n < 5 or not np.isfinite(std) or std < 1e-12:
             return 0.0
-        return mean / std
+        return float(mean) / float(std)
 
 
 class AutoTuner:
@@ -202,29 +191,35 @@ class AutoTuner:
         self._last_tune_time: float = 0.0
 
     async def run(self) -> None:
-        """Hourly check loop — triggers tuning when interval elapses."""
+        """Sleep until the next scheduled tune instead of polling hourly."""
         logger.info("Auto-tuner started", interval_hours=self.interval_hours)
+        loop = asyncio.get_running_loop()
+        interval_s = self.interval_hours * 3600
         # Don't tune immediately on startup — wait one cycle
         self._last_tune_time = time.time()
+        next_fire = loop.time() + interval_s
 
         while True:
             try:
-                await asyncio.sleep(3600)  # Check every hour
-
-                elapsed_hours = (time.time() - self._last_tune_time) / 3600
-                if elapsed_hours >= self.interval_hours:
-                    logger.info("Auto-tuner triggering scheduled tune")
-                    result = await self.tuner.tune()
-                    self._last_tune_time = time.time()
-                    n_changes = len(result.get("changes", []))
-                    logger.info(
-                        "Auto-tune complete",
-                        changes=n_changes,
-                        baseline_sharpe=result.get("baseline_sharpe"),
-                    )
+                await asyncio.sleep(max(0.0, next_fire - loop.time()))
+
+                logger.info("Auto-tuner triggering scheduled tune")
+                result = await self.tuner.tune()
+                self._last_tune_time = time.time()
+                next_fire += interval_s
+                if next_fire <= loop.time():
+                    # Fell behind (long tune / suspended host): don't burst-catch-up
+                    next_fire = loop.time() + interval_s
+                n_changes = len(result.get("changes", []))
+                logger.info(
+                    "Auto-tune complete",
+                    changes=n_changes,
+                    baseline_sharpe=result.get("baseline_sharpe"),
+                )
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error("Auto-tuner error", error=repr(e))
-                await asyncio.sleep(300)
+                # Retry within the hour, as the old hourly poll did
+                next_fire = loop.time() + 3600
@@ -17,10 +17,13 @@ import asyncio
 import concurrent.futures
 import importlib.util
 import json
+import multiprocessing
+import operator
 import os
 import shutil
 import time
 from datetime import datetime, timezone
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -33,6 +36,102 @@ from src.core.logger import get_logger
 logger = get_logger("ml_trainer")
 
 
+def _init_training_worker() -> None:
+    """
+    Pool initializer: import TensorFlow once per worker lifetime.
+
+    Later training runs in the same (kept-alive) worker skip the multi-second
+    import and GPU setup. Must not raise: a failing initializer breaks the
+    pool, whereas a missing TF should surface as ImportError from the task.
+    """
+    try:
+        import tensorflow as tf
+    except ImportError:
+        return
+
+    # Configure GPU memory growth if available (in the worker process)
+    gpus = tf.config.list_physical_devices('GPU')
+    if gpus:
+        try:
+            for gpu in gpus:
+                tf.config.experimental.set_memory_growth(gpu, True)
+        except RuntimeError as e:
+            print(e)
+
+
+ArrayDescriptor = Tuple[str, Tuple[int, ...], str]
+
+
+def _share_arrays(
+    arrays: List[np.ndarray],
+) -> Tuple[List[SharedMemory], List[ArrayDescriptor]]:
+    """
+    Copy arrays into fresh shared-memory blocks.
+
+    Returns the owning segments (caller closes + unlinks) and picklable
+    ``(name, shape, dtype)`` descriptors for the worker side.
+    """
+    segments: List[SharedMemory] = []
+    descriptors: List[ArrayDescriptor] = []
+    try:
+        for arr in arrays:
+            # Zero-byte segments are rejected; empty val splits still need one.
+            shm = SharedMemory(create=True, size=max(arr.nbytes, 1))
+            segments.append(shm)
+            view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+            view[...] = arr
+            del view
+            descriptors.append((shm.name, arr.shape, arr.dtype.str))
+    except Exception:
+        _release_segments(segments, unlink=True)
+        raise
+    return segments, descriptors
+
+
+def _release_segments(segments: List[SharedMemory], unlink: bool = False) -> None:
+    """Close (and optionally unlink) shared-memory segments, best-effort."""
+    for shm in segments:
+        try:
+            shm.close()
+        except BufferError:
+            # A lingering view still pins the mapping; it is freed with the view.
+            pass
+        if unlink:
+            try:
+                shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _run_training_from_shm(
+    descriptors: List[ArrayDescriptor],
+    model_dir: Path,
+    epochs: int,
+    batch_size: int,
+    min_accuracy: float = 0.0,
+) -> Dict[str, Any]:
+    """
+    Worker entry point: attach to the parent's shared-memory arrays and train.
+
+    Only the small descriptors cross the process boundary, so the training
+    matrices are neither pickled nor copied on the way in.
+    """
+    segments = [SharedMemory(name=name) for name, _, _ in descriptors]
+    try:
+        arrays = [
+            np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+            for shm, (_, shape, dtype) in zip(segments, descriptors)
+        ]
+        metrics = _run_training_process(
+            arrays[0], arrays[1], arrays[2], arrays[3],
+            model_dir, epochs, batch_size, min_accuracy,
+        )
+        del arrays
+        return metrics
+    finally:
+        _release_segments(segments)
+
+
 def _run_training_process(
     X_train: np.ndarray,
     y_train: np.ndarray,
@@ -41,42 +140,39 @@ def _run_training_process(
     model_dir: Path,
     epochs: int,
     batch_size: int,
+    min_accuracy: float = 0.0,
 ) -> Dict[str, Any]:
     """
     Standalone function to run training in a separate process.
     Must be top-level for pickle compatibility.
+
+    TFLite conversion is skipped when validation accuracy is below
+    ``min_accuracy``: the model will not be deployed anyway.
     """
-    import tensorflow as tf
-    
-    # Configure GPU memory growth if available (in the worker process)
-    gpus = tf.config.list_physical_devices('GPU')
-    if gpus:
-        try:
-            for gpu in gpus:
-                tf.config.experimental.set_memory_growth(gpu, True)
-        except RuntimeError as e:
-            print(e)
+    import tensorflow as tf  # Already warm via _init_training_worker
 
     # Data is already split + normalized in the parent process to avoid leakage.
 
-    # Build model
+    # Build model. Inputs are already standardized, so BatchNormalization's
+    # running batch statistics bought little on this small tabular MLP while
+    # costing per-step overhead (and train/inference drift on small batches);
+    # LayerNormalization is per-sample and batch-size independent.
     model = tf.keras.Sequential([
         tf.keras.layers.Input(shape=(X_train.shape[1],)),
         tf.keras.layers.Dense(64, activation='relu'),
-        tf.keras.layers.BatchNormalization(),
+        tf.keras.layers.LayerNormalization(),
         tf.keras.layers.Dropout(0.3),
         tf.keras.layers.Dense(32, activation='relu'),
-        tf.keras.layers.BatchNormalization(),
+        tf.keras.layers.LayerNormalization(),
         tf.keras.layers.Dropout(0.2),
         tf.keras.layers.Dense(16, activation='relu'),
         tf.keras.layers.Dense(1, activation='sigmoid'),
     ])
 
-    # Compile with class weights
-    # Ensure binary labels for class weight calculation
-    y_train = (y_train > 0.5).astype(np.float32)
-    pos_weight = len(y_train) / (2 * max(np.sum(y_train), 1))
-    neg_weight = len(y_train) / (2 * max(np.sum(1 - y_train), 1))
+    # Compile with class weights (labels arrive binarized from _prepare_data)
+    pos_total = float(y_train.sum())
+    pos_weight = len(y_train) / (2 * max(pos_total, 1))
+    neg_weight = len(y_train) / (2 * max(len(y_train) - pos_total, 1))
     class_weights = {0: neg_weight, 1: pos_weight}
 
     model.compile(
@@ -99,43 +195,42 @@ def _run_training_process(
         min_lr=1e-6,
     )
 
+    # Input pipelines: batching/shuffling run in tf.data and prefetch overlaps
+    # the next batch with the current step instead of slicing numpy per batch.
+    autotune = tf.data.AUTOTUNE
+    train_ds = (
+        tf.data.Dataset.from_tensor_slices((X_train, y_train))
+        .shuffle(len(X_train), seed=1337)
+        .batch(batch_size)
+        .prefetch(autotune)
+    )
+    # Extremely small datasets can end up with an empty validation set; train without val.
+    val_ds = (
+        tf.data.Dataset.from_tensor_slices((X_val, y_val)).batch(batch_size).prefetch(autotune)
+        if len(X_val) > 0
+        else None
+    )
+
     # Train
-    fit_kwargs = dict(
+    history = model.fit(
+        train_ds,
+        validation_data=val_ds,
         epochs=epochs,
-        batch_size=batch_size,
         class_weight=class_weights,
         callbacks=[early_stop, lr_schedule],
         verbose=0,
     )
-    if len(X_val) > 0:
-        history = model.fit(
-            X_train, y_train,
-            validation_data=(X_val, y_val),
-            **fit_kwargs,
-        )
-    else:
-        # Extremely small datasets can end up with an empty validation set; train without val.
-        history = model.fit(X_train, y_train, **fit_kwargs)
 
     # Evaluate
-    if len(X_val) > 0:
-        val_loss, val_accuracy, val_auc = model.evaluate(X_val, y_val, verbose=0)
-    else:
-        val_loss, val_accuracy, val_auc = model.evaluate(X_train, y_train, verbose=0)
+    val_loss, val_accuracy, val_auc = model.evaluate(
+        val_ds if val_ds is not None else train_ds, verbose=0
+    )
 
     # Save Keras model
     keras_path = str(model_dir / "trade_predictor.keras")
     model.save(keras_path)
 
-    # Convert to TFLite
-    converter = tf.lite.TFLiteConverter.from_keras_model(model)
-    converter.optimizations = [tf.lite.Optimize.DEFAULT]
-    tflite_model = converter.convert()
-
-    tflite_path = model_dir / "trade_predictor_new.tflite"
-    tflite_path.write_bytes(tflite_model)
-
-    return {
+    metrics = {
         "val_loss": float(val_loss),
         "val_accuracy": float(val_accuracy),
         "val_auc": float(val_auc),
@@ -143,8 +238,48 @@ def _run_training_process(
         "train_samples": len(X_train),
         "val_samples": len(X_val),
         "features": X_train.shape[1],
-        "model_size_kb": len(tflite_model) / 1024,
     }
+    if float(val_accuracy) < min_accuracy:
+        # Below the deploy gate: skip the (multi-second) TFLite conversions.
+        metrics.update(model_size_kb=0.0, fp16_model_size_kb=0.0, converted=False)
+        return metrics
+
+    # Convert to int8 TFLite (weights and activations), calibrated on up to
+    # 100 training rows. Ops without an int8 kernel fall back to float
+    # builtins, and the model keeps float32 input/output so live features go
+    # in as-is (the predictor still (de)quantizes if a model has int8 I/O).
+    def _representative_dataset():
+        for i in range(min(100, len(X_train))):
+            yield [X_train[i:i + 1].astype(np.float32)]
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = _representative_dataset
+    converter.experimental_new_quantizer = True
+    converter.target_spec.supported_ops = [
+        tf.lite.OpsSet.TFLITE_BUILTINS_INT8,
+        tf.lite.OpsSet.TFLITE_BUILTINS,
+    ]
+    tflite_model = converter.convert()
+
+    tflite_path = model_dir / "trade_predictor_new.tflite"
+    tflite_path.write_bytes(tflite_model)
+
+    # float16 variant: half the weight bytes of float32 but, unlike int8,
+    # still runs under the GPU delegate. The deploy step picks one.
+    fp16_converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    fp16_converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    fp16_converter.target_spec.supported_types = [tf.float16]
+    fp16_model = fp16_converter.convert()
+    (model_dir / "trade_predictor_new_fp16.tflite").write_bytes(fp16_model)
+
+    metrics.update(
+        model_size_kb=len(tflite_model) / 1024,
+        fp16_model_size_kb=len(fp16_model) / 1024,
+        quantization="int8",
+        converted=True,
+    )
+    return metrics
 
 
 class ModelTrainer:
@@ -162,6 +297,7 @@ class ModelTrainer:
         validation_split: float = 0.2,
         min_accuracy: float = 0.52,
         feature_names: Optional[List[str]] = None,
+        tflite_precision: str = "int8",
         tenant_id: Optional[str] = "default",
     ):
         self.db = db
@@ -172,11 +308,15 @@ class ModelTrainer:
         self.batch_size = batch_size
         self.validation_split = validation_split
         self.min_accuracy = min_accuracy
+        self.tflite_precision = "fp16" if str(tflite_precision).lower() == "fp16" else "int8"
         self.feature_names = (
             [str(n) for n in feature_names]
             if feature_names
             else list(TradePredictorFeatures.FEATURE_NAMES)
         )
+        # Row extractor: one C-level call returns every feature in model order.
+        self._feature_getter = operator.itemgetter(*self.feature_names)
+        self._zero_features = dict.fromkeys(self.feature_names, 0)
         self._training_history: List[Dict[str, Any]] = []
         self._executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
         self.tenant_id = tenant_id or "default"
@@ -228,9 +368,21 @@ class ModelTrainer:
         return data
 
     def _get_executor(self) -> concurrent.futures.ProcessPoolExecutor:
-        """Lazy-init executor so it can be shut down cleanly."""
+        """Lazy-init executor so it can be shut down cleanly.
+
+        Uses forkserver where available: workers start from a clean server
+        process instead of fork()ing the live engine (unsafe once CUDA or
+        threads are initialized), and the kept-alive worker imports
+        TensorFlow only once.
+        """
         if self._executor is None:
-            self._executor = concurrent.futures.ProcessPoolExecutor(max_workers=1)
+            methods = multiprocessing.get_all_start_methods()
+            ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=ctx,
+                initializer=_init_training_worker,
+            )
         return self._executor
 
     def close(self) -> None:
@@ -278,36 +430,62 @@ class ModelTrainer:
 
         # Step 2: Prepare data
         X_train, y_train, X_val, y_val = self._prepare_data(training_data)
-        if X_train is None:
+        if X_train is None or y_train is None or X_val is None or y_val is None:
             result["message"] = "Data preparation failed"
             return result
 
         total_samples = int(len(X_train) + len(X_val))
-        y_all = y_train if len(y_val) == 0 else np.concatenate([y_train, y_val], axis=0)
         logger.info(
             "Training data prepared",
             samples=total_samples,
             train_samples=len(X_train),
             val_samples=len(X_val),
             features=X_train.shape[1],
-            positive_ratio=float(np.mean(y_all)) if len(y_all) else 0.0,
+            positive_ratio=(
+                (float(y_train.sum()) + float(y_val.sum())) / total_samples
+                if total_samples else 0.0
+            ),
         )
 
         # Step 3: Train model (in separate process)
         try:
             loop = asyncio.get_running_loop()
-            metrics = await loop.run_in_executor(
-                self._get_executor(),
-                _run_training_process,
-                X_train,
-                y_train,
-                X_val,
-                y_val,
-                self.model_dir,
-                self.epochs,
-                self.batch_size,
-            )
-            
+            arrays = [X_train, y_train, X_val, y_val]
+            try:
+                # Hand the arrays over via shared memory instead of pickling them.
+                segments, descriptors = _share_arrays(arrays)
+            except OSError as e:
+                # e.g. a container's small /dev/shm: send the arrays inline.
+                logger.warning(
+                    "Shared memory unavailable; pickling training arrays",
+                    error=repr(e),
+                )
+                metrics = await loop.run_in_executor(
+                    self._get_executor(),
+                    _run_training_process,
+                    X_train,
+                    y_train,
+                    X_val,
+                    y_val,
+                    self.model_dir,
+                    self.epochs,
+                    self.batch_size,
+                    self.min_accuracy,
+                )
+            else:
+                try:
+                    metrics = await loop.run_in_executor(
+                        self._get_executor(),
+                        _run_training_from_shm,
+                        descriptors,
+                        self.model_dir,
+                        self.epochs,
+                        self.batch_size,
+                        self.min_accuracy,
+                    )
+                finally:
+                    _release_segments(segments, unlink=True)
+
             result["metrics"] = metrics
 
             # Step 4: Check if model meets threshold
@@ -316,6 +494,7 @@ class ModelTrainer:
                 # Step 5: Deploy model
                 deployed = await self._deploy_model()
                 result["deployed"] = deployed
+                metrics["deployed_precision"] = self.tflite_precision
                 result["success"] = True
                 result["message"] = (
                     f"Model trained and deployed. "
@@ -363,30 +542,42 @@ class ModelTrainer:
     ]:
         """Prepare split + normalized features and labels for training."""
         try:
-            features_list = []
-            labels = []
-
-            for sample in training_data:
-                features = sample.get("features", {})
-                label = sample.get("label")
-
-                if label is None or not features:
-                    continue
-
-                # Consistent feature ordering (fixed list)
-                feature_vector = [float(features.get(f, 0)) for f in self.feature_names]
-
-                features_list.append(feature_vector)
-                labels.append(float(label))
-
-            if not features_list:
+            valid = [
+                s for s in training_data
+                if s.get("label") is not None and s.get("features")
+            ]
+            if not valid:
                 return None, None, None, None
 
-            X = np.array(features_list, dtype=np.float32)
-            y = np.array(labels, dtype=np.float32)
+            # Consistent feature ordering from the fixed list; rows missing a
+            # feature are re-extracted with zero defaults merged underneath.
+            n = len(valid)
+            getter = self._feature_getter
+            try:
+                rows = [getter(s["features"]) for s in valid]
+            except KeyError:
+                zeros = self._zero_features
+                rows = [getter({**zeros, **s["features"]}) for s in valid]
+            X = np.array(rows, dtype=np.float32).reshape(n, len(self.feature_names))
+            # Binarize while building y so downstream code (class counts, the
+            # worker's class weights) can rely on exact 0.0/1.0 labels.
+            y = np.fromiter((float(s["label"]) > 0.5 for s in valid), dtype=np.float32, count=n)
+
+            # A None (or NaN/inf) feature value becomes a non-finite entry
+            # that would poison its column's mean/std: drop those rows.
+            finite = np.isfinite(X).all(axis=1)
+            if not finite.all():
+                logger.warning(
+                    "Dropping training rows with non-finite features",
+                    dropped=int(n - finite.sum()),
+                    total=n,
+                )
+                X, y = X[finite], y[finite]
+                n = len(X)
+                if not n:
+                    return None, None, None, None
 
             # Split first, then fit normalization on train only (avoid leakage).
-            n = len(X)
             n_val = int(n * float(self.validation_split or 0.0))
             if n >= 10 and n_val < 1:
                 n_val = 1
@@ -394,22 +585,31 @@ class ModelTrainer:
                 n_val = max(0, n - 1)
 
             # Chronological split: train on earlier data, validate on later data.
-            # This prevents look-ahead bias in time-series classification.
-            train_idx = np.arange(n - n_val)
-            val_idx = np.arange(n - n_val, n)
-
-            X_train = X[train_idx]
-            y_train = y[train_idx]
-            X_val = X[val_idx]
-            y_val = y[val_idx]
+            # This prevents look-ahead bias in time-series classification (so no
+            # shuffled/stratified split). Contiguous slices are views into X:
+            # no index arrays, no copies.
+            n_train = n - n_val
+            X_train, X_val = X[:n_train], X[n_train:]
+            y_train, y_val = y[:n_train], y[n_train:]
 
             fit_X = X_train if len(X_train) else X
 
-            mean = np.mean(fit_X, axis=0)
-            std = np.std(fit_X, axis=0)
+            # Accumulate in float64 to avoid float32 drift on large sets. The
+            # variance reuses the mean (np.std would recompute it) and einsum
+            # sums the squares without materialising a squared temporary.
+            mean64 = fit_X.mean(axis=0, dtype=np.float64)
+            centered = fit_X - mean64
+            var = np.einsum("ij,ij->j", centered, centered) / len(fit_X)
+            del centered
+            mean = mean64.astype(np.float32)
+            std = np.sqrt(var).astype(np.float32)
             std[std == 0] = 1.0
-            X_train = (X_train - mean) / std
-            X_val = (X_val - mean) / std
+            # In place: X_train / X_val are views of the freshly built X.
+            np.subtract(X_train, mean, out=X_train)
+            np.divide(X_train, std, out=X_train)
+            if len(X_val):
+                np.subtract(X_val, mean, out=X_val)
+                np.divide(X_val, std, out=X_val)
 
             # Save normalization params for inference
             norm_path = self.model_dir / "normalization.json"
@@ -423,14 +623,14 @@ class ModelTrainer:
             norm_path.write_text(json.dumps(norm_data, indent=2))
 
             # Handle class imbalance
-            pos_count = np.sum(y_train == 1)
-            neg_count = np.sum(y_train == 0)
+            pos_count = int(y_train.sum())
+            neg_count = len(y_train) - pos_count
             if pos_count > 0 and neg_count > 0:
                 ratio = neg_count / pos_count
                 logger.info(
                     "Class balance",
-                    positive=int(pos_count),
-                    negative=int(neg_count),
+                    positive=pos_count,
+                    negative=neg_count,
                     ratio=round(ratio, 2),
                 )
 
@@ -447,16 +647,26 @@ class ModelTrainer:
         # ENHANCEMENT: Added atomic deployment to prevent corruption
         """
         try:
-            new_path = self.model_dir / "trade_predictor_new.tflite"
+            new_name = (
+                "trade_predictor_new_fp16.tflite"
+                if self.tflite_precision == "fp16"
+                else "trade_predictor_new.tflite"
+            )
+            new_path = self.model_dir / new_name
             live_path = self.model_dir / "trade_predictor.tflite"
             backup_path = self.model_dir / "trade_predictor_backup.tflite"
 
-            # Backup existing model
+            # Backup existing model: a hard link keeps the old inode alive once
+            # the new file replaces live_path, without copying any bytes.
             if live_path.exists():
-                shutil.copy2(live_path, backup_path)
-
-            # Atomic rename
-            new_path.rename(live_path)
+                try:
+                    backup_path.unlink(missing_ok=True)
+                    os.link(live_path, backup_path)
+                except OSError:
+                    shutil.copy2(live_path, backup_path)  # no hard-link support
+
+            # Atomic replace (overwrites live_path on every platform)
+            os.replace(new_path, live_path)
 
             logger.info("Model deployed successfully")
             return True
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import importlib.util
+import json
 from typing import Any, Dict, Literal, Optional
 
 import httpx
@@ -9,9 +11,23 @@ from src.core.logger import get_logger
 
 logger = get_logger("alpaca_client")
 
+try:  # orjson: faster order/position payload parsing
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # HTTP status codes that indicate transient errors worth retrying.
 _RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 
+# Fill polling backoff bounds (seconds) for submit_market_order.
+_FILL_POLL_INITIAL_DELAY = 0.1
+_FILL_POLL_MAX_DELAY = 1.0
+
+# HTTP/2 multiplexes order polls over one TLS connection; needs the optional h2 package.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class AlpacaClient:
     """Minimal async Alpaca trading client (orders + close position)."""
@@ -42,7 +58,16 @@ class AlpacaClient:
                 "APCA-API-SECRET-KEY": self.api_secret,
                 "Content-Type": "application/json",
             }
-            self._client = httpx.AsyncClient(timeout=self.timeout_seconds, headers=headers)
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                headers=headers,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=50,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60,
+                ),
+            )
 
     async def close(self) -> None:
         if self._client is not None:
@@ -124,17 +149,22 @@ class AlpacaClient:
                 status=resp.status_code if resp else None,
             )
             return None
-        order = resp.json()
+        order: Dict[str, Any] = _json_loads(resp.content)
         if self._is_filled(order):
             return order
 
         # Market orders are usually quick, but not always synchronous.
         # Poll briefly so internal state uses filled qty/price when available.
+        # Back off from 0.1s to a 1s cap: most fills land in the first few
+        # polls, and slow ones don't need a GET every half second.
         oid = str(order.get("id", "")).strip()
         if oid and wait_fill_seconds > 0:
-            deadline = asyncio.get_running_loop().time() + float(wait_fill_seconds)
-            while asyncio.get_running_loop().time() < deadline:
-                await asyncio.sleep(0.5)
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + float(wait_fill_seconds)
+            delay = _FILL_POLL_INITIAL_DELAY
+            while loop.time() < deadline:
+                await asyncio.sleep(min(delay, max(0.0, deadline - loop.time())))
+                delay = min(_FILL_POLL_MAX_DELAY, delay * 1.5)
                 fresh = await self.get_order(oid)
                 if fresh:
                     order = fresh
@@ -152,7 +182,8 @@ class AlpacaClient:
         if resp is None:
             return None
         if resp.status_code in (200, 202):
-            return resp.json()
+            result: Dict[str, Any] = _json_loads(resp.content)
+            return result
         if resp.status_code == 404:
             return {"status": "no_position"}
         logger.warning(
@@ -174,7 +205,8 @@ class AlpacaClient:
             label="get_order",
         )
         if resp is not None and resp.status_code == 200:
-            return resp.json()
+            order: Dict[str, Any] = _json_loads(resp.content)
+            return order
         return None
 
     async def list_open_positions(self) -> list[Dict[str, Any]]:
@@ -188,7 +220,7 @@ class AlpacaClient:
         if resp is None:
             return []
         if resp.status_code == 200:
-            payload = resp.json()
+            payload = _json_loads(resp.content)
             return payload if isinstance(payload, list) else []
         logger.warning(
             "Alpaca list positions failed",
@@ -0,0 +1,115 @@
+"""US equity market calendar.
+
+Regular NYSE session (9:30-16:00 America/New_York) on weekdays, minus the
+standard full-day exchange holidays, computed per year so there is no
+table to maintain. Early closes (half days) are treated as full sessions.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time as dt_time, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import FrozenSet, Optional
+
+_ET: tzinfo
+try:
+    import zoneinfo
+
+    _ET = zoneinfo.ZoneInfo("America/New_York")
+except Exception:  # pragma: no cover - tzdata missing
+    # Fallback: approximate ET as UTC-5
+    _ET = timezone(timedelta(hours=-5))
+
+_SESSION_OPEN = dt_time(9, 30)
+_SESSION_CLOSE = dt_time(16, 0)
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    """n-th ``weekday`` (Mon=0) of the month; n=-1 for the last one."""
+    if n > 0:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    nxt = date(year + (month == 12), month % 12 + 1, 1)
+    last = nxt - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """Gregorian Easter Sunday (anonymous Gregorian algorithm)."""
+    a = year % 19
+    b, c = divmod(year, 100)
+    d, e = divmod(b, 4)
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = divmod(c, 4)
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _observed(day: date) -> date:
+    """Saturday holidays move to Friday, Sunday holidays to Monday."""
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+@lru_cache(maxsize=8)
+def nyse_holidays(year: int) -> FrozenSet[date]:
+    """Full-day NYSE holidays for ``year``."""
+    days = {
+        _nth_weekday(year, 1, 0, 3),  # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),  # Washington's Birthday
+        _easter(year) - timedelta(days=2),  # Good Friday
+        _nth_weekday(year, 5, 0, -1),  # Memorial Day
+        _observed(date(year, 7, 4)),  # Independence Day
+        _nth_weekday(year, 9, 0, 1),  # Labor Day
+        _nth_weekday(year, 11, 3, 4),  # Thanksgiving
+        _observed(date(year, 12, 25)),  # Christmas
+    }
+    # New Year's Day on a Saturday is not observed on the prior Dec 31
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:
+        days.add(_observed(new_year))
+    if year >= 2022:
+        days.add(_observed(date(year, 6, 19)))  # Juneteenth
+    return frozenset(days)
+
+
+def is_trading_day(day: date) -> bool:
+    return day.weekday() < 5 and day not in nyse_holidays(day.year)
+
+
+def _now_et(now: Optional[datetime]) -> datetime:
+    if now is None:
+        return datetime.now(_ET)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=timezone.utc)
+    return now.astimezone(_ET)
+
+
+def is_market_open(now: Optional[datetime] = None) -> bool:
+    """True during the regular session of a trading day."""
+    now_et = _now_et(now)
+    return (
+        is_trading_day(now_et.date())
+        and _SESSION_OPEN <= now_et.time() < _SESSION_CLOSE
+    )
+
+
+def seconds_until_open(now: Optional[datetime] = None) -> float:
+    """Seconds until the next regular session opens (0.0 while open)."""
+    now_et = _now_et(now)
+    if is_market_open(now_et):
+        return 0.0
+    day = now_et.date()
+    if now_et.time() >= _SESSION_OPEN:
+        day += timedelta(days=1)
+    while not is_trading_day(day):
+        day += timedelta(days=1)
+    opens_at = datetime.combine(day, _SESSION_OPEN, tzinfo=_ET)
+    return max(0.0, (opens_at - now_et).total_seconds())
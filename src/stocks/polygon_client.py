@@ -1,16 +1,84 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import json
 import re
+from operator import itemgetter
 from urllib.parse import quote
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, TypeVar
 
 import httpx
+import numpy as np
 
 from src.core.logger import get_logger
 
 logger = get_logger("polygon_client")
+
+try:  # orjson parses large aggregate/snapshot payloads several times faster
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 _OPTION_SYMBOL_RE = re.compile(r"^(?:O:)?[A-Z]{1,6}\d{6}[CP]\d{8}$")
+# Multiplex bar requests over one TLS connection when the optional h2 package is present.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_AGG_ROW_VALUES = itemgetter("t", "o", "h", "l", "c", "v")
+_AGG_FIELDS = ("time", "open", "high", "low", "close", "volume")
+
+_T = TypeVar("_T")
+
+
+def _parse_aggregate_rows(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert Polygon aggregate rows (epoch-ms ``t`` + o/h/l/c/v) into bar dicts."""
+    try:
+        # One C-level lookup per row; well-formed payloads never leave this path.
+        return [
+            {
+                "time": t / 1000.0,
+                "open": float(o),
+                "high": float(h),
+                "low": float(l),
+                "close": float(c),
+                "volume": float(v),
+            }
+            for t, o, h, l, c, v in map(_AGG_ROW_VALUES, rows)
+        ]
+    except (KeyError, TypeError, ValueError):
+        # Missing/null fields: fall back to per-field defaults.
+        return [
+            {
+                "time": float(row.get("t", 0) or 0) / 1000.0,
+                "open": float(row.get("o", 0) or 0),
+                "high": float(row.get("h", 0) or 0),
+                "low": float(row.get("l", 0) or 0),
+                "close": float(row.get("c", 0) or 0),
+                "volume": float(row.get("v", 0) or 0),
+            }
+            for row in rows
+        ]
+
+
+def _aggregate_arrays(rows: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Convert Polygon aggregate rows into one contiguous float64 array per field."""
+    try:
+        matrix = np.array(list(map(_AGG_ROW_VALUES, rows)), dtype=np.float64)
+    except (KeyError, TypeError, ValueError):
+        matrix = np.array(
+            [[row.get(k, 0) or 0 for k in ("t", "o", "h", "l", "c", "v")] for row in rows],
+            dtype=np.float64,
+        )
+    matrix = matrix.reshape(len(rows), len(_AGG_FIELDS))
+    # Null fields come through as NaN; match the list path's 0.0 default.
+    np.nan_to_num(matrix, copy=False)
+    matrix[:, 0] /= 1000.0
+    # Field-major copy so every column is a contiguous row of one block.
+    columns = np.ascontiguousarray(matrix.T)
+    return dict(zip(_AGG_FIELDS, columns))
 
 
 class PolygonClient:
@@ -33,7 +101,15 @@ class PolygonClient:
 
     async def initialize(self) -> None:
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout_seconds)
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout_seconds,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(
+                    max_connections=50,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=60,
+                ),
+            )
 
     async def close(self) -> None:
         if self._client is not None:
@@ -70,8 +146,66 @@ class PolygonClient:
         - time: epoch seconds
         - open, high, low, close, volume
         """
+        return await self._fetch_aggregates(
+            symbol, multiplier, timespan, limit, _parse_aggregate_rows
+        )
+
+    async def get_aggregate_bars_soa(
+        self,
+        symbol: str,
+        *,
+        multiplier: int,
+        timespan: str,
+        limit: int = 300,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Return Polygon aggregate bars in ascending order as column arrays.
+
+        Keys: time (epoch seconds), open, high, low, close, volume -- each a
+        contiguous float64 array of equal length (empty on error).
+        """
+        return await self._fetch_aggregates(
+            symbol, multiplier, timespan, limit, _aggregate_arrays
+        )
+
+    async def get_many_aggregate_bars(
+        self,
+        symbols: List[str],
+        *,
+        multiplier: int,
+        timespan: str,
+        limit: int = 300,
+        concurrency: int = 10,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch aggregate bars for several symbols concurrently.
+
+        At most ``concurrency`` requests are in flight (they share the pooled,
+        HTTP/2-capable client). Returns ``{symbol: bars}``; failed symbols map
+        to an empty list, as with ``get_aggregate_bars``.
+        """
+        sem = asyncio.Semaphore(max(1, int(concurrency)))
+
+        async def _one(symbol: str) -> tuple[str, List[Dict[str, Any]]]:
+            async with sem:
+                bars = await self.get_aggregate_bars(
+                    symbol, multiplier=multiplier, timespan=timespan, limit=limit
+                )
+            return symbol, bars
+
+        return dict(await asyncio.gather(*(_one(s) for s in dict.fromkeys(symbols))))
+
+    async def _fetch_aggregates(
+        self,
+        symbol: str,
+        multiplier: int,
+        timespan: str,
+        limit: int,
+        parse: Callable[[List[Dict[str, Any]]], _T],
+    ) -> _T:
+        """Fetch aggregate rows and hand the trimmed rows to ``parse``."""
         if not self.enabled:
-            return []
+            return parse([])
         if self._client is None:
             await self.initialize()
 
@@ -105,22 +239,9 @@ class PolygonClient:
         try:
             resp = await self._client.get(url, params=params)
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_loads(resp.content)
             results = data.get("results", []) or []
-            bars: List[Dict[str, Any]] = []
-            for row in results[-lim:]:
-                ts_ms = float(row.get("t", 0) or 0)
-                bars.append(
-                    {
-                        "time": ts_ms / 1000.0,
-                        "open": float(row.get("o", 0) or 0),
-                        "high": float(row.get("h", 0) or 0),
-                        "low": float(row.get("l", 0) or 0),
-                        "close": float(row.get("c", 0) or 0),
-                        "volume": float(row.get("v", 0) or 0),
-                    }
-                )
-            return bars
+            return parse(results[-lim:])
         except Exception as e:
             logger.warning(
                 "Polygon aggregate fetch failed",
@@ -129,7 +250,7 @@ class PolygonClient:
                 timespan=span,
                 error=repr(e),
             )
-            return []
+            return parse([])
 
     async def get_all_snapshots(self) -> List[Dict[str, Any]]:
         """
@@ -148,7 +269,7 @@ class PolygonClient:
         try:
             resp = await self._client.get(url, params=params, timeout=60.0)
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_loads(resp.content)
             return data.get("tickers", []) or []
         except Exception as e:
             logger.warning("Polygon bulk snapshot fetch failed", error=repr(e))
@@ -188,7 +309,7 @@ class PolygonClient:
         try:
             resp = await self._client.get(url, params=params)
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_loads(resp.content)
             tickers = data.get("results", []) or []
             next_cursor = data.get("next_url", "") or ""
             # Extract cursor param from next_url if present
@@ -222,7 +343,7 @@ class PolygonClient:
         try:
             resp = await self._client.get(url, params=params)
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_loads(resp.content)
             return data.get("tickers", []) or []
         except Exception as e:
             logger.warning(
@@ -258,7 +379,7 @@ class PolygonClient:
         try:
             resp = await self._client.get(url, params=params, timeout=60.0)
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_loads(resp.content)
             results = data.get("results", []) or []
             out: Dict[str, Dict[str, Any]] = {}
             for row in results:
@@ -5,7 +5,9 @@ import re
 import time
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from math import isfinite
+from operator import itemgetter
+from typing import Any, Collection, Dict, Iterable, List, Optional, Sequence, TypedDict
 
 import random
 
@@ -15,8 +17,9 @@ from src.core.control_router import ControlRouter
 from src.core.database import DatabaseManager
 from src.core.logger import get_logger
 from src.stocks.alpaca_client import AlpacaClient
+from src.stocks.market_hours import is_market_open, seconds_until_open
 from src.stocks.polygon_client import PolygonClient
-from src.utils.indicators import ema, rsi
+from src.utils.indicators import njit
 
 logger = get_logger("stock_swing_engine")
 
@@ -30,9 +33,166 @@ _ALPACA_TERMINAL_REJECT_STATUSES = {
 }
 
 _BROKER_RECONCILE_INTERVAL_LOOPS = 4
+_BAR_CLOSE = itemgetter("close")
+# Re-read open trades from the DB every N scans to catch cache drift.
+_OPEN_TRADES_RESYNC_SCANS = 60
+# While the market is closed, wake at least this often to settle pending opens.
+_CLOSED_MARKET_HEARTBEAT_SECONDS = 3600.0
+# Thought log batching: flush up to this many rows, or after this window.
+_THOUGHT_BATCH_MAX = 64
+_THOUGHT_FLUSH_WINDOW_SECONDS = 0.5
 _OPTION_SYMBOL_RE = re.compile(r"^(?:O:)?[A-Z]{1,6}\d{6}[CP]\d{8}$")
 
 
+# Signal indicator periods used by _analyze_signal.
+_EMA_FAST = 20
+_EMA_SLOW = 50
+_RSI_PERIOD = 14
+_MOMENTUM_BARS = 5
+# _analyze_signal label by (buy << 1) | exit; buy wins over exit.
+_SIGNAL_LABELS = ("hold", "exit", "buy", "buy")
+
+
+@njit("UniTuple(float64, 6)(float64[:], int64, int64, int64)", nogil=True, cache=True)
+def _signal_state(closes, fast, slow, rsi_period):  # pragma: no cover - body runs compiled
+    """
+    One pass over ``closes`` -> (ema_fast, ema_slow, rsi, avg_gain, avg_loss, ready).
+
+    Matches the last values of ``ema()`` / ``rsi()`` (same NaN-safe seeding
+    and Wilder smoothing) without allocating their output arrays. An EMA with
+    no NaN-free seed window comes back as 0.0 and an RSI without enough
+    deltas as 50.0. ``ready`` is 1.0 once both EMAs are seeded and the RSI
+    averages are initialised, i.e. when the state can be advanced bar by bar.
+    """
+    n = closes.shape[0]
+    fast_alpha = 2.0 / (fast + 1)
+    slow_alpha = 2.0 / (slow + 1)
+    fast_val = slow_val = 0.0
+    fast_seeded = slow_seeded = False
+    fast_run = slow_run = 0  # consecutive non-NaN closes while seeding
+    fast_sum = slow_sum = 0.0
+    avg_gain = avg_loss = 0.0
+    rv = 50.0
+
+    for i in range(n):
+        x = closes[i]
+        if np.isnan(x):
+            fast_run = slow_run = 0
+            fast_sum = slow_sum = 0.0
+        else:
+            if fast_seeded:
+                fast_val = fast_alpha * x + (1 - fast_alpha) * fast_val
+            else:
+                fast_run += 1
+                fast_sum += x
+                if fast_run >= fast:
+                    fast_val = fast_sum / fast
+                    fast_seeded = True
+            if slow_seeded:
+                slow_val = slow_alpha * x + (1 - slow_alpha) * slow_val
+            else:
+                slow_run += 1
+                slow_sum += x
+                if slow_run >= slow:
+                    slow_val = slow_sum / slow
+                    slow_seeded = True
+
+        if i == 0:
+            continue
+        d = i - 1  # index into the deltas series
+        delta = x - closes[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if d < rsi_period:
+            avg_gain += gain
+            avg_loss += loss
+            if d < rsi_period - 1:
+                continue
+            avg_gain /= rsi_period
+            avg_loss /= rsi_period
+        else:
+            avg_gain = (avg_gain * (rsi_period - 1) + gain) / rsi_period
+            avg_loss = (avg_loss * (rsi_period - 1) + loss) / rsi_period
+        if avg_loss == 0:
+            rv = 100.0
+        else:
+            rs = avg_gain / avg_loss
+            rv = 100.0 - (100.0 / (1.0 + rs))
+
+    ready = 1.0 if (fast_seeded and slow_seeded and n > rsi_period) else 0.0
+    return fast_val, slow_val, rv, avg_gain, avg_loss, ready
+
+
+@njit("float64(float64[:], int64)", nogil=True, cache=True)
+def _momentum(closes, lookback):  # pragma: no cover - body runs compiled
+    """Return over the last ``lookback`` bars (0.0 if unavailable)."""
+    n = closes.shape[0]
+    if n > lookback and closes[n - 1 - lookback] > 0:
+        return closes[n - 1] / closes[n - 1 - lookback] - 1.0
+    return 0.0
+
+
+@njit("UniTuple(float64, 5)(float64[:], int64, int64, int64, int64)", nogil=True, cache=True)
+def _signal_features(closes, fast, slow, rsi_period, mom_lookback):  # pragma: no cover - body runs compiled
+    """One pass over ``closes`` -> (close, ema_fast, ema_slow, rsi, momentum)."""
+    fast_val, slow_val, rv, _, _, _ = _signal_state(closes, fast, slow, rsi_period)
+    n = closes.shape[0]
+    c = closes[n - 1] if n > 0 else 0.0
+    return c, fast_val, slow_val, rv, _momentum(closes, mom_lookback)
+
+
+def _advance_signal_state(
+    state: tuple[float, float, float, float], prev_close: float, close: float
+) -> tuple[float, float, float, float, float]:
+    """
+    Apply one finite close to a ready (ema_fast, ema_slow, avg_gain, avg_loss)
+    state; same recurrences as ``_signal_state``. Returns the new state + RSI.
+    """
+    e_fast, e_slow, avg_gain, avg_loss = state
+    fast_alpha = 2.0 / (_EMA_FAST + 1)
+    slow_alpha = 2.0 / (_EMA_SLOW + 1)
+    e_fast = fast_alpha * close + (1 - fast_alpha) * e_fast
+    e_slow = slow_alpha * close + (1 - slow_alpha) * e_slow
+    delta = close - prev_close
+    gain = delta if delta > 0 else 0.0
+    loss = -delta if delta < 0 else 0.0
+    avg_gain = (avg_gain * (_RSI_PERIOD - 1) + gain) / _RSI_PERIOD
+    avg_loss = (avg_loss * (_RSI_PERIOD - 1) + loss) / _RSI_PERIOD
+    rv = 100.0 if avg_loss == 0 else 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+    return e_fast, e_slow, avg_gain, avg_loss, rv
+
+
+class _QueuedThought(TypedDict, total=False):
+    """A thought awaiting the flusher; ``fields`` is consumed by _render_thought."""
+
+    timestamp: str
+    category: str
+    message: str
+    severity: str
+    metadata: Optional[Dict[str, Any]]
+    tenant_id: str
+    fields: Dict[str, Any]
+
+
+def _render_thought(entry: _QueuedThought) -> None:
+    """Format a queued thought's template in place; fields join the metadata.
+
+    A template that fails to format keeps its raw text so the thought is
+    still written, with the fields preserved in the metadata.
+    """
+    fields = entry.pop("fields", None)
+    if fields:
+        entry["metadata"] = {**fields, **(entry.get("metadata") or {})}
+        try:
+            entry["message"] = entry["message"].format(**fields)
+        except Exception as e:
+            logger.warning(
+                "Stock thought template failed to format",
+                template=entry["message"],
+                error=repr(e),
+            )
+
+
 class _StockMarketDataView:
     """Lightweight market-data adapter for dashboard compatibility."""
 
@@ -88,19 +248,30 @@ class _StockRiskAdapter:
         self._consecutive_wins = 0
         self._consecutive_losses = 0
         self._max_drawdown_pct = 0.0
-        self._daily_reset_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        # Bumped whenever trade counters / bankroll change (stats memo key)
+        self.stats_version = 0
+        # UTC day number (epoch days); cheaper to compare than a date string
+        self._daily_reset_epoch_day = int(time.time() // 86400)
+
+    @property
+    def daily_reset_date(self) -> str:
+        """UTC date (YYYY-MM-DD) of the last daily reset."""
+        return datetime.fromtimestamp(
+            self._daily_reset_epoch_day * 86400, tz=timezone.utc
+        ).strftime("%Y-%m-%d")
 
     def _check_daily_reset(self) -> None:
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        if today != self._daily_reset_date:
+        today = int(time.time() // 86400)
+        if today != self._daily_reset_epoch_day:
             self._daily_pnl = 0.0
             self._daily_trades = 0
             self._consecutive_wins = 0
             self._consecutive_losses = 0
-            self._daily_reset_date = today
+            self._daily_reset_epoch_day = today
 
     def record_closed_trade(self, pnl: float) -> None:
         self._check_daily_reset()
+        self.stats_version += 1
         self._daily_trades += 1
         self._daily_pnl += float(pnl)
         self._trade_count += 1
@@ -135,6 +306,7 @@ class _StockRiskAdapter:
         self._total_pnl = total_pnl
         self.current_bankroll = self.initial_bankroll + total_pnl
         self._peak_bankroll = max(self.initial_bankroll, self.current_bankroll)
+        self.stats_version += 1
 
     @property
     def win_rate(self) -> float:
@@ -183,22 +355,26 @@ class _StockExecutorAdapter:
 
     async def close_all_positions(self, reason: str = "control", tenant_id: Optional[str] = None) -> int:
         tid = tenant_id if tenant_id is not None else self._engine.tenant_id
-        rows = await self._engine.db.get_open_trades(tenant_id=tid)
         closed = 0
-        for trade in rows:
-            ok = await self._engine._close_trade(
-                trade,
-                reason=reason,
-                force=True,
-            )
-            if ok:
-                closed += 1
+        # Under the reconcile lock so the periodic broker pass can't see a
+        # sold position whose row is still open (or vice versa)
+        async with self._engine._reconcile_lock:
+            rows = await self._engine.db.get_open_trades(tenant_id=tid)
+            for trade in rows:
+                ok = await self._engine._close_trade(
+                    trade,
+                    reason=reason,
+                    force=True,
+                )
+                if ok:
+                    closed += 1
         return closed
 
     def get_execution_stats(self) -> Dict[str, Any]:
         stats = dict(self._engine._execution_stats)
         stats["orders_pending"] = len(self._engine._pending_opens)
         stats["mode"] = self._engine.mode
+        stats["db"] = self._engine.db.get_connection_stats()
         return stats
 
 
@@ -234,15 +410,12 @@ class StockSwingEngine:
             if str(s or "").strip()
         ] if self.options_enabled else []
         self.option_symbol_set = {s for s in option_symbols if self._is_option_symbol(s)}
-        merged = stock_symbols + option_symbols
-        seen: set[str] = set()
-        self.pairs = []
-        for sym in merged:
-            if not sym or sym in seen:
-                continue
-            seen.add(sym)
-            self.pairs.append(sym)
+        self.pairs: tuple[str, ...] = ()
+        self._set_pairs(stock_symbols + option_symbols)
         self.scan_interval = max(60, int(self.config.stocks.scan_interval_seconds))
+        self._scan_market_hours_only = bool(
+            getattr(self.config.stocks, "scan_market_hours_only", True)
+        )
         self.min_hold_seconds = max(86400, int(self.config.stocks.min_hold_days) * 86400)
         self.max_hold_seconds = max(self.min_hold_seconds, int(self.config.stocks.max_hold_days) * 86400)
         self.stop_loss_pct = max(0.001, float(self.config.stocks.stop_loss_pct))
@@ -250,6 +423,18 @@ class StockSwingEngine:
             self.stop_loss_pct * 1.05,
             float(self.config.stocks.take_profit_pct),
         )
+        self._max_open_positions = int(self.config.stocks.max_open_positions)
+        # Per-side cost estimates applied to every close (config is static)
+        self._fee_pct = max(
+            0.0,
+            float(getattr(self.config.stocks, "estimated_fee_pct_per_side", 0.0005) or 0.0),
+        )
+        self._slippage_pct = max(
+            0.0,
+            float(getattr(self.config.stocks, "estimated_slippage_pct_per_side", 0.0002) or 0.0),
+        )
+        self.apply_monitoring_config()
+        self._algorithm_stats_cache: Optional[tuple[tuple[int, int], Dict[str, Any]]] = None
 
         self.db = DatabaseManager(self.config.stocks.db_path)
         self.market_data = _StockMarketDataView(
@@ -269,6 +454,18 @@ class StockSwingEngine:
         self._tasks: List[asyncio.Task] = []
         self._auto_pause_reason = ""
         self._pending_opens: Dict[str, Dict[str, Any]] = {}
+        # Serializes broker orders (opens/closes) with pending-open and broker
+        # reconciliation, so a reconcile pass never sees a half-done order
+        self._reconcile_lock = asyncio.Lock()
+        # symbol -> open trade row. This engine is the only writer of its open
+        # rows, so the map is authoritative between periodic DB resyncs.
+        self._open_trades: Dict[str, Dict[str, Any]] = {}
+        self._open_trades_loaded = False
+        # trade_id -> entry time (epoch seconds); entry_time parsed once per trade
+        self._entry_epochs: Dict[str, float] = {}
+        # Thoughts queued for the background flusher while the engine runs
+        self._thought_queue: asyncio.Queue[Optional[_QueuedThought]] = asyncio.Queue()
+        self._thought_task: Optional[asyncio.Task] = None
 
         self.polygon = PolygonClient(
             api_key=self.config.stocks.polygon_api_key,
@@ -293,6 +490,12 @@ class StockSwingEngine:
         self._bar_cache: Dict[str, tuple[float, List[Dict[str, Any]]]] = {}
         self._bar_cache_ttl = max(60.0, self.scan_interval * 0.8)
         self._bar_cache_max_size = 500
+        # Scan bar fetches: at most 8 in flight; next allowed request start
+        self._scan_sem = asyncio.Semaphore(8)
+        self._bar_fetch_next_ts = 0.0
+        # Signal state: symbol -> (bar time, close, (ema20, ema50, avg_gain, avg_loss))
+        # as of the second-to-last bar; see _incremental_signal_values.
+        self._signal_states: Dict[str, tuple[Any, float, tuple[float, float, float, float]]] = {}
 
         self._execution_stats: Dict[str, Any] = {
             "orders_placed": 0,
@@ -309,6 +512,7 @@ class StockSwingEngine:
             await self.alpaca.initialize()
             await self._reconcile_broker_positions(source="startup")
         await self._backfill_open_trade_protection(source="startup")
+        await self._sync_open_trades()
         await self._load_historical_stats()
 
         # Initial universe refresh (updates self.pairs if scanner is active)
@@ -316,12 +520,12 @@ class StockSwingEngine:
             try:
                 universe = await self._universe_scanner.refresh()
                 if universe:
-                    self.pairs = universe
+                    self._set_pairs(universe)
                     logger.info("Universe scanner loaded initial symbols", count=len(universe))
             except Exception as e:
                 logger.warning("Initial universe refresh failed, keeping static symbols", error=repr(e))
 
-        await self.db.log_thought(
+        await self._log_thought(
             "system",
             (
                 "Stock swing engine initialized "
@@ -333,6 +537,11 @@ class StockSwingEngine:
             tenant_id=self.tenant_id,
         )
 
+    def _set_pairs(self, symbols: Iterable[str]) -> None:
+        """Normalize, dedupe (order-preserving) and freeze the scan universe."""
+        normalize = self._normalize_symbol
+        self.pairs = tuple(dict.fromkeys(s for s in map(normalize, symbols) if s))
+
     @staticmethod
     def _normalize_symbol(symbol: str) -> str:
         s = str(symbol or "").strip().upper()
@@ -350,9 +559,19 @@ class StockSwingEngine:
             return
         self._running = True
         self._start_time = time.time()
+        self._thought_task = asyncio.create_task(
+            self._thought_flusher(), name="stocks:thought_flusher"
+        )
         self._tasks = [
             asyncio.create_task(self._scan_loop(), name="stocks:scan_loop"),
         ]
+        if self.mode == "live":
+            self._tasks.append(
+                asyncio.create_task(
+                    self._broker_reconcile_loop(),
+                    name="stocks:broker_reconcile",
+                )
+            )
         if self._universe_scanner:
             self._tasks.append(
                 asyncio.create_task(
@@ -367,10 +586,90 @@ class StockSwingEngine:
             task.cancel()
         if self._tasks:
             await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._thought_task is not None:
+            # Sentinel: flusher writes what is queued, then exits
+            self._thought_queue.put_nowait(None)
+            await asyncio.gather(self._thought_task, return_exceptions=True)
+            self._thought_task = None
         await self.alpaca.close()
         await self.polygon.close()
         await self.db.close()
 
+    async def _log_thought(
+        self,
+        category: str,
+        message: str,
+        severity: str = "info",
+        metadata: Optional[Dict[str, Any]] = None,
+        tenant_id: Optional[str] = None,
+        **fields: Any,
+    ) -> None:
+        """
+        Record a thought for the dashboard feed.
+
+        With ``fields``, ``message`` is a ``str.format`` template: the raw
+        values are queued and formatted by the flusher, off the caller's
+        path, and also stored in the thought's metadata.
+
+        While the engine runs, thoughts are queued and written in batches by
+        _thought_flusher; before start() / after stop() they go straight to
+        the database.
+        """
+        tid = tenant_id if tenant_id is not None else self.tenant_id
+        entry: _QueuedThought = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "category": category,
+            "message": message,
+            "severity": severity,
+            "metadata": metadata,
+            "tenant_id": tid,
+            "fields": fields,
+        }
+        if self._thought_task is None or self._thought_task.done():
+            _render_thought(entry)
+            await self.db.log_thought(
+                category,
+                entry.get("message", message),
+                severity=severity,
+                metadata=entry.get("metadata"),
+                tenant_id=tid,
+            )
+            return
+        self._thought_queue.put_nowait(entry)
+
+    async def _thought_flusher(self) -> None:
+        """Coalesce queued thoughts into insert_thoughts_many batches."""
+        queue = self._thought_queue
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await queue.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = loop.time() + _THOUGHT_FLUSH_WINDOW_SECONDS
+            while len(batch) < _THOUGHT_BATCH_MAX:
+                if not queue.empty():
+                    item = queue.get_nowait()
+                else:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            for entry in batch:
+                _render_thought(entry)
+            try:
+                await self.db.insert_thoughts_many(batch)
+            except Exception as e:
+                logger.warning("Stock thought batch write failed", count=len(batch), error=repr(e))
+
     async def _load_historical_stats(self) -> None:
         """Prime in-memory strategy stats from persisted trade history."""
         try:
@@ -388,36 +687,40 @@ class StockSwingEngine:
         if self.mode != "live":
             return {}
         rows = await self.alpaca.list_open_positions()
+        normalize = self._normalize_symbol
         out: Dict[str, Dict[str, Any]] = {}
+        skipped_shorts: List[str] = []
         for row in rows:
+            get = row.get
+            symbol = normalize(get("symbol", ""))
             try:
-                symbol = self._normalize_symbol(str(row.get("symbol", "")).upper().strip())
-                qty_signed = float(row.get("qty", 0.0) or 0.0)
-                qty = abs(qty_signed)
-                if not symbol or qty <= 0:
-                    continue
-                if qty_signed < 0:
-                    # Strategy does not support short inventory yet.
-                    await self.db.log_thought(
-                        "execution",
-                        f"Skipping unsupported short broker position {symbol} qty={qty:.4f}",
-                        severity="warning",
-                        tenant_id=self.tenant_id,
-                    )
-                    continue
-                avg_entry_price = float(row.get("avg_entry_price", 0.0) or 0.0)
-                if avg_entry_price <= 0:
-                    avg_entry_price = float(row.get("current_price", 0.0) or 0.0)
+                qty_signed = float(get("qty") or 0.0)
+                avg_entry_price = float(get("avg_entry_price") or 0.0)
                 if avg_entry_price <= 0:
-                    continue
-                out[symbol] = {
-                    "symbol": symbol,
-                    "qty": qty,
-                    "avg_entry_price": avg_entry_price,
-                    "raw": row,
-                }
-            except Exception:
+                    avg_entry_price = float(get("current_price") or 0.0)
+            except (TypeError, ValueError):
+                continue
+            if not symbol or qty_signed == 0:
+                continue
+            if qty_signed < 0:
+                # Strategy does not support short inventory yet.
+                skipped_shorts.append(f"{symbol} qty={-qty_signed:.4f}")
+                continue
+            if avg_entry_price <= 0:
                 continue
+            out[symbol] = {
+                "symbol": symbol,
+                "qty": qty_signed,
+                "avg_entry_price": avg_entry_price,
+                "raw": row,
+            }
+        if skipped_shorts:
+            await self._log_thought(
+                "execution",
+                f"Skipping unsupported short broker positions: {', '.join(skipped_shorts)}",
+                severity="warning",
+                tenant_id=self.tenant_id,
+            )
         return out
 
     async def _materialize_broker_position(
@@ -441,23 +744,35 @@ class StockSwingEngine:
             count_fill=False,
         )
         if opened:
-            await self.db.log_thought(
+            await self._log_thought(
                 "execution",
-                (
-                    f"Stock OPEN reconciled from broker {symbol} "
-                    f"qty={float(broker_pos.get('qty', 0.0) or 0.0):.4f} "
-                    f"entry={float(broker_pos.get('avg_entry_price', 0.0) or 0.0):.2f} "
-                    f"source={source}"
-                ),
+                "Stock OPEN reconciled from broker {symbol} "
+                "qty={qty:.4f} entry={entry:.2f} source={source}",
                 severity="warning",
                 tenant_id=self.tenant_id,
+                symbol=symbol,
+                qty=float(broker_pos.get("qty", 0.0) or 0.0),
+                entry=float(broker_pos.get("avg_entry_price", 0.0) or 0.0),
+                source=source,
             )
         return opened
 
-    async def _reconcile_broker_positions(self, *, source: str) -> None:
-        """Ensure local DB has an open row for every live broker position."""
-        broker_positions = await self._normalize_broker_positions()
-        open_rows = await self.db.get_open_trades(tenant_id=self.tenant_id)
+    async def _reconcile_broker_positions(
+        self,
+        *,
+        source: str,
+        open_rows: Optional[List[Dict[str, Any]]] = None,
+        broker_positions: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> int:
+        """
+        Ensure local DB has an open row for every live broker position.
+
+        Returns the number of positions materialized into new local rows.
+        """
+        if broker_positions is None:
+            broker_positions = await self._normalize_broker_positions()
+        if open_rows is None:
+            open_rows = await self.db.get_open_trades(tenant_id=self.tenant_id)
         open_by_symbol = {self._normalize_symbol(str(row.get("pair", ""))): row for row in open_rows}
 
         reconciled = 0
@@ -470,14 +785,15 @@ class StockSwingEngine:
                     broker_qty = float(broker_pos.get("qty", 0.0) or 0.0)
                     if abs(local_qty - broker_qty) > 1e-6:
                         mismatched += 1
-                        await self.db.log_thought(
+                        await self._log_thought(
                             "execution",
-                            (
-                                f"Stock startup reconcile qty mismatch {symbol} "
-                                f"local={local_qty:.4f} broker={broker_qty:.4f}"
-                            ),
+                            "Stock startup reconcile qty mismatch {symbol} "
+                            "local={local_qty:.4f} broker={broker_qty:.4f}",
                             severity="warning",
                             tenant_id=self.tenant_id,
+                            symbol=symbol,
+                            local_qty=local_qty,
+                            broker_qty=broker_qty,
                         )
                 except Exception:
                     pass
@@ -487,7 +803,7 @@ class StockSwingEngine:
                 reconciled += 1
 
         if reconciled or mismatched:
-            await self.db.log_thought(
+            await self._log_thought(
                 "system",
                 (
                     f"Stock {source} reconciliation complete "
@@ -497,6 +813,39 @@ class StockSwingEngine:
                 severity="warning" if mismatched else "info",
                 tenant_id=self.tenant_id,
             )
+        return reconciled
+
+    async def _broker_reconcile_loop(self) -> None:
+        """Periodic live broker reconciliation, off the scan loop's path."""
+        interval = self.scan_interval * _BROKER_RECONCILE_INTERVAL_LOOPS
+        while self._running:
+            try:
+                # Jitter so the broker poll doesn't phase-lock with scans
+                await asyncio.sleep(interval + random.uniform(0.0, interval * 0.05))
+                if not self._running:
+                    break
+                # Broker positions are read under the lock: a position read
+                # before an in-progress open/close finishes would be compared
+                # against the map as it stands afterwards.
+                async with self._reconcile_lock:
+                    pending = self._pending_opens
+                    broker_positions = {
+                        symbol: pos
+                        for symbol, pos in (await self._normalize_broker_positions()).items()
+                        if symbol not in pending
+                    }
+                    await self._reconcile_broker_positions(
+                        source="periodic",
+                        broker_positions=broker_positions,
+                        open_rows=(
+                            list(self._open_trades.values())
+                            if self._open_trades_loaded else None
+                        ),
+                    )
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.warning("Stock broker reconcile loop error", error=repr(e))
 
     async def _auto_pause(self, reason: str, detail: str = "") -> None:
         if self._trading_paused:
@@ -506,7 +855,7 @@ class StockSwingEngine:
         msg = f"Stock engine AUTO-PAUSED: {reason}"
         if detail:
             msg = f"{msg} | {detail}"
-        await self.db.log_thought(
+        await self._log_thought(
             "system",
             msg,
             severity="warning",
@@ -529,7 +878,7 @@ class StockSwingEngine:
                     continue
                 universe = await self._universe_scanner.refresh()
                 if universe:
-                    self.pairs = universe
+                    self._set_pairs(universe)
                     logger.info("Universe refreshed", count=len(universe))
             except asyncio.CancelledError:
                 break
@@ -543,31 +892,58 @@ class StockSwingEngine:
                 if self._trading_paused or self._priority_paused:
                     await asyncio.sleep(self.scan_interval)
                     continue
+                if self._scan_market_hours_only and not is_market_open():
+                    # Daily bars don't move and orders can't fill: skip the
+                    # bar fetches and DB reads, and sleep toward the open.
+                    # Pending opens still get an hourly check.
+                    if self._pending_opens:
+                        async with self._reconcile_lock:
+                            await self._reconcile_pending_opens()
+                    await asyncio.sleep(
+                        max(1.0, min(seconds_until_open(), _CLOSED_MARKET_HEARTBEAT_SECONDS))
+                    )
+                    continue
                 self._scan_count += 1
 
-                await self._reconcile_pending_opens()
-                if (
-                    self.mode == "live"
-                    and self._scan_count % _BROKER_RECONCILE_INTERVAL_LOOPS == 0
-                ):
-                    await self._reconcile_broker_positions(source="periodic")
-                open_rows = await self.db.get_open_trades(tenant_id=self.tenant_id)
+                # Open trades come from the in-memory map (kept current by
+                # _persist_open_trade/_close_trade); the DB is only re-read to
+                # load it and every _OPEN_TRADES_RESYNC_SCANS scans. The lock
+                # keeps the broker reconcile task from materializing rows in
+                # between.
+                async with self._reconcile_lock:
+                    if (
+                        not self._open_trades_loaded
+                        or self._scan_count % _OPEN_TRADES_RESYNC_SCANS == 0
+                    ):
+                        await self._sync_open_trades()
+                    await self._reconcile_pending_opens(
+                        open_rows=list(self._open_trades.values())
+                    )
+                open_by_symbol = self._open_trades
                 await self._backfill_open_trade_protection(
                     source="scan",
-                    open_rows=open_rows,
+                    open_rows=list(open_by_symbol.values()),
                 )
-                open_by_symbol = {str(row.get("pair", "")).upper(): row for row in open_rows}
-                pending_symbols = set(self._pending_opens.keys())
-                open_count = len(open_rows) + len(pending_symbols)
+                if len(self._entry_epochs) > len(open_by_symbol):
+                    # Drop epochs of trades closed outside this engine
+                    live_ids = {str(row.get("trade_id", "") or "") for row in open_by_symbol.values()}
+                    self._entry_epochs = {
+                        k: v for k, v in self._entry_epochs.items() if k in live_ids
+                    }
+                # Membership checks go straight to the dict (no per-scan copy);
+                # each symbol is visited once, so opens added mid-scan don't matter.
+                pending_opens = self._pending_opens
+                open_count = len(open_by_symbol) + len(pending_opens)
                 lookback_limit = max(60, int(self.config.stocks.lookback_bars))
 
-                # Snapshot current pairs to avoid mid-iteration mutation
-                scan_symbols = list(self.pairs)
+                # pairs is an immutable tuple: a refresh rebinds it, so this
+                # reference is a stable snapshot without copying
+                scan_symbols: Sequence[str] = self.pairs
 
                 # Tier 1 pre-filter: narrow large universe using cached snapshots
                 if self._universe_scanner and self._universe_scanner.cached_snapshots:
                     scan_symbols = self._tier1_prefilter(
-                        scan_symbols, open_by_symbol, pending_symbols,
+                        scan_symbols, open_by_symbol, pending_opens,
                     )
 
                 bars_by_symbol = await self._fetch_scan_bars(scan_symbols, lookback_limit)
@@ -576,35 +952,53 @@ class StockSwingEngine:
                     bars = bars_by_symbol.get(symbol, [])
                     if not bars:
                         continue
-                    closes = np.array([float(b["close"]) for b in bars], dtype=float)
+                    # C-level itemgetter map straight into the array: no
+                    # intermediate list, no per-bar Python subscript
+                    closes = np.fromiter(
+                        map(_BAR_CLOSE, bars), dtype=np.float64, count=len(bars)
+                    )
                     latest_price = float(closes[-1])
                     self.market_data.update(symbol, price=latest_price, bars=len(closes))
 
-                    if symbol in pending_symbols:
+                    if symbol in pending_opens:
                         continue
 
-                    signal = self._analyze_signal(closes)
+                    signal = self._analyze_signal(
+                        closes,
+                        symbol=symbol,
+                        bar_times=[b.get("time") for b in bars[-3:]],
+                    )
                     open_trade = open_by_symbol.get(symbol)
                     if open_trade:
-                        closed = await self._maybe_close_trade(open_trade, latest_price, signal)
+                        async with self._reconcile_lock:
+                            closed = await self._maybe_close_trade(
+                                open_trade, latest_price, signal,
+                            )
                         if closed:
-                            open_by_symbol.pop(symbol, None)
                             open_count = max(0, open_count - 1)
                         continue
 
                     if signal != "buy":
                         continue
-                    if open_count >= int(self.config.stocks.max_open_positions):
+                    if open_count >= self._max_open_positions:
                         continue
                     # Skip new entries outside market hours
                     if self._universe_scanner and not self._universe_scanner.is_market_hours():
                         continue
-                    opened = await self._open_trade(symbol, latest_price)
+                    # Held across the order's fill wait so the broker reconcile
+                    # task can't materialize the position alongside this row
+                    async with self._reconcile_lock:
+                        opened = await self._open_trade(symbol, latest_price)
                     if opened:
                         open_count += 1
-                        open_by_symbol[symbol] = {"pair": symbol}
 
-                await self._apply_runtime_breakers()
+                if len(self._signal_states) > self._bar_cache_max_size:
+                    keep = set(scan_symbols)
+                    self._signal_states = {
+                        k: v for k, v in self._signal_states.items() if k in keep
+                    }
+
+                await self._apply_runtime_breakers(open_positions=open_count)
                 await asyncio.sleep(self.scan_interval)
             except asyncio.CancelledError:
                 break
@@ -614,10 +1008,10 @@ class StockSwingEngine:
 
     def _tier1_prefilter(
         self,
-        symbols: List[str],
+        symbols: Sequence[str],
         open_by_symbol: Dict[str, Any],
-        pending_symbols: set,
-    ) -> List[str]:
+        pending_symbols: Collection[str],
+    ) -> Sequence[str]:
         """Pre-filter large universe using cached snapshot data.
 
         Always keeps: pinned symbols, symbols with open/pending positions.
@@ -626,7 +1020,7 @@ class StockSwingEngine:
         scanner = self._universe_scanner
         snaps = scanner.cached_snapshots
         pinned = set(scanner._pinned)
-        must_include = pinned | set(open_by_symbol.keys()) | pending_symbols
+        must_include = pinned.union(open_by_symbol, pending_symbols)
 
         # Target ~30 candidates for deep bar analysis
         max_candidates = 30
@@ -666,7 +1060,7 @@ class StockSwingEngine:
 
     async def _fetch_scan_bars(
         self,
-        symbols: List[str],
+        symbols: Sequence[str],
         limit: int,
     ) -> Dict[str, List[Dict[str, Any]]]:
         """Fetch daily bars for scan symbols with rate limiting and caching."""
@@ -689,35 +1083,59 @@ class StockSwingEngine:
         if not to_fetch:
             return out
 
-        # Rate-limited sequential fetch to respect Polygon API limits
+        # Concurrent fetch, bounded by _scan_sem. Request *starts* stay spaced
+        # min_interval apart to respect Polygon API limits, but responses
+        # overlap, so wall time tracks the slowest fetch rather than the sum.
         rate = 5  # default free tier
         if self._universe_scanner:
             rate = max(1, self.config.stocks.universe.polygon_rate_limit_per_min)
         min_interval = 60.0 / rate
-        last_ts = getattr(self, "_bar_fetch_last_ts", 0.0)
 
-        for symbol in to_fetch:
-            try:
-                elapsed = time.time() - last_ts
-                if elapsed < min_interval:
-                    await asyncio.sleep(min_interval - elapsed)
-                bars = await self.polygon.get_daily_bars(symbol, limit=limit)
-                last_ts = time.time()
-                if bars:
-                    self._bar_cache[symbol] = (time.time(), bars)
-                    # Evict stale entries if cache exceeds max size
-                    if len(self._bar_cache) > self._bar_cache_max_size:
-                        cutoff = time.time() - self._bar_cache_ttl * 2
-                        stale = [k for k, (ts, _) in self._bar_cache.items() if ts < cutoff]
-                        for k in stale:
-                            del self._bar_cache[k]
-                out[symbol] = bars
-            except Exception as e:
-                logger.warning("Stock scan bars fetch failed", symbol=symbol, error=repr(e))
-
-        self._bar_fetch_last_ts = last_ts
+        async def _fetch_one(symbol: str) -> tuple[str, List[Dict[str, Any]]]:
+            async with self._scan_sem:
+                # Reserve the next start slot (single event loop: no lock needed)
+                now_ts = time.time()
+                start_ts = max(now_ts, self._bar_fetch_next_ts)
+                self._bar_fetch_next_ts = start_ts + min_interval
+                if start_ts > now_ts:
+                    await asyncio.sleep(start_ts - now_ts)
+                try:
+                    return symbol, await self.polygon.get_daily_bars(symbol, limit=limit)
+                except Exception as e:
+                    logger.warning("Stock scan bars fetch failed", symbol=symbol, error=repr(e))
+                    return symbol, []
+
+        results = await asyncio.gather(*(_fetch_one(s) for s in to_fetch))
+
+        fetched_at = time.time()
+        for symbol, bars in results:
+            if bars:
+                self._bar_cache[symbol] = (fetched_at, bars)
+            out[symbol] = bars
+        # Evict stale entries if cache exceeds max size
+        if len(self._bar_cache) > self._bar_cache_max_size:
+            cutoff = fetched_at - self._bar_cache_ttl * 2
+            stale = [k for k, (ts, _) in self._bar_cache.items() if ts < cutoff]
+            for k in stale:
+                del self._bar_cache[k]
         return out
 
+    async def _sync_open_trades(self) -> None:
+        """(Re)load the open-trade map from the DB, warning if it had drifted."""
+        rows = await self.db.get_open_trades(tenant_id=self.tenant_id)
+        fresh = {self._normalize_symbol(str(row.get("pair", ""))): row for row in rows}
+        if self._open_trades_loaded:
+            cached_ids = {row.get("trade_id") for row in self._open_trades.values()}
+            db_ids = {row.get("trade_id") for row in fresh.values()}
+            if cached_ids != db_ids:
+                logger.warning(
+                    "Stock open-trade cache drifted from DB; resynced",
+                    missing=sorted(str(t) for t in db_ids - cached_ids),
+                    stale=sorted(str(t) for t in cached_ids - db_ids),
+                )
+        self._open_trades = fresh
+        self._open_trades_loaded = True
+
     def _derive_protective_levels(self, entry_price: float) -> tuple[float, float]:
         if entry_price <= 0:
             return 0.0, 0.0
@@ -761,38 +1179,98 @@ class StockSwingEngine:
             )
             trade.update(updates)
             patched += 1
-            await self.db.log_thought(
+            await self._log_thought(
                 "risk",
-                (
-                    f"Stock protective levels backfilled ({source}) "
-                    f"{trade.get('pair', '?')} trade={trade_id} "
-                    f"sl={float(updates.get('stop_loss', current_sl)):.4f} "
-                    f"tp={float(updates.get('take_profit', current_tp)):.4f}"
-                ),
+                "Stock protective levels backfilled ({source}) "
+                "{pair} trade={trade_id} sl={sl:.4f} tp={tp:.4f}",
                 severity="warning",
                 tenant_id=self.tenant_id,
+                source=source,
+                pair=trade.get("pair", "?"),
+                trade_id=trade_id,
+                sl=float(updates.get("stop_loss", current_sl)),
+                tp=float(updates.get("take_profit", current_tp)),
             )
         return patched
 
-    def _analyze_signal(self, closes: np.ndarray) -> str:
+    def _analyze_signal(
+        self,
+        closes: np.ndarray,
+        *,
+        symbol: Optional[str] = None,
+        bar_times: Optional[Sequence[Any]] = None,
+    ) -> str:
+        """
+        Classify the latest bar as buy / exit / hold.
+
+        With ``symbol`` and ``bar_times`` (timestamps of at least the last
+        three bars) the EMA/RSI state is carried across scans, so a warm
+        symbol costs one recurrence step instead of a pass over ``closes``.
+        """
         if len(closes) < 60:
             return "hold"
-        ema20 = ema(closes, 20)
-        ema50 = ema(closes, 50)
-        rsi14 = rsi(closes, 14)
+        closes = np.asarray(closes, dtype=np.float64)
+        if symbol is not None and bar_times is not None and len(bar_times) >= 3:
+            e20, e50, rv = self._incremental_signal_values(symbol, closes, bar_times)
+            momentum = _momentum(closes, _MOMENTUM_BARS)
+        else:
+            # One kernel dispatch covers the EMAs, RSI and momentum
+            _, e20, e50, rv, momentum = _signal_features(
+                closes, _EMA_FAST, _EMA_SLOW, _RSI_PERIOD, _MOMENTUM_BARS
+            )
         c = float(closes[-1])
-        e20 = float(ema20[-1]) if np.isfinite(ema20[-1]) else 0.0
-        e50 = float(ema50[-1]) if np.isfinite(ema50[-1]) else 0.0
-        rv = float(rsi14[-1]) if np.isfinite(rsi14[-1]) else 50.0
-        if e20 <= 0 or e50 <= 0:
-            return "hold"
-        momentum = (float(closes[-1]) / float(closes[-6]) - 1.0) if len(closes) >= 6 and closes[-6] > 0 else 0.0
+        momentum = float(momentum)
 
-        if c > e20 > e50 and 45.0 <= rv <= 72.0 and momentum > 0:
-            return "buy"
-        if c < e20 or rv >= 78.0 or rv <= 35.0:
-            return "exit"
-        return "hold"
+        # Conditions as bit flags -> label table; an unseeded EMA (0.0) holds.
+        ready = not ((e20 <= 0) | (e50 <= 0))
+        buy = ready & (c > e20) & (e20 > e50) & (45.0 <= rv) & (rv <= 72.0) & (momentum > 0)
+        exit_ = ready & ((c < e20) | (rv >= 78.0) | (rv <= 35.0))
+        return _SIGNAL_LABELS[(buy << 1) | exit_]
+
+    def _incremental_signal_values(
+        self, symbol: str, closes: np.ndarray, bar_times: Sequence[Any]
+    ) -> tuple[float, float, float]:
+        """
+        (ema20, ema50, rsi14) for ``closes`` using the per-symbol cached state.
+
+        The cached state covers every bar except the newest one (whose close
+        keeps moving intraday). It is reused when the second-to-last bar is the
+        one it was built on, advanced by one step when exactly one bar was
+        appended, and rebuilt from ``closes`` otherwise (gap, revised close,
+        NaNs, first sight).
+        """
+        # Scalar finiteness checks on the three closes the recurrence touches;
+        # the kernels handle NaN gaps anywhere else in the window.
+        c3, c2, c1 = closes[-3:].tolist()
+        tail_finite = isfinite(c2) and isfinite(c1)
+        state = self._signal_states.get(symbol)
+        if state is not None and tail_finite and isfinite(c3):
+            ts, last_close, core = state
+            if ts == bar_times[-2] and last_close == c2:
+                pass
+            elif ts == bar_times[-3] and last_close == c3:
+                core = _advance_signal_state(core, c3, c2)[:4]
+                self._signal_states[symbol] = (bar_times[-2], c2, core)
+            else:
+                state = None
+        else:
+            state = None
+
+        if state is None:
+            e_fast, e_slow, _, avg_gain, avg_loss, ready = _signal_state(
+                closes[:-1], _EMA_FAST, _EMA_SLOW, _RSI_PERIOD
+            )
+            if not ready or not tail_finite:
+                self._signal_states.pop(symbol, None)
+                _, e20, e50, rv, _ = _signal_features(
+                    closes, _EMA_FAST, _EMA_SLOW, _RSI_PERIOD, _MOMENTUM_BARS
+                )
+                return e20, e50, rv
+            core = (e_fast, e_slow, avg_gain, avg_loss)
+            self._signal_states[symbol] = (bar_times[-2], c2, core)
+
+        e20, e50, _, _, rv = _advance_signal_state(core, c2, c1)
+        return e20, e50, rv
 
     async def _open_trade(self, symbol: str, market_price: float) -> bool:
         symbol = self._normalize_symbol(symbol)
@@ -806,7 +1284,7 @@ class StockSwingEngine:
             contract_value = market_price * float(self.option_contract_multiplier)
             qty = int(size_usd / contract_value) if contract_value > 0 else 0
             if qty <= 0:
-                await self.db.log_thought(
+                await self._log_thought(
                     "execution",
                     (
                         f"Option BUY skipped {symbol}: max_position_usd={size_usd:.2f} "
@@ -859,19 +1337,28 @@ class StockSwingEngine:
                         "created_ts": time.time(),
                     }
                     self._execution_stats["orders_pending"] = len(self._pending_opens)
-                    await self.db.log_thought(
+                    await self._log_thought(
                         "execution",
-                        f"{asset_label} BUY pending fill {symbol} qty={qty:.4f} order={order_id} status={status or 'unknown'}",
+                        "{asset} BUY pending fill {symbol} qty={qty:.4f} order={order_id} status={status}",
                         severity="warning",
                         tenant_id=self.tenant_id,
+                        asset=asset_label,
+                        symbol=symbol,
+                        qty=qty,
+                        order_id=order_id,
+                        status=status or "unknown",
                     )
                     return True
                 self._execution_stats["orders_rejected"] += 1
-                await self.db.log_thought(
+                await self._log_thought(
                     "execution",
-                    f"{asset_label} BUY rejected (unfilled) {symbol} qty={qty:.4f} status={status or 'unknown'}",
+                    "{asset} BUY rejected (unfilled) {symbol} qty={qty:.4f} status={status}",
                     severity="warning",
                     tenant_id=self.tenant_id,
+                    asset=asset_label,
+                    symbol=symbol,
+                    qty=qty,
+                    status=status or "unknown",
                 )
                 return False
             return await self._persist_open_trade(
@@ -901,6 +1388,7 @@ class StockSwingEngine:
             return False
 
         trade_id = f"S-{uuid.uuid4().hex[:12]}"
+        entry_dt = datetime.now(timezone.utc)
         stop_loss, take_profit = self._derive_protective_levels(fill_price)
         is_option = self._is_option_symbol(symbol)
         multiplier = float(self.option_contract_multiplier if is_option else 1.0)
@@ -927,44 +1415,53 @@ class StockSwingEngine:
             if status:
                 metadata["broker_order_status"] = status
 
-        await self.db.insert_trade(
-            {
-                "trade_id": trade_id,
-                "pair": symbol,
-                "side": "buy",
-                "entry_price": fill_price,
-                "quantity": filled_qty,
-                "status": "open",
-                "strategy": "stock_swing",
-                "confidence": 0.65,
-                "stop_loss": stop_loss,
-                "take_profit": take_profit,
-                "entry_time": datetime.now(timezone.utc).isoformat(),
-                "metadata": metadata,
-            },
-            tenant_id=self.tenant_id,
-        )
+        row = {
+            "trade_id": trade_id,
+            "pair": symbol,
+            "side": "buy",
+            "entry_price": fill_price,
+            "quantity": filled_qty,
+            "status": "open",
+            "strategy": "stock_swing",
+            "confidence": 0.65,
+            "stop_loss": stop_loss,
+            "take_profit": take_profit,
+            "entry_time": entry_dt.isoformat(),
+            "metadata": metadata,
+        }
+        await self.db.insert_trade(row, tenant_id=self.tenant_id)
+        self._open_trades[symbol] = row
+        self._entry_epochs[trade_id] = entry_dt.timestamp()
         if count_fill:
             self._execution_stats["orders_filled"] += 1
-        await self.db.log_thought(
+        await self._log_thought(
             "execution",
-            (
-                f"{asset_label} BUY {symbol} qty={filled_qty:.4f} @ {fill_price:.2f} "
-                f"SL={stop_loss:.4f} TP={take_profit:.4f}"
-            ),
+            "{asset} BUY {symbol} qty={qty:.4f} @ {price:.2f} SL={sl:.4f} TP={tp:.4f}",
             severity="info",
             tenant_id=self.tenant_id,
+            asset=asset_label,
+            symbol=symbol,
+            qty=filled_qty,
+            price=fill_price,
+            sl=stop_loss,
+            tp=take_profit,
         )
         return True
 
-    async def _reconcile_pending_opens(self) -> None:
+    async def _reconcile_pending_opens(
+        self,
+        open_rows: Optional[List[Dict[str, Any]]] = None,
+    ) -> bool:
+        """Resolve pending live BUYs; True if any became a new open trade row."""
         if self.mode != "live" or not self._pending_opens:
             self._execution_stats["orders_pending"] = len(self._pending_opens)
-            return
+            return False
 
-        open_rows = await self.db.get_open_trades(tenant_id=self.tenant_id)
+        if open_rows is None:
+            open_rows = await self.db.get_open_trades(tenant_id=self.tenant_id)
         open_symbols = {self._normalize_symbol(str(row.get("pair", ""))) for row in open_rows}
         broker_positions = await self._normalize_broker_positions()
+        persisted = False
 
         for symbol in list(self._pending_opens.keys()):
             pending = self._pending_opens.get(symbol) or {}
@@ -982,6 +1479,7 @@ class StockSwingEngine:
                 )
                 if opened:
                     self._pending_opens.pop(symbol, None)
+                    persisted = True
                 continue
 
             order_id = str(pending.get("order_id", "")).strip()
@@ -999,11 +1497,13 @@ class StockSwingEngine:
                 if age_seconds > 900:
                     self._pending_opens.pop(symbol, None)
                     self._execution_stats["orders_rejected"] += 1
-                    await self.db.log_thought(
+                    await self._log_thought(
                         "execution",
-                        f"Stock BUY pending timeout {symbol} order={order_id} (no broker position)",
+                        "Stock BUY pending timeout {symbol} order={order_id} (no broker position)",
                         severity="warning",
                         tenant_id=self.tenant_id,
+                        symbol=symbol,
+                        order_id=order_id,
                     )
                 continue
 
@@ -1027,19 +1527,24 @@ class StockSwingEngine:
                 )
                 if opened:
                     self._pending_opens.pop(symbol, None)
+                    persisted = True
                 continue
 
             if status in _ALPACA_TERMINAL_REJECT_STATUSES:
                 self._pending_opens.pop(symbol, None)
                 self._execution_stats["orders_rejected"] += 1
-                await self.db.log_thought(
+                await self._log_thought(
                     "execution",
-                    f"Stock BUY rejected {symbol} order={order_id} status={status}",
+                    "Stock BUY rejected {symbol} order={order_id} status={status}",
                     severity="warning",
                     tenant_id=self.tenant_id,
+                    symbol=symbol,
+                    order_id=order_id,
+                    status=status,
                 )
 
         self._execution_stats["orders_pending"] = len(self._pending_opens)
+        return persisted
 
     async def _maybe_close_trade(self, trade: Dict[str, Any], market_price: float, signal: str) -> bool:
         stop_loss = float(trade.get("stop_loss", 0.0) or 0.0)
@@ -1059,16 +1564,29 @@ class StockSwingEngine:
                 market_price=market_price,
             )
 
-        entry_time = self._parse_dt(trade.get("entry_time"))
-        if not entry_time:
+        entry_epoch = self._entry_epoch(trade)
+        if entry_epoch is None:
             return False
-        held_seconds = max(0.0, (datetime.now(timezone.utc) - entry_time).total_seconds())
+        held_seconds = max(0.0, time.time() - entry_epoch)
         if held_seconds >= self.max_hold_seconds:
             return await self._close_trade(trade, reason="max_hold_timeout", force=True)
         if held_seconds >= self.min_hold_seconds and signal == "exit":
             return await self._close_trade(trade, reason="signal_exit", force=False, market_price=market_price)
         return False
 
+    def _entry_epoch(self, trade: Dict[str, Any]) -> Optional[float]:
+        """Entry time of ``trade`` as epoch seconds, cached by trade_id."""
+        trade_id = str(trade.get("trade_id", "") or "")
+        epoch = self._entry_epochs.get(trade_id)
+        if epoch is None:
+            entry_time = self._parse_dt(trade.get("entry_time"))
+            if not entry_time:
+                return None
+            epoch = entry_time.timestamp()
+            if trade_id:
+                self._entry_epochs[trade_id] = epoch
+        return epoch
+
     async def _close_trade(
         self,
         trade: Dict[str, Any],
@@ -1110,13 +1628,8 @@ class StockSwingEngine:
         gross_pnl = (exit_price - entry) * qty * multiplier
         entry_notional = abs(entry * qty * multiplier)
         exit_notional = abs(exit_price * qty * multiplier)
-        fee_pct = max(0.0, float(getattr(self.config.stocks, "estimated_fee_pct_per_side", 0.0005) or 0.0))
-        slippage_pct = max(
-            0.0,
-            float(getattr(self.config.stocks, "estimated_slippage_pct_per_side", 0.0002) or 0.0),
-        )
-        fees = (entry_notional + exit_notional) * fee_pct
-        slippage = (entry_notional + exit_notional) * slippage_pct
+        fees = (entry_notional + exit_notional) * self._fee_pct
+        slippage = (entry_notional + exit_notional) * self._slippage_pct
         pnl = gross_pnl - fees - slippage
         pnl_pct = (pnl / entry_notional) if entry_notional > 0 else 0.0
         await self.db.close_trade(
@@ -1130,25 +1643,52 @@ class StockSwingEngine:
         )
         self.risk_manager.record_closed_trade(pnl)
         self._execution_stats["orders_closed"] += 1
-        await self.db.log_thought(
+        trade_id = str(trade.get("trade_id", "") or "")
+        self._entry_epochs.pop(trade_id, None)
+        cached = self._open_trades.get(symbol)
+        if cached is not None and str(cached.get("trade_id", "") or "") == trade_id:
+            del self._open_trades[symbol]
+        await self._log_thought(
             "execution",
-            (
-                f"{asset_label} CLOSE {symbol} qty={qty:.4f} @ {exit_price:.2f} reason={reason} "
-                f"gross={gross_pnl:.2f} fees={fees:.2f} slippage={slippage:.2f} net={pnl:.2f}"
-            ),
+            "{asset} CLOSE {symbol} qty={qty:.4f} @ {price:.2f} reason={reason} "
+            "gross={gross:.2f} fees={fees:.2f} slippage={slippage:.2f} net={net:.2f}",
             severity="info",
             tenant_id=self.tenant_id,
+            asset=asset_label,
+            symbol=symbol,
+            qty=qty,
+            price=exit_price,
+            reason=reason,
+            gross=gross_pnl,
+            fees=fees,
+            slippage=slippage,
+            net=pnl,
         )
         return True
 
-    async def _apply_runtime_breakers(self) -> None:
+    def apply_monitoring_config(self) -> None:
+        """
+        Snapshot the auto-pause thresholds read by ``_apply_runtime_breakers``.
+
+        Called again by the settings API when ``monitoring.*`` keys change.
+        """
         mon = self.config.monitoring
-        open_rows = await self.db.get_open_trades(tenant_id=self.tenant_id)
-        report = self.risk_manager.get_risk_report(open_positions=len(open_rows))
+        self._pause_on_losses = bool(getattr(mon, "auto_pause_on_consecutive_losses", True))
+        self._loss_pause_threshold = max(
+            1, int(getattr(mon, "consecutive_losses_pause_threshold", 4) or 4)
+        )
+        self._pause_on_drawdown = bool(getattr(mon, "auto_pause_on_drawdown", True))
+        self._drawdown_pause_pct = max(0.1, float(getattr(mon, "drawdown_pause_pct", 8.0) or 8.0))
 
-        if getattr(mon, "auto_pause_on_consecutive_losses", True):
+    async def _apply_runtime_breakers(self, open_positions: Optional[int] = None) -> None:
+        if open_positions is None:
+            open_rows = await self.db.get_open_trades(tenant_id=self.tenant_id)
+            open_positions = len(open_rows)
+        report = self.risk_manager.get_risk_report(open_positions=open_positions)
+
+        if self._pause_on_losses:
             losses = int(report.get("consecutive_losses", 0) or 0)
-            threshold = max(1, int(getattr(mon, "consecutive_losses_pause_threshold", 4) or 4))
+            threshold = self._loss_pause_threshold
             if losses >= threshold:
                 await self._auto_pause(
                     "consecutive_losses",
@@ -1156,9 +1696,9 @@ class StockSwingEngine:
                 )
                 return
 
-        if getattr(mon, "auto_pause_on_drawdown", True):
+        if self._pause_on_drawdown:
             drawdown = float(report.get("current_drawdown", 0.0) or 0.0)
-            dd_limit = max(0.1, float(getattr(mon, "drawdown_pause_pct", 8.0) or 8.0))
+            dd_limit = self._drawdown_pause_pct
             if drawdown >= dd_limit:
                 await self._auto_pause(
                     "drawdown_limit",
@@ -1169,23 +1709,33 @@ class StockSwingEngine:
     def _parse_dt(value: Any) -> Optional[datetime]:
         if not value:
             return None
-        s = str(value).strip()
+        s = value.strip() if type(value) is str else str(value).strip()
         if not s:
             return None
-        if s.endswith("Z"):
-            s = s[:-1] + "+00:00"
         try:
+            # Python 3.11's C fromisoformat accepts a trailing "Z" and returns
+            # the timezone.utc singleton for UTC offsets, so the common shapes
+            # ("...+00:00" from isoformat(), "...Z" from the broker) need no
+            # rewriting or conversion.
             dt = datetime.fromisoformat(s)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            return dt.astimezone(timezone.utc)
-        except Exception:
+        except ValueError:
             return None
+        tz = dt.tzinfo
+        if tz is timezone.utc:
+            return dt
+        if tz is None:
+            return dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc)
 
     def get_algorithm_stats(self) -> List[Dict[str, Any]]:
-        total_pnl = float(self.risk_manager.current_bankroll - self.risk_manager.initial_bankroll)
-        return [
-            {
+        # Rebuilt only after a trade changes the risk counters; callers get
+        # their own copy since some annotate the dicts.
+        rm = self.risk_manager
+        key = (id(rm), rm.stats_version)
+        cached = self._algorithm_stats_cache
+        if cached is None or cached[0] != key:
+            total_pnl = float(self.risk_manager.current_bankroll - self.risk_manager.initial_bankroll)
+            stats = {
                 "name": "stock_swing",
                 "enabled": True,
                 "kind": "strategy",
@@ -1196,4 +1746,5 @@ class StockSwingEngine:
                 "avg_pnl": round(float(self.risk_manager.avg_pnl), 4),
                 "note": "daily swing strategy (stocks + options via Polygon + Alpaca)",
             }
-        ]
+            cached = self._algorithm_stats_cache = (key, stats)
+        return [dict(cached[1])]
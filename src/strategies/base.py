@@ -10,12 +10,13 @@ signal generation, confidence scoring, and self-diagnostic methods.
 
 from __future__ import annotations
 
+import math
+import time
 from abc import ABC, abstractmethod
-from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Deque, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
@@ -26,6 +27,14 @@ class SignalDirection(str, Enum):
     NEUTRAL = "neutral"
 
 
+# Plain module-level bindings of the members.  Attribute access on an Enum
+# class goes through the metaclass (~100ns on 3.11), which adds up across
+# the direction checks in every strategy's analyze().
+LONG = SignalDirection.LONG
+SHORT = SignalDirection.SHORT
+NEUTRAL = SignalDirection.NEUTRAL
+
+
 @dataclass
 class StrategySignal:
     """
@@ -44,22 +53,33 @@ class StrategySignal:
     take_profit: float = 0.0
     timestamp: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Creation time as epoch seconds; the ISO ``timestamp`` is only rendered
+    # when a directional signal is serialized. Neutral signals are cached and
+    # shared (see _neutral_signal), so they serialize without one.
+    created_at: float = field(default_factory=time.time, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        if not self.timestamp:
-            self.timestamp = datetime.now(timezone.utc).isoformat()
-        self.strength = max(0.0, min(1.0, self.strength))
-        self.confidence = max(0.0, min(1.0, self.confidence))
+        # Clamp to [0, 1]; the one place bounds are enforced, so strategies
+        # pass raw scores.  Same results as max(0.0, min(1.0, x)), NaN -> 1.0
+        # included, without the builtin call overhead.
+        s = self.strength if self.strength < 1.0 else 1.0
+        self.strength = s if s > 0.0 else 0.0
+        c = self.confidence if self.confidence < 1.0 else 1.0
+        self.confidence = c if c > 0.0 else 0.0
 
     @property
     def is_actionable(self) -> bool:
         """Whether this signal warrants potential trade action."""
         return (
-            self.direction != SignalDirection.NEUTRAL
+            self.direction != NEUTRAL
             and self.strength >= 0.3
             and self.confidence >= 0.3
         )
 
+    def iso_timestamp(self) -> str:
+        """Creation time as a UTC ISO-8601 string."""
+        return datetime.fromtimestamp(self.created_at, timezone.utc).isoformat()
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "strategy": self.strategy_name,
@@ -70,18 +90,44 @@ class StrategySignal:
             "entry_price": self.entry_price,
             "stop_loss": self.stop_loss,
             "take_profit": self.take_profit,
-            "timestamp": self.timestamp,
-            "metadata": _sanitize_for_json(self.metadata),
+            "timestamp": self.timestamp or (
+                "" if self.direction == NEUTRAL else self.iso_timestamp()
+            ),
+            "metadata": _round_metadata(_sanitize_for_json(self.metadata)),
         }
 
 
+_NATIVE_SCALARS = frozenset((str, int, float, bool, type(None)))
+# Strategies store raw floats in metadata; rounding is deferred to here so
+# the per-scan analyze() path skips it and only serialized signals pay.
+_METADATA_DECIMALS = 6
+
+
+def _all_native(values: Iterable[Any]) -> bool:
+    """True when every value is a JSON-safe native scalar (finite floats only)."""
+    for v in values:
+        t = type(v)
+        if t is float:
+            if not math.isfinite(v):
+                return False
+        elif t not in _NATIVE_SCALARS:
+            return False
+    return True
+
+
 def _sanitize_for_json(obj: Any) -> Any:
     """Convert numpy types to Python native types for JSON serialization.
     M20 FIX: Also handles NaN/Inf which are not valid JSON."""
-    import math
     if isinstance(obj, dict):
+        # Fast path: flat metadata that is already native (typical, as
+        # strategies store float(...)) only needs a shallow copy, not a
+        # recursive walk
+        if _all_native(obj.values()):
+            return dict(obj)
         return {k: _sanitize_for_json(v) for k, v in obj.items()}
     elif isinstance(obj, (list, tuple)):
+        if _all_native(obj):
+            return list(obj)
         return [_sanitize_for_json(v) for v in obj]
     elif isinstance(obj, (np.bool_,)):
         return bool(obj)
@@ -97,6 +143,30 @@ def _sanitize_for_json(obj: Any) -> Any:
     return obj
 
 
+def _round_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Round top-level float values of sanitized metadata for output."""
+    for k, v in metadata.items():
+        if type(v) is float:
+            metadata[k] = round(v, _METADATA_DECIMALS)
+    return metadata
+
+
+_RECENT_TRADES_WINDOW = 25
+# Cap on cached neutral signals per strategy; reasons embedding live values
+# (e.g. book age) would otherwise grow the cache without bound.
+_NEUTRAL_CACHE_MAX = 512
+# Regime label -> small int code for the recent-trade ring; shared by all
+# strategies so codes compare across instances. "" (unknown) is 0.
+_REGIME_CODES: Dict[str, int] = {"": 0}
+
+
+def _regime_code(regime: str) -> int:
+    code = _REGIME_CODES.get(regime)
+    if code is None:
+        code = _REGIME_CODES[regime] = len(_REGIME_CODES)
+    return code
+
+
 class BaseStrategy(ABC):
     """
     Abstract base class for trading strategies.
@@ -116,16 +186,27 @@ class BaseStrategy(ABC):
         self._trade_count = 0
         self._win_count = 0
         self._total_pnl = 0.0
-        # Sliding window of recent trades for adaptive weighting
+        # Sliding window of recent trades for adaptive weighting, stored as
+        # parallel ring arrays (pnl, regime codes, timestamp, hold hours).
         # Shortened to 25 for faster reaction to regime changes (was 50)
-        # Each entry: (pnl, trend_regime, vol_regime, timestamp, hold_hours)
-        self._recent_trades: Deque[Tuple[float, str, str, float, float]] = deque(maxlen=25)
+        self._pnl_ring = np.zeros(_RECENT_TRADES_WINDOW)
+        self._trend_code = np.zeros(_RECENT_TRADES_WINDOW, dtype=np.int16)
+        self._vol_code = np.zeros(_RECENT_TRADES_WINDOW, dtype=np.int16)
+        self._ts_ring = np.zeros(_RECENT_TRADES_WINDOW)
+        self._hold_ring = np.zeros(_RECENT_TRADES_WINDOW)
+        self._ring_idx = 0  # next slot to write
+        self._ring_len = 0
+        # Bumped per recorded trade; keys the memoised default adaptive factor
+        self._stats_version = 0
+        self._adaptive_factor_cache: Tuple[int, float] = (-1, 1.0)
         # Strategy temperature: tracks rolling P&L of signals over 48h window
         # Used to penalize strategies that generate losing signals even without trades
         self._signal_temperature: float = 1.0  # 1.0 = neutral
+        # Early-return neutral signals reused per (pair, reason)
+        self._neutral_cache: Dict[Tuple[str, str], StrategySignal] = {}
 
     @abstractmethod
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -136,6 +217,9 @@ class BaseStrategy(ABC):
     ) -> StrategySignal:
         """
         Analyze market data and produce a trading signal.
+
+        Pure CPU work, so it is synchronous: call it directly, or through
+        ``asyncio.to_thread`` to keep a long analysis off the event loop.
         
         Args:
             pair: Trading pair (e.g., "BTC/USD")
@@ -151,7 +235,12 @@ class BaseStrategy(ABC):
         pass
 
     def min_bars_required(self) -> int:
-        """Minimum number of bars needed for this strategy."""
+        """
+        Minimum number of bars needed for this strategy.
+
+        Subclasses snapshot this into ``self._min_bars`` at the end of
+        ``__init__`` for the per-call length guard in ``analyze()``.
+        """
         return 50  # Default; override in subclasses
 
     def record_trade_result(
@@ -165,8 +254,15 @@ class BaseStrategy(ABC):
         if pnl > 0:
             self._win_count += 1
         self._total_pnl += pnl
-        import time
-        self._recent_trades.append((pnl, trend_regime, vol_regime, time.time(), hold_hours))
+        i = self._ring_idx
+        self._pnl_ring[i] = pnl
+        self._trend_code[i] = _regime_code(trend_regime)
+        self._vol_code[i] = _regime_code(vol_regime)
+        self._ts_ring[i] = time.time()
+        self._hold_ring[i] = hold_hours
+        self._ring_idx = (i + 1) % _RECENT_TRADES_WINDOW
+        self._ring_len = min(self._ring_len + 1, _RECENT_TRADES_WINDOW)
+        self._stats_version += 1
 
         # Update strategy temperature: exponential moving average of trade outcomes
         # Winning trade pushes temp toward 1.1, losing toward 0.9
@@ -182,10 +278,20 @@ class BaseStrategy(ABC):
 
         Returns 0.0 if fewer than 3 winning trades are recorded.
         """
-        durations = [t[4] for t in self._recent_trades if t[0] > 0 and t[4] > 0]
+        n = self._ring_len
+        holds = self._hold_ring[:n]
+        durations = holds[(self._pnl_ring[:n] > 0) & (holds > 0)]
         if len(durations) < 3:
             return 0.0
-        return float(np.mean(durations))
+        return float(durations.mean())
+
+    def recent_pnls(self) -> np.ndarray:
+        """PnLs of the recent-trade window, oldest first."""
+        n = self._ring_len
+        if n < _RECENT_TRADES_WINDOW:
+            return self._pnl_ring[:n].copy()
+        i = self._ring_idx
+        return np.concatenate((self._pnl_ring[i:], self._pnl_ring[:i]))
 
     @property
     def win_rate(self) -> float:
@@ -210,13 +316,16 @@ class BaseStrategy(ABC):
         regime-specific win rate, and strategy temperature from the last 25 trades.
         Widened range (was 0.4-2.0) and faster reaction (window 25, was 50).
         """
-        trades = list(self._recent_trades)
-        if len(trades) < 5:
+        n = self._ring_len
+        if n < 5:
             return 1.0  # Not enough data — neutral (lowered from 10)
 
-        pnls = [t[0] for t in trades]
-        mean_pnl = np.mean(pnls)
-        std_pnl = np.std(pnls)
+        # Window order is irrelevant to every statistic below. Mean/std of
+        # <= 25 values are cheaper over floats than through ndarray reductions.
+        pnls = self._pnl_ring[:n]
+        values = pnls.tolist()
+        mean_pnl = math.fsum(values) / n
+        std_pnl = math.sqrt(math.fsum([(p - mean_pnl) ** 2 for p in values]) / n)
 
         # Rolling edge score: mean / std (Sharpe-like, no risk-free rate)
         if std_pnl > 0:
@@ -226,18 +335,20 @@ class BaseStrategy(ABC):
 
         # Map sharpe_raw to a wider range with sigmoid squash
         # sharpe_raw of 0 → 1.0, +1 → ~1.4, -1 → ~0.6
-        sharpe_score = 1.0 / (1.0 + np.exp(-sharpe_raw))  # 0.27 to 0.73
+        # Logistic via tanh: same curve as 1 / (1 + exp(-x)), one C call
+        sharpe_score = 0.5 * (1.0 + math.tanh(0.5 * sharpe_raw))  # 0.27 to 0.73
         sharpe_factor = 0.3 + sharpe_score * 1.4  # 0.68 to 1.32 (wider than before)
 
         # Regime-specific win rate bonus/penalty (lowered threshold from 5 to 3)
-        regime_trades = [
-            t for t in trades
-            if (not trend_regime or t[1] == trend_regime)
-            and (not vol_regime or t[2] == vol_regime)
-        ]
-        if len(regime_trades) >= 3:
-            regime_wins = sum(1 for t in regime_trades if t[0] > 0)
-            regime_wr = regime_wins / len(regime_trades)
+        mask = np.ones(n, dtype=bool)
+        if trend_regime:
+            mask &= self._trend_code[:n] == _REGIME_CODES.get(trend_regime, -1)
+        if vol_regime:
+            mask &= self._vol_code[:n] == _REGIME_CODES.get(vol_regime, -1)
+        regime_count = int(np.count_nonzero(mask))
+        if regime_count >= 3:
+            regime_wins = int(np.count_nonzero(pnls[mask] > 0))
+            regime_wr = regime_wins / regime_count
             # 50% WR → 1.0, 70% → 1.2, 30% → 0.8
             regime_factor = 0.6 + regime_wr * 0.8
         else:
@@ -247,6 +358,14 @@ class BaseStrategy(ABC):
         combined = sharpe_factor * regime_factor * self._signal_temperature
         return max(0.3, min(2.0, combined))
 
+    def _default_adaptive_factor(self) -> float:
+        """Regime-agnostic adaptive factor, recomputed only after a new trade."""
+        version, factor = self._adaptive_factor_cache
+        if version != self._stats_version:
+            factor = self.adaptive_performance_factor()
+            self._adaptive_factor_cache = (self._stats_version, factor)
+        return factor
+
     def get_stats(self) -> Dict[str, Any]:
         """Get strategy performance statistics."""
         return {
@@ -257,17 +376,30 @@ class BaseStrategy(ABC):
             "win_rate": round(self.win_rate, 4),
             "total_pnl": round(self._total_pnl, 2),
             "avg_pnl": round(self.avg_pnl, 2),
-            "adaptive_factor": round(self.adaptive_performance_factor(), 4),
-            "recent_trades": len(self._recent_trades),
+            "adaptive_factor": round(self._default_adaptive_factor(), 4),
+            "recent_trades": self._ring_len,
         }
 
     def _neutral_signal(self, pair: str, reason: str = "") -> StrategySignal:
-        """Create a neutral (no-trade) signal."""
-        return StrategySignal(
+        """
+        Return a neutral (no-trade) signal.
+
+        Instances are cached per ``(pair, reason)`` and returned unchanged on
+        reuse, so callers must treat them as read-only.
+        """
+        key = (pair, reason)
+        signal = self._neutral_cache.get(key)
+        if signal is not None:
+            return signal
+        if len(self._neutral_cache) >= _NEUTRAL_CACHE_MAX:
+            self._neutral_cache.clear()
+        signal = StrategySignal(
             strategy_name=self.name,
             pair=pair,
-            direction=SignalDirection.NEUTRAL,
+            direction=NEUTRAL,
             strength=0.0,
             confidence=0.0,
             metadata={"reason": reason} if reason else {},
         )
+        self._neutral_cache[key] = signal
+        return signal
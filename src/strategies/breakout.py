@@ -14,7 +14,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
 from src.utils.indicators import atr, bollinger_bands, compute_sl_tp, rsi, volume_ratio
 
 
@@ -47,11 +47,12 @@ class BreakoutStrategy(BaseStrategy):
         super().__init__(name="breakout", weight=weight, enabled=enabled)
         self.lookback_period = lookback_period
         self.volume_confirmation = volume_confirmation
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return self.lookback_period + 20
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -60,7 +61,7 @@ class BreakoutStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         # Key levels
@@ -118,7 +119,7 @@ class BreakoutStrategy(BaseStrategy):
             if abs(lows[i] - n_period_low) / n_period_low < 0.003
         )
 
-        direction = SignalDirection.NEUTRAL
+        direction = NEUTRAL
         strength = 0.0
         confidence = 0.0
 
@@ -138,7 +139,7 @@ class BreakoutStrategy(BaseStrategy):
             if long_confirmation_hits < 2:
                 return self._neutral_signal(pair, "Weak breakout confirmation")
 
-            direction = SignalDirection.LONG
+            direction = LONG
 
             # Base strength from breakout distance
             breakout_pct = (curr_price - n_period_high) / n_period_high
@@ -185,7 +186,7 @@ class BreakoutStrategy(BaseStrategy):
             if short_confirmation_hits < 2:
                 return self._neutral_signal(pair, "Weak breakdown confirmation")
 
-            direction = SignalDirection.SHORT
+            direction = SHORT
 
             breakdown_pct = (n_period_low - curr_price) / n_period_low
             strength = 0.35 + min(breakdown_pct * 20, 0.25)
@@ -211,11 +212,11 @@ class BreakoutStrategy(BaseStrategy):
                 confidence += 0.1
 
         # Fee-aware stops (wider for breakouts)
-        if direction == SignalDirection.LONG:
+        if direction == LONG:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "long", 2.5, 4.0, round_trip_fee_pct=fee_pct
             )
-        elif direction == SignalDirection.SHORT:
+        elif direction == SHORT:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "short", 2.5, 4.0, round_trip_fee_pct=fee_pct
             )
@@ -227,24 +228,24 @@ class BreakoutStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=curr_price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "n_period_high": round(n_period_high, 2),
-                "n_period_low": round(n_period_low, 2),
-                "breakout_distance_pct": round(
+                "n_period_high": float(n_period_high),
+                "n_period_low": float(n_period_low),
+                "breakout_distance_pct": float(
                     abs(curr_price - n_period_high) / n_period_high * 100
                     if curr_price > n_period_high else
-                    abs(n_period_low - curr_price) / n_period_low * 100, 4
+                    abs(n_period_low - curr_price) / n_period_low * 100
                 ),
-                "volume_ratio": round(curr_vol_ratio, 2),
+                "volume_ratio": float(curr_vol_ratio),
                 "volume_confirmed": vol_confirmed,
-                "body_ratio": round(body_ratio, 4),
-                "rsi": round(curr_rsi, 2),
-                "bb_width": round(bb_width, 6),
+                "body_ratio": float(body_ratio),
+                "rsi": float(curr_rsi),
+                "bb_width": float(bb_width),
                 "volatility_expanding": volatility_expanding,
                 "resistance_touches": resistance_touches,
                 "support_touches": support_touches,
@@ -30,8 +30,8 @@ from typing import Dict
 
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
-from src.utils.indicators import compute_sl_tp
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
+from src.utils.indicators import adx, atr, compute_sl_tp, momentum, rsi
 
 
 class FundingRateStrategy(BaseStrategy):
@@ -44,11 +44,12 @@ class FundingRateStrategy(BaseStrategy):
     ):
         super().__init__(name="funding_rate", weight=weight, enabled=enabled)
         self.funding_extreme_pct = abs(funding_extreme_pct)
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return 50
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -57,7 +58,7 @@ class FundingRateStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs,
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         # Get funding rate from kwargs (injected by engine)
@@ -73,7 +74,6 @@ class FundingRateStrategy(BaseStrategy):
             adx_vals = cache.adx(14)
             mom_vals = cache.momentum(10)
         else:
-            from src.utils.indicators import rsi, atr, adx, momentum
             rsi_vals = rsi(closes, 14)
             atr_vals = atr(highs, lows, closes, 14)
             adx_vals = adx(highs, lows, closes, 14)
@@ -102,7 +102,7 @@ class FundingRateStrategy(BaseStrategy):
 
         extreme = self.funding_extreme_pct  # Already a decimal fraction (e.g., 0.01 = 1%)
 
-        direction = SignalDirection.NEUTRAL
+        direction = NEUTRAL
         strength = 0.0
         confidence = 0.0
 
@@ -115,7 +115,7 @@ class FundingRateStrategy(BaseStrategy):
             strong_bearish_trend = curr_adx > 40 and trend_bearish
 
             if (rsi_crossing_up or mom_turning_up) and not strong_bearish_trend:
-                direction = SignalDirection.LONG
+                direction = LONG
                 strength = 0.40
 
                 # Funding extremity bonus
@@ -139,7 +139,7 @@ class FundingRateStrategy(BaseStrategy):
             strong_bullish_trend = curr_adx > 40 and trend_bullish
 
             if (rsi_crossing_down or mom_turning_down) and not strong_bullish_trend:
-                direction = SignalDirection.SHORT
+                direction = SHORT
                 strength = 0.40
 
                 funding_excess = abs(funding_rate) - extreme
@@ -156,8 +156,8 @@ class FundingRateStrategy(BaseStrategy):
         # SL/TP
         stop_loss = 0.0
         take_profit = 0.0
-        if direction != SignalDirection.NEUTRAL:
-            side = "long" if direction == SignalDirection.LONG else "short"
+        if direction != NEUTRAL:
+            side = "long" if direction == LONG else "short"
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, side, sl_mult=2.0, tp_mult=3.0,
                 round_trip_fee_pct=fee_pct,
@@ -167,17 +167,17 @@ class FundingRateStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=curr_price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "funding_rate": round(float(funding_rate), 6),
+                "funding_rate": float(funding_rate),
                 "funding_extreme_pct": self.funding_extreme_pct,
-                "rsi": round(curr_rsi, 2),
-                "adx": round(curr_adx, 2),
-                "momentum": round(curr_mom, 6),
-                "atr": round(curr_atr, 6),
+                "rsi": float(curr_rsi),
+                "adx": float(curr_adx),
+                "momentum": float(curr_mom),
+                "atr": float(curr_atr),
             },
         )
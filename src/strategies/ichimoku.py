@@ -21,10 +21,102 @@ TP: 3.0x ATR or Kijun-Sen, whichever is further
 
 from __future__ import annotations
 
+import math
+from typing import Optional, Tuple
+
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
-from src.utils.indicators import atr, compute_sl_tp, ichimoku
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
+from src.utils.indicators import atr, compute_sl_tp, ichimoku, ichimoku_signals
+
+
+def _ichimoku_score(
+    price: float,
+    tenkan: float,
+    kijun: float,
+    cloud_top: float,
+    cloud_bottom: float,
+    atr_value: float,
+    tk_bullish_cross: bool,
+    tk_bearish_cross: bool,
+    chikou_bullish: bool,
+    chikou_bearish: bool,
+) -> Tuple[float, float, float, float, float]:
+    """
+    Scalar entry scoring -> (direction, strength, confidence, sl_dist, tp_base).
+
+    ``direction`` is +1.0 (long), -1.0 (short) or 0.0; strength and
+    confidence are already capped at 1.0.  ``sl_dist`` is the larger of the
+    opposite cloud edge and 2x ATR; ``tp_base`` is price +/- 3x ATR.  Fee
+    floors are applied by the caller.
+    """
+    cloud_width_pct = (cloud_top - cloud_bottom) / price if price > 0 else 0.0
+    atr_stop = atr_value * 2.0
+
+    # ---- LONG ----
+    if price > cloud_top and tk_bullish_cross:
+        strength = 0.50
+        confidence = 0.45
+
+        # Cloud thickness bonus (thicker = stronger S/R)
+        if cloud_width_pct > 0.005:
+            strength += 0.1
+            confidence += 0.05
+
+        # Chikou confirmation
+        if chikou_bullish:
+            strength += 0.15
+            confidence += 0.15
+
+        # Price well above cloud
+        dist_above = (price - cloud_top) / price if price > 0 else 0.0
+        if dist_above < 0.01:
+            confidence += 0.05  # Close to cloud = better entry
+
+        # Tenkan > Kijun strength
+        if tenkan > kijun:
+            confidence += 0.05
+
+        # SL at opposite cloud edge (cloud_bottom = support)
+        sl_at_cloud = price - cloud_bottom
+        return (
+            1.0,
+            strength if strength <= 1.0 else 1.0,
+            confidence if confidence <= 1.0 else 1.0,
+            sl_at_cloud if sl_at_cloud >= atr_stop else atr_stop,
+            price + atr_value * 3.0,
+        )
+
+    # ---- SHORT ----
+    if price < cloud_bottom and tk_bearish_cross:
+        strength = 0.50
+        confidence = 0.45
+
+        if cloud_width_pct > 0.005:
+            strength += 0.1
+            confidence += 0.05
+
+        if chikou_bearish:
+            strength += 0.15
+            confidence += 0.15
+
+        dist_below = (cloud_bottom - price) / price if price > 0 else 0.0
+        if dist_below < 0.01:
+            confidence += 0.05
+
+        if tenkan < kijun:
+            confidence += 0.05
+
+        sl_at_cloud = cloud_top - price
+        return (
+            -1.0,
+            strength if strength <= 1.0 else 1.0,
+            confidence if confidence <= 1.0 else 1.0,
+            sl_at_cloud if sl_at_cloud >= atr_stop else atr_stop,
+            price - atr_value * 3.0,
+        )
+
+    return 0.0, 0.0, 0.0, 0.0, 0.0
 
 
 class IchimokuStrategy(BaseStrategy):
@@ -43,11 +135,12 @@ class IchimokuStrategy(BaseStrategy):
         self.kijun_period = kijun_period
         self.senkou_b_period = senkou_b_period
         self.atr_period = atr_period
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return self.senkou_b_period + self.kijun_period + 10
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -56,7 +149,7 @@ class IchimokuStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs,
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         cache = kwargs.get("indicator_cache")
@@ -64,149 +157,110 @@ class IchimokuStrategy(BaseStrategy):
             tenkan_sen, kijun_sen, senkou_a, senkou_b, chikou = cache.ichimoku(
                 self.tenkan_period, self.kijun_period, self.senkou_b_period,
             )
+            tk_bull, tk_bear, chikou_bull, chikou_bear = cache.ichimoku_signals(
+                self.tenkan_period, self.kijun_period, self.senkou_b_period,
+            )
             atr_vals = cache.atr(self.atr_period)
         else:
             tenkan_sen, kijun_sen, senkou_a, senkou_b, chikou = ichimoku(
                 highs, lows, closes,
                 self.tenkan_period, self.kijun_period, self.senkou_b_period,
             )
+            tk_bull, tk_bear, chikou_bull, chikou_bear = ichimoku_signals(
+                tenkan_sen, kijun_sen, chikou, closes, self.kijun_period,
+            )
             atr_vals = atr(highs, lows, closes, self.atr_period)
 
-        fee_pct = kwargs.get("round_trip_fee_pct")
-
-        # Current values
-        price = closes[-1]
-        curr_tenkan = tenkan_sen[-1]
-        curr_kijun = kijun_sen[-1]
-        prev_tenkan = tenkan_sen[-2]
-        prev_kijun = kijun_sen[-2]
-        curr_senkou_a = senkou_a[-1]
-        curr_senkou_b = senkou_b[-1]
-        curr_atr = atr_vals[-1]
+        # Last-bar values; TK cross and chikou flags come precomputed per bar
+        # from ichimoku_signals (chikou compares closes[-1] against the close
+        # kijun bars earlier)
+        return self._signal_from_values(
+            pair,
+            closes[-1],
+            tenkan_sen[-1],
+            kijun_sen[-1],
+            senkou_a[-1],
+            senkou_b[-1],
+            atr_vals[-1],
+            tk_bull[-1],
+            tk_bear[-1],
+            chikou_bull[-1],
+            chikou_bear[-1],
+            kwargs.get("round_trip_fee_pct"),
+        )
 
+    def _signal_from_values(
+        self,
+        pair: str,
+        price: float,
+        curr_tenkan: float,
+        curr_kijun: float,
+        curr_senkou_a: float,
+        curr_senkou_b: float,
+        curr_atr: float,
+        tk_bullish_cross: bool,
+        tk_bearish_cross: bool,
+        chikou_bullish: bool,
+        chikou_bearish: bool,
+        fee_pct: Optional[float],
+    ) -> StrategySignal:
+        """Threshold logic on the last-bar Ichimoku, TK/chikou and ATR values."""
         # Validate indicators converged
-        for v in [curr_tenkan, curr_kijun, curr_senkou_a, curr_senkou_b]:
-            if np.isnan(v):
-                return self._neutral_signal(pair, "Indicators not converged")
+        if any(map(math.isnan, (curr_tenkan, curr_kijun, curr_senkou_a, curr_senkou_b))):
+            return self._neutral_signal(pair, "Indicators not converged")
         if curr_atr <= 0:
             return self._neutral_signal(pair, "ATR is zero")
 
-        # Cloud boundaries
-        cloud_top = max(curr_senkou_a, curr_senkou_b)
-        cloud_bottom = min(curr_senkou_a, curr_senkou_b)
-
-        # TK cross detection
-        tk_bullish_cross = prev_tenkan <= prev_kijun and curr_tenkan > curr_kijun
-        tk_bearish_cross = prev_tenkan >= prev_kijun and curr_tenkan < curr_kijun
-
-        # Chikou span confirmation: chikou is close shifted back by kijun periods
-        # At index i, chikou[i] = closes[i + kijun] — so chikou[-1] is only valid
-        # if we look at chikou at position (n - 1 - kijun) which equals closes[-1]
-        # compared against closes at that earlier position.
-        chikou_idx = len(closes) - 1 - self.kijun_period
-        chikou_bullish = False
-        chikou_bearish = False
-        if 0 <= chikou_idx < len(chikou) and not np.isnan(chikou[chikou_idx]):
-            chikou_bullish = chikou[chikou_idx] > closes[chikou_idx]
-            chikou_bearish = chikou[chikou_idx] < closes[chikou_idx]
-
-        direction = SignalDirection.NEUTRAL
-        strength = 0.0
-        confidence = 0.0
-
-        # ---- LONG ----
-        if price > cloud_top and tk_bullish_cross:
-            direction = SignalDirection.LONG
-            strength = 0.50
-            confidence = 0.45
-
-            # Cloud thickness bonus (thicker = stronger S/R)
-            cloud_width_pct = (cloud_top - cloud_bottom) / price if price > 0 else 0
-            if cloud_width_pct > 0.005:
-                strength += 0.1
-                confidence += 0.05
-
-            # Chikou confirmation
-            if chikou_bullish:
-                strength += 0.15
-                confidence += 0.15
-
-            # Price well above cloud
-            dist_above = (price - cloud_top) / price if price > 0 else 0
-            if dist_above < 0.01:
-                confidence += 0.05  # Close to cloud = better entry
-
-            # Tenkan > Kijun strength
-            if curr_tenkan > curr_kijun:
-                confidence += 0.05
-
-        # ---- SHORT ----
-        elif price < cloud_bottom and tk_bearish_cross:
-            direction = SignalDirection.SHORT
-            strength = 0.50
-            confidence = 0.45
-
-            cloud_width_pct = (cloud_top - cloud_bottom) / price if price > 0 else 0
-            if cloud_width_pct > 0.005:
-                strength += 0.1
-                confidence += 0.05
-
-            if chikou_bearish:
-                strength += 0.15
-                confidence += 0.15
-
-            dist_below = (cloud_bottom - price) / price if price > 0 else 0
-            if dist_below < 0.01:
-                confidence += 0.05
-
-            if curr_tenkan < curr_kijun:
-                confidence += 0.05
+        # Cloud boundaries (inline comparisons: inputs are NaN-free past the
+        # convergence check, and this skips builtin max/min call overhead)
+        cloud_top = curr_senkou_a if curr_senkou_a >= curr_senkou_b else curr_senkou_b
+        cloud_bottom = curr_senkou_a if curr_senkou_a <= curr_senkou_b else curr_senkou_b
+
+        dir_code, strength, confidence, sl_dist, tp_base = _ichimoku_score(
+            price, curr_tenkan, curr_kijun, cloud_top, cloud_bottom, curr_atr,
+            tk_bullish_cross, tk_bearish_cross, chikou_bullish, chikou_bearish,
+        )
 
         # ---- SL/TP ----
+        direction = NEUTRAL
         stop_loss = 0.0
         take_profit = 0.0
-        if direction == SignalDirection.LONG:
-            # SL at opposite cloud edge (cloud_bottom = support)
-            sl_at_cloud = price - cloud_bottom
-            sl_dist = max(sl_at_cloud, curr_atr * 2.0)
+        if dir_code > 0:
+            direction = LONG
             stop_loss = price - sl_dist
-            # TP: 3.0x ATR or Kijun, whichever is further
-            tp_base = price + curr_atr * 3.0
-            _, tp_floor = compute_sl_tp(price, curr_atr, "long", 2.0, 3.0, round_trip_fee_pct=fee_pct)
-            take_profit = max(tp_base, tp_floor)
+            sl_floor, tp_floor = compute_sl_tp(price, curr_atr, "long", 2.0, 3.0, round_trip_fee_pct=fee_pct)
+            take_profit = tp_base if tp_base >= tp_floor else tp_floor
             # Enforce SL floor
-            sl_floor, _ = compute_sl_tp(price, curr_atr, "long", 2.0, 3.0, round_trip_fee_pct=fee_pct)
-            stop_loss = min(stop_loss, sl_floor)
-        elif direction == SignalDirection.SHORT:
-            sl_at_cloud = cloud_top - price
-            sl_dist = max(sl_at_cloud, curr_atr * 2.0)
+            if sl_floor < stop_loss:
+                stop_loss = sl_floor
+        elif dir_code < 0:
+            direction = SHORT
             stop_loss = price + sl_dist
-            tp_base = price - curr_atr * 3.0
-            _, tp_floor = compute_sl_tp(price, curr_atr, "short", 2.0, 3.0, round_trip_fee_pct=fee_pct)
-            take_profit = min(tp_base, tp_floor)
-            sl_floor, _ = compute_sl_tp(price, curr_atr, "short", 2.0, 3.0, round_trip_fee_pct=fee_pct)
-            stop_loss = max(stop_loss, sl_floor)
+            sl_floor, tp_floor = compute_sl_tp(price, curr_atr, "short", 2.0, 3.0, round_trip_fee_pct=fee_pct)
+            take_profit = tp_base if tp_base <= tp_floor else tp_floor
+            if sl_floor > stop_loss:
+                stop_loss = sl_floor
 
         return StrategySignal(
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "tenkan": round(float(curr_tenkan), 4),
-                "kijun": round(float(curr_kijun), 4),
-                "senkou_a": round(float(curr_senkou_a), 4),
-                "senkou_b": round(float(curr_senkou_b), 4),
-                "cloud_top": round(float(cloud_top), 4),
-                "cloud_bottom": round(float(cloud_bottom), 4),
+                "tenkan": float(curr_tenkan),
+                "kijun": float(curr_kijun),
+                "senkou_a": float(curr_senkou_a),
+                "senkou_b": float(curr_senkou_b),
+                "cloud_top": float(cloud_top),
+                "cloud_bottom": float(cloud_bottom),
                 "tk_bullish_cross": bool(tk_bullish_cross),
                 "tk_bearish_cross": bool(tk_bearish_cross),
                 "chikou_bullish": bool(chikou_bullish),
                 "chikou_bearish": bool(chikou_bearish),
-                "atr": round(float(curr_atr), 6),
+                "atr": float(curr_atr),
             },
         )
@@ -28,7 +28,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
 from src.utils.indicators import (
     atr,
     compute_sl_tp,
@@ -72,11 +72,12 @@ class KeltnerStrategy(BaseStrategy):
         self.rsi_period = rsi_period
         self.rsi_long_max = rsi_long_max
         self.rsi_short_min = rsi_short_min
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return max(self.macd_slow + self.macd_signal + 10, self.ema_period * 3, 100)
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -85,7 +86,7 @@ class KeltnerStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         cache = kwargs.get("indicator_cache")
@@ -161,14 +162,14 @@ class KeltnerStrategy(BaseStrategy):
         low_rebounding = low_touched_lower and curr_close > curr_kc_lower
         high_rejecting = high_touched_upper and curr_close < curr_kc_upper
 
-        direction = SignalDirection.NEUTRAL
+        direction = NEUTRAL
         strength = 0.0
         confidence = 0.0
 
         # ---- LONG: Lower band rebound ----
         if low_rebounding and curr_rsi < self.rsi_long_max and curr_rsi > 15:
             if macd_turning_bullish and (bullish_candle or higher_close):
-                direction = SignalDirection.LONG
+                direction = LONG
 
                 # Strength: how deep into the band + how strong the rebound
                 depth = max(0, 0.5 - curr_kc_pos) * 2  # 0-1 scale, deeper = stronger
@@ -199,7 +200,7 @@ class KeltnerStrategy(BaseStrategy):
         # ---- SHORT: Upper band rejection ----
         elif high_rejecting and curr_rsi > self.rsi_short_min and curr_rsi < 85:
             if macd_turning_bearish and (bearish_candle or lower_close):
-                direction = SignalDirection.SHORT
+                direction = SHORT
 
                 depth = max(0, curr_kc_pos - 0.5) * 2
                 strength = 0.4 + min(depth, 0.3)
@@ -225,14 +226,14 @@ class KeltnerStrategy(BaseStrategy):
 
         # ---- SL/TP ----
         # Tighter SL (1.5 ATR) with TP at middle band or 2.5 ATR, whichever is further
-        if direction == SignalDirection.LONG:
+        if direction == LONG:
             stop_loss, take_profit = compute_sl_tp(
                 curr_close, curr_atr, "long", 1.5, 2.5, round_trip_fee_pct=fee_pct
             )
             # If middle band is further than minimum TP, use it
             if curr_kc_mid > take_profit:
                 take_profit = curr_kc_mid
-        elif direction == SignalDirection.SHORT:
+        elif direction == SHORT:
             stop_loss, take_profit = compute_sl_tp(
                 curr_close, curr_atr, "short", 1.5, 2.5, round_trip_fee_pct=fee_pct
             )
@@ -246,22 +247,22 @@ class KeltnerStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=curr_close,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "kc_position": round(float(curr_kc_pos), 4),
-                "kc_upper": round(float(curr_kc_upper), 4),
-                "kc_lower": round(float(curr_kc_lower), 4),
-                "kc_mid": round(float(curr_kc_mid), 4),
-                "macd_hist": round(float(curr_hist), 6),
-                "macd_hist_prev": round(float(prev_hist), 6),
+                "kc_position": float(curr_kc_pos),
+                "kc_upper": float(curr_kc_upper),
+                "kc_lower": float(curr_kc_lower),
+                "kc_mid": float(curr_kc_mid),
+                "macd_hist": float(curr_hist),
+                "macd_hist_prev": float(prev_hist),
                 "macd_turning_bullish": bool(macd_turning_bullish),
                 "macd_turning_bearish": bool(macd_turning_bearish),
-                "rsi": round(float(curr_rsi), 2),
-                "atr": round(float(curr_atr), 6),
+                "rsi": float(curr_rsi),
+                "atr": float(curr_atr),
                 "low_rebounding": bool(low_rebounding),
                 "high_rejecting": bool(high_rejecting),
                 "bullish_candle": bool(bullish_candle),
@@ -23,8 +23,8 @@ from __future__ import annotations
 
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
-from src.utils.indicators import compute_sl_tp
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
+from src.utils.indicators import atr, compute_sl_tp, momentum, rsi, volume_ratio
 
 
 class MarketStructureStrategy(BaseStrategy):
@@ -45,6 +45,7 @@ class MarketStructureStrategy(BaseStrategy):
         self.rsi_floor = rsi_floor
         self.rsi_ceiling = rsi_ceiling
         self.atr_period = atr_period
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return max(self.swing_lookback * 6 + 10, 50)
@@ -72,7 +73,7 @@ class MarketStructureStrategy(BaseStrategy):
     # Analyze
     # ------------------------------------------------------------------
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -81,7 +82,7 @@ class MarketStructureStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs,
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         cache = kwargs.get("indicator_cache")
@@ -91,7 +92,6 @@ class MarketStructureStrategy(BaseStrategy):
             vol_ratio = cache.volume_ratio(20)
             mom_vals = cache.momentum(5)
         else:
-            from src.utils.indicators import atr, rsi, momentum, volume_ratio
             rsi_vals = rsi(closes, 14)
             atr_vals = atr(highs, lows, closes, self.atr_period)
             vol_ratio = volume_ratio(volumes, 20)
@@ -125,7 +125,7 @@ class MarketStructureStrategy(BaseStrategy):
         uptrend = higher_highs and higher_lows
         downtrend = lower_highs and lower_lows
 
-        direction = SignalDirection.NEUTRAL
+        direction = NEUTRAL
         strength = 0.0
         confidence = 0.0
 
@@ -136,7 +136,7 @@ class MarketStructureStrategy(BaseStrategy):
             prev_swing_low = sl[-1][1]
             pullback_near = prev_swing_low * (1 - tol) <= curr_price <= prev_swing_low * (1 + tol)
             if pullback_near and curr_rsi > self.rsi_floor:
-                direction = SignalDirection.LONG
+                direction = LONG
                 strength = 0.40
                 confidence = 0.40
 
@@ -164,7 +164,7 @@ class MarketStructureStrategy(BaseStrategy):
             prev_swing_high = sh[-1][1]
             pullback_near = prev_swing_high * (1 - tol) <= curr_price <= prev_swing_high * (1 + tol)
             if pullback_near and curr_rsi < self.rsi_ceiling:
-                direction = SignalDirection.SHORT
+                direction = SHORT
                 strength = 0.40
                 confidence = 0.40
 
@@ -188,8 +188,8 @@ class MarketStructureStrategy(BaseStrategy):
         # SL/TP
         stop_loss = 0.0
         take_profit = 0.0
-        if direction != SignalDirection.NEUTRAL:
-            side = "long" if direction == SignalDirection.LONG else "short"
+        if direction != NEUTRAL:
+            side = "long" if direction == LONG else "short"
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, side, sl_mult=2.0, tp_mult=3.5,
                 round_trip_fee_pct=fee_pct,
@@ -199,8 +199,8 @@ class MarketStructureStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=curr_price,
             stop_loss=stop_loss,
             take_profit=take_profit,
@@ -209,9 +209,9 @@ class MarketStructureStrategy(BaseStrategy):
                 "downtrend": bool(downtrend),
                 "swing_highs": len(swing_highs),
                 "swing_lows": len(swing_lows),
-                "rsi": round(curr_rsi, 2),
-                "atr": round(curr_atr, 6),
-                "volume_ratio": round(curr_vol_ratio, 2),
-                "momentum": round(curr_mom, 6),
+                "rsi": float(curr_rsi),
+                "atr": float(curr_atr),
+                "volume_ratio": float(curr_vol_ratio),
+                "momentum": float(curr_mom),
             },
         )
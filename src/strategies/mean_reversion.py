@@ -13,7 +13,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
 from src.utils.indicators import (
     atr,
     bb_position,
@@ -59,11 +59,12 @@ class MeanReversionStrategy(BaseStrategy):
         self.bb_std = bb_std
         self.rsi_oversold = rsi_oversold
         self.rsi_overbought = rsi_overbought
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return max(self.bb_period + 20, 50)
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -72,7 +73,7 @@ class MeanReversionStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         cache = kwargs.get("indicator_cache")
@@ -128,7 +129,7 @@ class MeanReversionStrategy(BaseStrategy):
         if len(volumes) >= 5:
             vol_declining = volumes[-1] < volumes[-3] and volumes[-2] < volumes[-3]
 
-        direction = SignalDirection.NEUTRAL
+        direction = NEUTRAL
         strength = 0.0
         confidence = 0.0
 
@@ -144,7 +145,7 @@ class MeanReversionStrategy(BaseStrategy):
             if not long_confirmed:
                 return self._neutral_signal(pair, "No long reversion confirmation")
 
-            direction = SignalDirection.LONG
+            direction = LONG
 
             # Strength based on BB position depth
             strength = 0.4 + min((0.15 - curr_bb_pos) * 2.0, 0.3)
@@ -183,7 +184,7 @@ class MeanReversionStrategy(BaseStrategy):
             if not short_confirmed:
                 return self._neutral_signal(pair, "No short reversion confirmation")
 
-            direction = SignalDirection.SHORT
+            direction = SHORT
 
             strength = 0.4 + min((curr_bb_pos - 0.85) * 2.0, 0.3)
 
@@ -209,14 +210,14 @@ class MeanReversionStrategy(BaseStrategy):
                 confidence += 0.1
 
         # Fee-aware stop loss and take profit (sl 2.25 to reduce chop stops)
-        if direction == SignalDirection.LONG:
+        if direction == LONG:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "long", 2.25, 3.0, round_trip_fee_pct=fee_pct
             )
             # Use middle band as TP if it's further than the minimum
             if curr_middle > take_profit:
                 take_profit = curr_middle
-        elif direction == SignalDirection.SHORT:
+        elif direction == SHORT:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "short", 2.25, 3.0, round_trip_fee_pct=fee_pct
             )
@@ -231,22 +232,22 @@ class MeanReversionStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=curr_price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "bb_position": round(curr_bb_pos, 4),
-                "bb_upper": round(curr_upper, 2),
-                "bb_lower": round(curr_lower, 2),
-                "bb_middle": round(curr_middle, 2),
-                "bb_width": round(curr_bb_width, 6),
+                "bb_position": float(curr_bb_pos),
+                "bb_upper": float(curr_upper),
+                "bb_lower": float(curr_lower),
+                "bb_middle": float(curr_middle),
+                "bb_width": float(curr_bb_width),
                 "is_squeezed": is_squeezed,
-                "rsi": round(curr_rsi, 2),
+                "rsi": float(curr_rsi),
                 "rsi_bull_divergence": rsi_bull_divergence,
                 "rsi_bear_divergence": rsi_bear_divergence,
-                "volume_ratio": round(curr_vol_ratio, 2),
+                "volume_ratio": float(curr_vol_ratio),
                 "volume_declining": vol_declining,
             }
         )
@@ -14,7 +14,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
 from src.utils.indicators import atr, compute_sl_tp, ema, momentum, rsi, volume_ratio
 
 
@@ -47,11 +47,12 @@ class MomentumStrategy(BaseStrategy):
         super().__init__(name="momentum", weight=weight, enabled=enabled)
         self.rsi_threshold = rsi_threshold
         self.volume_multiplier = volume_multiplier
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return 50
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -60,7 +61,7 @@ class MomentumStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         cache = kwargs.get("indicator_cache")
@@ -116,13 +117,13 @@ class MomentumStrategy(BaseStrategy):
         # Rate of change (5-period)
         roc_5 = (closes[-1] - closes[-6]) / closes[-6] if len(closes) > 5 and closes[-6] > 0 else 0
 
-        direction = SignalDirection.NEUTRAL
+        direction = NEUTRAL
         strength = 0.0
         confidence = 0.0
 
         # -- LONG MOMENTUM --
         if curr_rsi > self.rsi_threshold and rsi_rising and volume_burst:
-            direction = SignalDirection.LONG
+            direction = LONG
 
             # Base strength from RSI
             strength = 0.3
@@ -160,7 +161,7 @@ class MomentumStrategy(BaseStrategy):
 
         # -- SHORT MOMENTUM --
         elif curr_rsi < (100 - self.rsi_threshold) and rsi_falling and volume_burst:
-            direction = SignalDirection.SHORT
+            direction = SHORT
 
             strength = 0.3
 
@@ -191,11 +192,11 @@ class MomentumStrategy(BaseStrategy):
                 confidence += 0.1
 
         # Fee-aware stops (higher R:R for momentum)
-        if direction == SignalDirection.LONG:
+        if direction == LONG:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "long", 2.25, 3.5, round_trip_fee_pct=fee_pct
             )
-        elif direction == SignalDirection.SHORT:
+        elif direction == SHORT:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "short", 2.25, 3.5, round_trip_fee_pct=fee_pct
             )
@@ -207,18 +208,18 @@ class MomentumStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=curr_price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "rsi": round(curr_rsi, 2),
+                "rsi": float(curr_rsi),
                 "rsi_rising": rsi_rising,
-                "volume_ratio": round(curr_vol_ratio, 2),
+                "volume_ratio": float(curr_vol_ratio),
                 "volume_burst": volume_burst,
-                "momentum": round(curr_momentum, 6),
-                "roc_5": round(roc_5, 6),
+                "momentum": float(curr_momentum),
+                "roc_5": float(roc_5),
                 "consecutive_positive": pos_candles,
                 "consecutive_negative": neg_candles,
                 "price_above_ema8": price_above_ema,
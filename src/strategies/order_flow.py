@@ -22,14 +22,97 @@ SL: 2.0x ATR, TP: 3.0x ATR
 from __future__ import annotations
 
 import time
-from typing import Dict, Optional
+from operator import gt, lt
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
 from src.utils.indicators import atr, compute_sl_tp
 
 
+def _order_flow_score(
+    book_score: float,
+    threshold: float,
+    spread_tight: bool,
+    higher_lows: bool,
+    lower_highs: bool,
+    whale_bias: float,
+    obi: float,
+) -> Tuple[float, float, float]:
+    """
+    Scalar entry scoring -> (direction, strength, confidence).
+
+    ``direction`` is +1.0 (long), -1.0 (short) or 0.0; strength and
+    confidence are already capped at 1.0.
+    """
+    # ---- LONG: strong bid imbalance + price absorption ----
+    if book_score > threshold:
+        direction = 1.0
+        strength = 0.40
+        confidence = 0.35
+
+        # Book score strength (0.3 baseline, scales up)
+        score_excess = book_score - threshold
+        bonus = score_excess * 0.5
+        strength += bonus if bonus <= 0.25 else 0.25
+        bonus = score_excess * 0.4
+        confidence += bonus if bonus <= 0.20 else 0.20
+
+        # Spread compression — move is imminent
+        if spread_tight:
+            strength += 0.10
+            confidence += 0.08
+
+        # Higher lows — bids being absorbed
+        if higher_lows:
+            strength += 0.10
+            confidence += 0.10
+
+        # Whale bias confirmation
+        if whale_bias > 0.1:
+            confidence += 0.08
+
+        # OBI agreement
+        if obi > 0.15:
+            confidence += 0.05
+
+    # ---- SHORT: strong ask imbalance + distribution ----
+    elif book_score < -threshold:
+        direction = -1.0
+        strength = 0.40
+        confidence = 0.35
+
+        score_excess = abs(book_score) - threshold
+        bonus = score_excess * 0.5
+        strength += bonus if bonus <= 0.25 else 0.25
+        bonus = score_excess * 0.4
+        confidence += bonus if bonus <= 0.20 else 0.20
+
+        if spread_tight:
+            strength += 0.10
+            confidence += 0.08
+
+        if lower_highs:
+            strength += 0.10
+            confidence += 0.10
+
+        if whale_bias < -0.1:
+            confidence += 0.08
+
+        if obi < -0.15:
+            confidence += 0.05
+
+    else:
+        return 0.0, 0.0, 0.0
+
+    return (
+        direction,
+        strength if strength <= 1.0 else 1.0,
+        confidence if confidence <= 1.0 else 1.0,
+    )
+
+
 class OrderFlowStrategy(BaseStrategy):
 
     def __init__(
@@ -55,11 +138,12 @@ class OrderFlowStrategy(BaseStrategy):
         self.min_depth_usd = max(0.0, float(min_depth_usd))
         self.spread_tight_overrides = spread_tight_overrides or {}
         self._avg_spread_pct: Dict[str, float] = {}
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return max(self.hl_lookback + 5, 30)
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -68,7 +152,7 @@ class OrderFlowStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs,
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         # Get order book analysis data from kwargs (passed through by engine)
@@ -80,19 +164,23 @@ class OrderFlowStrategy(BaseStrategy):
         if not book_analysis:
             return self._neutral_signal(pair, "No order book analysis")
 
+        # One bound lookup for every field read from the snapshot
+        get = book_analysis.get
+
         # Check freshness
         try:
-            updated_at = float(book_analysis.get("updated_at", 0))
+            updated_at = float(get("updated_at", 0))
             age = time.time() - updated_at
             if age > self.max_book_age_seconds:
                 return self._neutral_signal(pair, f"Book data stale ({age:.0f}s)")
         except (TypeError, ValueError):
             return self._neutral_signal(pair, "Bad book timestamp")
 
-        book_score = float(book_analysis.get("book_score", 0.0))
-        spread_pct = float(book_analysis.get("spread_pct", 999.0))
-        obi = float(book_analysis.get("obi", 0.0))
-        whale_bias = float(book_analysis.get("whale_bias", 0.0))
+        book_score = float(get("book_score", 0.0))
+        spread_pct = float(get("spread_pct", 999.0))
+        obi = float(get("obi", 0.0))
+        whale_bias = float(get("whale_bias", 0.0))
+        depth_units = float(get("bid_volume", 0.0)) + float(get("ask_volume", 0.0))
         prev_avg = self._avg_spread_pct.get(pair, spread_pct)
         avg_spread = (prev_avg * 0.9) + (spread_pct * 0.1)
         self._avg_spread_pct[pair] = avg_spread
@@ -114,7 +202,6 @@ class OrderFlowStrategy(BaseStrategy):
             return self._neutral_signal(pair, "ATR is zero")
 
         # Liquidity floor: skip signals when combined depth is too thin.
-        depth_units = float(book_analysis.get("bid_volume", 0.0)) + float(book_analysis.get("ask_volume", 0.0))
         depth_usd = depth_units * price if price > 0 else 0.0
         if self.min_depth_usd > 0 and depth_usd < self.min_depth_usd:
             return self._neutral_signal(pair, f"Depth too thin ({depth_usd:.0f} USD)")
@@ -124,84 +211,32 @@ class OrderFlowStrategy(BaseStrategy):
         lb = self.hl_lookback
         recent_lows = lows[-lb:]
         recent_highs = highs[-lb:]
-        n_hl = min(3, len(recent_lows) - 1)
-        count_hl = sum(
-            1 for i in range(len(recent_lows) - n_hl, len(recent_lows))
-            if recent_lows[i] > recent_lows[i - 1]
-        )
+        # Counted over plain floats: per-element NumPy scalar compares cost more
+        # than the comparisons themselves on a 4-bar tail.
+        n_hl = max(0, min(3, len(recent_lows) - 1))
+        tail_lows = recent_lows[-(n_hl + 1):].tolist()
+        count_hl = sum(map(lt, tail_lows, tail_lows[1:]))
         higher_lows = count_hl >= 2
-        n_lh = min(3, len(recent_highs) - 1)
-        count_lh = sum(
-            1 for i in range(len(recent_highs) - n_lh, len(recent_highs))
-            if recent_highs[i] < recent_highs[i - 1]
-        )
+        n_lh = max(0, min(3, len(recent_highs) - 1))
+        tail_highs = recent_highs[-(n_lh + 1):].tolist()
+        count_lh = sum(map(gt, tail_highs, tail_highs[1:]))
         lower_highs = count_lh >= 2
 
         # Spread compression
         spread_tight = spread_pct < spread_tight_limit
 
-        direction = SignalDirection.NEUTRAL
-        strength = 0.0
-        confidence = 0.0
-
-        # ---- LONG: strong bid imbalance + price absorption ----
-        if book_score > self.book_score_threshold:
-            direction = SignalDirection.LONG
-            strength = 0.40
-            confidence = 0.35
-
-            # Book score strength (0.3 baseline, scales up)
-            score_excess = book_score - self.book_score_threshold
-            strength += min(score_excess * 0.5, 0.25)
-            confidence += min(score_excess * 0.4, 0.20)
-
-            # Spread compression — move is imminent
-            if spread_tight:
-                strength += 0.10
-                confidence += 0.08
-
-            # Higher lows — bids being absorbed
-            if higher_lows:
-                strength += 0.10
-                confidence += 0.10
-
-            # Whale bias confirmation
-            if whale_bias > 0.1:
-                confidence += 0.08
-
-            # OBI agreement
-            if obi > 0.15:
-                confidence += 0.05
-
-        # ---- SHORT: strong ask imbalance + distribution ----
-        elif book_score < -self.book_score_threshold:
-            direction = SignalDirection.SHORT
-            strength = 0.40
-            confidence = 0.35
-
-            score_excess = abs(book_score) - self.book_score_threshold
-            strength += min(score_excess * 0.5, 0.25)
-            confidence += min(score_excess * 0.4, 0.20)
-
-            if spread_tight:
-                strength += 0.10
-                confidence += 0.08
-
-            if lower_highs:
-                strength += 0.10
-                confidence += 0.10
-
-            if whale_bias < -0.1:
-                confidence += 0.08
-
-            if obi < -0.15:
-                confidence += 0.05
+        dir_code, strength, confidence = _order_flow_score(
+            book_score, self.book_score_threshold, spread_tight,
+            higher_lows, lower_highs, whale_bias, obi,
+        )
 
         # ---- SL/TP ----
+        direction = NEUTRAL
         stop_loss = 0.0
         take_profit = 0.0
-        if direction != SignalDirection.NEUTRAL:
-            side = "long" if direction == SignalDirection.LONG else "short"
+        if dir_code != 0.0:
+            direction = LONG if dir_code > 0 else SHORT
+            side = "long" if dir_code > 0 else "short"
             stop_loss, take_profit = compute_sl_tp(
                 price, curr_atr, side, sl_mult=2.0, tp_mult=3.0,
                 round_trip_fee_pct=fee_pct,
@@ -211,20 +246,20 @@ class OrderFlowStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "book_score": round(float(book_score), 4),
-                "obi": round(float(obi), 4),
-                "whale_bias": round(float(whale_bias), 4),
-                "spread_pct": round(float(spread_pct), 6),
+                "book_score": float(book_score),
+                "obi": float(obi),
+                "whale_bias": float(whale_bias),
+                "spread_pct": float(spread_pct),
                 "spread_tight": bool(spread_tight),
                 "higher_lows": bool(higher_lows),
                 "lower_highs": bool(lower_highs),
-                "book_age_s": round(float(age), 1),
-                "atr": round(float(curr_atr), 6),
+                "book_age_s": float(age),
+                "atr": float(curr_atr),
             },
         )
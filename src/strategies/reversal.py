@@ -13,7 +13,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
 from src.utils.indicators import atr, compute_sl_tp, ema, rsi, volume_ratio
 
 
@@ -51,6 +51,7 @@ class ReversalStrategy(BaseStrategy):
         self.rsi_extreme_high = rsi_extreme_high
         self.confirmation_candles = confirmation_candles
         self.min_atr_pct = max(0.0, float(min_atr_pct))
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return 50
@@ -124,7 +125,7 @@ class ReversalStrategy(BaseStrategy):
 
         return bullish, bearish
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -133,7 +134,7 @@ class ReversalStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         cache = kwargs.get("indicator_cache")
@@ -202,13 +203,13 @@ class ReversalStrategy(BaseStrategy):
         # Distance from EMA (overextension)
         ema_distance = (curr_price - ema_20[-1]) / ema_20[-1] if ema_20[-1] > 0 else 0
 
-        direction = SignalDirection.NEUTRAL
+        direction = NEUTRAL
         strength = 0.0
         confidence = 0.0
 
         # -- BULLISH REVERSAL --
         if was_oversold and (higher_lows or higher_closes):
-            direction = SignalDirection.LONG
+            direction = LONG
 
             strength = 0.35
 
@@ -254,7 +255,7 @@ class ReversalStrategy(BaseStrategy):
 
         # -- BEARISH REVERSAL --
         elif was_overbought and (lower_highs or lower_closes):
-            direction = SignalDirection.SHORT
+            direction = SHORT
 
             strength = 0.35
 
@@ -293,11 +294,11 @@ class ReversalStrategy(BaseStrategy):
                 confidence += 0.1
 
         # Fee-aware stops for reversals
-        if direction == SignalDirection.LONG:
+        if direction == LONG:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "long", 1.5, 3.0, round_trip_fee_pct=fee_pct
             )
-        elif direction == SignalDirection.SHORT:
+        elif direction == SHORT:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "short", 1.5, 3.0, round_trip_fee_pct=fee_pct
             )
@@ -309,13 +310,13 @@ class ReversalStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=curr_price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "rsi": round(curr_rsi, 2),
+                "rsi": float(curr_rsi),
                 "was_oversold": was_oversold,
                 "was_overbought": was_overbought,
                 "higher_lows": higher_lows,
@@ -327,7 +328,7 @@ class ReversalStrategy(BaseStrategy):
                 "bullish_engulfing": bull_engulf,
                 "bearish_engulfing": bear_engulf,
                 "volume_exhaustion": vol_exhaustion,
-                "ema_distance": round(ema_distance, 6),
+                "ema_distance": float(ema_distance),
             }
         )
 
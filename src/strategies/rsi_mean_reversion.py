@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
 from src.utils.indicators import atr, compute_sl_tp, rsi
 
 
@@ -46,11 +46,12 @@ class RSIMeanReversionStrategy(BaseStrategy):
         self.range_adjust = range_adjust
         self.high_vol_adjust = high_vol_adjust
         self.low_vol_adjust = low_vol_adjust
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return max(self.rsi_period + 10, 50)
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -59,7 +60,7 @@ class RSIMeanReversionStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         cache = kwargs.get("indicator_cache")
@@ -100,12 +101,12 @@ class RSIMeanReversionStrategy(BaseStrategy):
         rsi_rising = curr_rsi > prev_rsi
         rsi_falling = curr_rsi < prev_rsi
 
-        direction = SignalDirection.NEUTRAL
+        direction = NEUTRAL
         strength = 0.0
         confidence = 0.0
 
         if curr_rsi <= oversold and rsi_rising:
-            direction = SignalDirection.LONG
+            direction = LONG
             depth = (oversold - curr_rsi) / 30 if oversold > 0 else 0
             strength = 0.35 + min(max(depth, 0), 0.3)
             confidence = 0.35
@@ -117,7 +118,7 @@ class RSIMeanReversionStrategy(BaseStrategy):
                 strength += 0.1
 
         elif curr_rsi >= overbought and rsi_falling:
-            direction = SignalDirection.SHORT
+            direction = SHORT
             depth = (curr_rsi - overbought) / 30 if overbought < 100 else 0
             strength = 0.35 + min(max(depth, 0), 0.3)
             confidence = 0.35
@@ -128,11 +129,11 @@ class RSIMeanReversionStrategy(BaseStrategy):
             if curr_rsi > 80:
                 strength += 0.1
 
-        if direction == SignalDirection.LONG:
+        if direction == LONG:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "long", 2.0, 2.6, round_trip_fee_pct=fee_pct
             )
-        elif direction == SignalDirection.SHORT:
+        elif direction == SHORT:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "short", 2.0, 2.6, round_trip_fee_pct=fee_pct
             )
@@ -144,13 +145,13 @@ class RSIMeanReversionStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=curr_price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "rsi": round(curr_rsi, 2),
+                "rsi": float(curr_rsi),
                 "rsi_rising": rsi_rising,
                 "rsi_falling": rsi_falling,
                 "oversold": oversold,
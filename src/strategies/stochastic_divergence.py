@@ -20,10 +20,54 @@ SL: 2.0x ATR, TP: 3.0x ATR
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
-from src.utils.indicators import atr, compute_sl_tp, stochastic
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
+from src.utils.indicators import atr, compute_sl_tp, njit, stochastic
+
+
+@njit("boolean(float64[::1], float64[::1], int64, boolean)", nogil=True, cache=True)
+def _divergence_kernel(prices, pct_k, lookback, bullish):  # pragma: no cover - body runs compiled
+    """
+    Divergence between the two most recent local extremes in ``prices``.
+
+    Scans the last ``lookback`` bars backwards for strict local lows
+    (``bullish``) or highs and stops at the second one found.  Bullish:
+    price made a lower low while %K made a higher low; bearish mirrors it.
+    ``pct_k`` is aligned to ``prices`` at the most recent bar.
+    """
+    n = prices.shape[0]
+    if n < lookback + 2:
+        return False
+
+    start = n - lookback
+    recent = -1
+    prior = -1
+    for i in range(n - 2, start, -1):
+        p = prices[i]
+        if bullish:
+            is_extreme = p < prices[i - 1] and p < prices[i + 1]
+        else:
+            is_extreme = p > prices[i - 1] and p > prices[i + 1]
+        if is_extreme:
+            if recent < 0:
+                recent = i
+            else:
+                prior = i
+                break
+    if prior < 0:
+        return False
+
+    k_offset = pct_k.shape[0] - n
+    k_recent = pct_k[recent + k_offset]
+    k_prior = pct_k[prior + k_offset]
+    if np.isnan(k_recent) or np.isnan(k_prior):
+        return False
+    if bullish:
+        return prices[recent] < prices[prior] and k_recent > k_prior
+    return prices[recent] > prices[prior] and k_recent < k_prior
 
 
 class StochasticDivergenceStrategy(BaseStrategy):
@@ -48,11 +92,12 @@ class StochasticDivergenceStrategy(BaseStrategy):
         self.overbought = overbought
         self.divergence_lookback = divergence_lookback
         self.atr_period = atr_period
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return self.k_period + self.smooth + self.d_period + self.divergence_lookback + 10
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -61,15 +106,30 @@ class StochasticDivergenceStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs,
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
+        # Contiguous float64 once at ingress (a no-op for the usual float64
+        # buffers); slices taken below stay contiguous and match the
+        # divergence kernel's C-layout signature without further copies.
+        closes = np.ascontiguousarray(closes, dtype=np.float64)
+        highs = np.ascontiguousarray(highs, dtype=np.float64)
+        lows = np.ascontiguousarray(lows, dtype=np.float64)
+
         cache = kwargs.get("indicator_cache")
         if cache:
             pct_k, pct_d = cache.stochastic(self.k_period, self.d_period, self.smooth)
             atr_vals = cache.atr(self.atr_period)
         else:
-            pct_k, pct_d = stochastic(highs, lows, closes, self.k_period, self.d_period, self.smooth)
+            # %K/%D only reach back k_period + smooth + d_period bars, so on
+            # long histories a tail window yields the same trailing values
+            # the divergence scan reads.  ATR is recursive: full history.
+            need = self._min_bars + 5
+            start = len(closes) - need if len(closes) > need * 2 else 0
+            pct_k, pct_d = stochastic(
+                highs[start:], lows[start:], closes[start:],
+                self.k_period, self.d_period, self.smooth,
+            )
             atr_vals = atr(highs, lows, closes, self.atr_period)
 
         fee_pct = kwargs.get("round_trip_fee_pct")
@@ -81,9 +141,8 @@ class StochasticDivergenceStrategy(BaseStrategy):
         prev_d = pct_d[-2]
         curr_atr = atr_vals[-1]
 
-        for v in [curr_k, curr_d, prev_k, prev_d]:
-            if np.isnan(v):
-                return self._neutral_signal(pair, "Indicators not converged")
+        if any(map(math.isnan, (curr_k, curr_d, prev_k, prev_d))):
+            return self._neutral_signal(pair, "Indicators not converged")
         if curr_atr <= 0:
             return self._neutral_signal(pair, "ATR is zero")
 
@@ -96,13 +155,13 @@ class StochasticDivergenceStrategy(BaseStrategy):
         bull_divergence = self._detect_bullish_divergence(lows, pct_k, lb)
         bear_divergence = self._detect_bearish_divergence(highs, pct_k, lb)
 
-        direction = SignalDirection.NEUTRAL
+        direction = NEUTRAL
         strength = 0.0
         confidence = 0.0
 
         # ---- LONG ----
         if curr_k < self.oversold and bullish_cross:
-            direction = SignalDirection.LONG
+            direction = LONG
             strength = 0.45
             confidence = 0.40
 
@@ -126,7 +185,7 @@ class StochasticDivergenceStrategy(BaseStrategy):
 
         # ---- SHORT ----
         elif curr_k > self.overbought and bearish_cross:
-            direction = SignalDirection.SHORT
+            direction = SHORT
             strength = 0.45
             confidence = 0.40
 
@@ -147,8 +206,8 @@ class StochasticDivergenceStrategy(BaseStrategy):
         # ---- SL/TP ----
         stop_loss = 0.0
         take_profit = 0.0
-        if direction != SignalDirection.NEUTRAL:
-            side = "long" if direction == SignalDirection.LONG else "short"
+        if direction != NEUTRAL:
+            side = "long" if direction == LONG else "short"
             stop_loss, take_profit = compute_sl_tp(
                 price, curr_atr, side, sl_mult=2.0, tp_mult=3.0,
                 round_trip_fee_pct=fee_pct,
@@ -158,19 +217,19 @@ class StochasticDivergenceStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "k": round(float(curr_k), 2),
-                "d": round(float(curr_d), 2),
+                "k": float(curr_k),
+                "d": float(curr_d),
                 "bullish_cross": bool(bullish_cross),
                 "bearish_cross": bool(bearish_cross),
                 "bull_divergence": bool(bull_divergence),
                 "bear_divergence": bool(bear_divergence),
-                "atr": round(float(curr_atr), 6),
+                "atr": float(curr_atr),
             },
         )
 
@@ -179,65 +238,19 @@ class StochasticDivergenceStrategy(BaseStrategy):
         lows: np.ndarray, pct_k: np.ndarray, lookback: int,
     ) -> bool:
         """Price made lower low but stochastic made higher low."""
-        n = len(lows)
-        if n < lookback + 2:
-            return False
-
-        window_lows = lows[-lookback:]
-        window_k = pct_k[-lookback:]
-
-        # Find the two most recent local lows in price
-        price_low_indices = []
-        for i in range(1, len(window_lows) - 1):
-            if window_lows[i] < window_lows[i - 1] and window_lows[i] < window_lows[i + 1]:
-                price_low_indices.append(i)
-
-        if len(price_low_indices) < 2:
-            return False
-
-        # Most recent two lows
-        idx_recent = price_low_indices[-1]
-        idx_prior = price_low_indices[-2]
-
-        # Price: lower low
-        price_lower = window_lows[idx_recent] < window_lows[idx_prior]
-        # Stochastic: higher low (divergence)
-        k_recent = window_k[idx_recent]
-        k_prior = window_k[idx_prior]
-        if np.isnan(k_recent) or np.isnan(k_prior):
-            return False
-        stoch_higher = k_recent > k_prior
-
-        return price_lower and stoch_higher
+        return bool(_divergence_kernel(
+            np.ascontiguousarray(lows, dtype=np.float64),
+            np.ascontiguousarray(pct_k, dtype=np.float64),
+            int(lookback), True,
+        ))
 
     @staticmethod
     def _detect_bearish_divergence(
         highs: np.ndarray, pct_k: np.ndarray, lookback: int,
     ) -> bool:
         """Price made higher high but stochastic made lower high."""
-        n = len(highs)
-        if n < lookback + 2:
-            return False
-
-        window_highs = highs[-lookback:]
-        window_k = pct_k[-lookback:]
-
-        price_high_indices = []
-        for i in range(1, len(window_highs) - 1):
-            if window_highs[i] > window_highs[i - 1] and window_highs[i] > window_highs[i + 1]:
-                price_high_indices.append(i)
-
-        if len(price_high_indices) < 2:
-            return False
-
-        idx_recent = price_high_indices[-1]
-        idx_prior = price_high_indices[-2]
-
-        price_higher = window_highs[idx_recent] > window_highs[idx_prior]
-        k_recent = window_k[idx_recent]
-        k_prior = window_k[idx_prior]
-        if np.isnan(k_recent) or np.isnan(k_prior):
-            return False
-        stoch_lower = k_recent < k_prior
-
-        return price_higher and stoch_lower
+        return bool(_divergence_kernel(
+            np.ascontiguousarray(highs, dtype=np.float64),
+            np.ascontiguousarray(pct_k, dtype=np.float64),
+            int(lookback), False,
+        ))
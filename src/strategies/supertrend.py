@@ -13,9 +13,12 @@ SL: At Supertrend level (natural stop), TP: 3.5x ATR
 
 from __future__ import annotations
 
+import math
+from typing import Optional
+
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
 from src.utils.indicators import atr, compute_sl_tp, supertrend, volume_ratio
 
 
@@ -37,11 +40,12 @@ class SupertrendStrategy(BaseStrategy):
         self.volume_period = volume_period
         self.volume_threshold = volume_threshold
         self.atr_period = atr_period
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return max(self.st_period, self.volume_period) + 20
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -50,7 +54,7 @@ class SupertrendStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs,
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         cache = kwargs.get("indicator_cache")
@@ -63,32 +67,48 @@ class SupertrendStrategy(BaseStrategy):
             vol_ratio = volume_ratio(volumes, self.volume_period)
             atr_vals = atr(highs, lows, closes, self.atr_period)
 
-        fee_pct = kwargs.get("round_trip_fee_pct")
-
-        price = closes[-1]
-        curr_st = st_line[-1]
-        curr_dir = st_dir[-1]
-        prev_dir = st_dir[-2] if len(st_dir) > 1 else 0
-        curr_vol_ratio = vol_ratio[-1]
-        curr_atr = atr_vals[-1]
+        return self._signal_from_values(
+            pair,
+            closes[-1],
+            st_line[-1],
+            st_dir[-1],
+            st_dir[-2] if len(st_dir) > 1 else 0,
+            vol_ratio[-1],
+            atr_vals[-1],
+            kwargs.get("round_trip_fee_pct"),
+        )
 
-        if np.isnan(curr_st) or curr_dir == 0 or prev_dir == 0:
+    def _signal_from_values(
+        self,
+        pair: str,
+        price: float,
+        curr_st: float,
+        curr_dir: float,
+        prev_dir: float,
+        curr_vol_ratio: float,
+        curr_atr: float,
+        fee_pct: Optional[float],
+    ) -> StrategySignal:
+        """Threshold logic on the last-bar Supertrend, volume and ATR values."""
+        if not math.isfinite(curr_st) or not curr_dir or not prev_dir:
             return self._neutral_signal(pair, "Indicators not converged")
-        if curr_atr <= 0:
+        if not curr_atr > 0:
             return self._neutral_signal(pair, "ATR is zero")
+        if not price > 0:
+            return self._neutral_signal(pair, "Invalid price")
 
         # Flip detection
         bullish_flip = prev_dir < 0 and curr_dir > 0
         bearish_flip = prev_dir > 0 and curr_dir < 0
         volume_confirmed = curr_vol_ratio >= self.volume_threshold
 
-        direction = SignalDirection.NEUTRAL
+        direction = NEUTRAL
         strength = 0.0
         confidence = 0.0
 
         # ---- LONG: bearish -> bullish flip ----
         if bullish_flip:
-            direction = SignalDirection.LONG
+            direction = LONG
             strength = 0.50
             confidence = 0.40
 
@@ -100,7 +120,7 @@ class SupertrendStrategy(BaseStrategy):
                 confidence -= 0.05
 
             # Supertrend distance from price (closer = tighter stop = better R:R)
-            st_dist_pct = abs(price - curr_st) / price if price > 0 else 0
+            st_dist_pct = abs(price - curr_st) / price
             if st_dist_pct < 0.02:
                 confidence += 0.08  # Tight natural stop
 
@@ -111,7 +131,7 @@ class SupertrendStrategy(BaseStrategy):
 
         # ---- SHORT: bullish -> bearish flip ----
         elif bearish_flip:
-            direction = SignalDirection.SHORT
+            direction = SHORT
             strength = 0.50
             confidence = 0.40
 
@@ -121,7 +141,7 @@ class SupertrendStrategy(BaseStrategy):
             else:
                 confidence -= 0.05
 
-            st_dist_pct = abs(price - curr_st) / price if price > 0 else 0
+            st_dist_pct = abs(price - curr_st) / price
             if st_dist_pct < 0.02:
                 confidence += 0.08
 
@@ -132,16 +152,16 @@ class SupertrendStrategy(BaseStrategy):
         # ---- SL/TP ----
         stop_loss = 0.0
         take_profit = 0.0
-        if direction != SignalDirection.NEUTRAL:
+        if direction != NEUTRAL:
             # SL at supertrend level (natural stop)
             st_sl = curr_st
             # Ensure minimum SL distance using compute_sl_tp floor
-            side = "long" if direction == SignalDirection.LONG else "short"
+            side = "long" if direction == LONG else "short"
             floor_sl, take_profit = compute_sl_tp(
                 price, curr_atr, side, sl_mult=2.0, tp_mult=3.5,
                 round_trip_fee_pct=fee_pct,
             )
-            if direction == SignalDirection.LONG:
+            if direction == LONG:
                 # SL = min of supertrend and floor (wider stop survives better)
                 stop_loss = min(st_sl, floor_sl)
             else:
@@ -151,19 +171,19 @@ class SupertrendStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "supertrend": round(float(curr_st), 4),
+                "supertrend": float(curr_st),
                 "direction_val": float(curr_dir),
                 "prev_direction": float(prev_dir),
                 "bullish_flip": bool(bullish_flip),
                 "bearish_flip": bool(bearish_flip),
-                "volume_ratio": round(float(curr_vol_ratio), 4),
+                "volume_ratio": float(curr_vol_ratio),
                 "volume_confirmed": bool(volume_confirmed),
-                "atr": round(float(curr_atr), 6),
+                "atr": float(curr_atr),
             },
         )
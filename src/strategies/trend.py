@@ -16,7 +16,7 @@ from typing import Any
 
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
 from src.utils.indicators import adx, atr, compute_sl_tp, ema, rsi, trend_strength
 
 
@@ -54,11 +54,12 @@ class TrendStrategy(BaseStrategy):
         self.ema_slow = ema_slow
         self.adx_threshold = adx_threshold
         self.require_fresh_cross = require_fresh_cross
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return max(self.ema_slow * 3, 50)
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -67,7 +68,7 @@ class TrendStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         cache = kwargs.get("indicator_cache")
@@ -125,7 +126,7 @@ class TrendStrategy(BaseStrategy):
             return self._neutral_signal(pair, "No fresh EMA cross")
 
         # Signal scoring
-        direction = SignalDirection.NEUTRAL
+        direction = NEUTRAL
         strength = 0.0
         confidence = 0.0
 
@@ -133,7 +134,7 @@ class TrendStrategy(BaseStrategy):
         # Require: EMA alignment + price above EMAs + ADX confirms trend + RSI not oversold
         if curr_ema_f > curr_ema_s and price_above_emas:
             if curr_adx >= self.adx_threshold and curr_rsi > 45 and curr_rsi < 75:
-                direction = SignalDirection.LONG
+                direction = LONG
 
                 # Base strength from crossover freshness
                 strength = 0.5 if bullish_cross else 0.3
@@ -165,7 +166,7 @@ class TrendStrategy(BaseStrategy):
         # -- SHORT SIGNAL --
         elif curr_ema_f < curr_ema_s and price_below_emas:
             if curr_adx >= self.adx_threshold and curr_rsi < 55 and curr_rsi > 25:
-                direction = SignalDirection.SHORT
+                direction = SHORT
 
                 strength = 0.5 if bearish_cross else 0.3
                 adx_bonus = min((curr_adx - self.adx_threshold) / 50, 0.2)
@@ -189,11 +190,11 @@ class TrendStrategy(BaseStrategy):
                     confidence += 0.1
 
         # Compute fee-aware stop loss and take profit
-        if direction == SignalDirection.LONG:
+        if direction == LONG:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "long", 2.25, 3.0, round_trip_fee_pct=fee_pct
             )
-        elif direction == SignalDirection.SHORT:
+        elif direction == SHORT:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "short", 2.25, 3.0, round_trip_fee_pct=fee_pct
             )
@@ -205,20 +206,20 @@ class TrendStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=curr_price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "ema_fast": round(curr_ema_f, 2),
-                "ema_slow": round(curr_ema_s, 2),
-                "adx": round(curr_adx, 2),
-                "rsi": round(curr_rsi, 2),
-                "atr": round(curr_atr, 4),
-                "trend_strength": round(curr_ts, 6),
-                "ema_spread": round(ema_spread, 6),
-                "volume_ratio": round(vol_ratio, 2),
+                "ema_fast": float(curr_ema_f),
+                "ema_slow": float(curr_ema_s),
+                "adx": float(curr_adx),
+                "rsi": float(curr_rsi),
+                "atr": float(curr_atr),
+                "trend_strength": float(curr_ts),
+                "ema_spread": float(ema_spread),
+                "volume_ratio": float(vol_ratio),
                 "bullish_cross": bullish_cross,
                 "bearish_cross": bearish_cross,
             }
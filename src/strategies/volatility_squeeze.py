@@ -16,9 +16,11 @@ SL: 2.5x ATR, TP: 4.0x ATR (wider R:R for momentum after squeeze)
 
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
 from src.utils.indicators import (
     atr,
     bollinger_bands,
@@ -28,6 +30,32 @@ from src.utils.indicators import (
 )
 
 
+# Bars compared per step when counting the squeeze run; squeezes rarely
+# outlast one window, so long histories are not scanned in full.
+_SQUEEZE_TAIL = 64
+
+
+def _trailing_squeeze_run(
+    bb_upper: np.ndarray,
+    bb_lower: np.ndarray,
+    kc_upper: np.ndarray,
+    kc_lower: np.ndarray,
+) -> int:
+    """Consecutive squeeze bars (BB inside KC) ending just before the last bar."""
+    count = 0
+    end = len(bb_upper) - 1
+    while end > 0:
+        start = max(0, end - _SQUEEZE_TAIL)
+        squeeze = (bb_upper[start:end] < kc_upper[start:end]) & (bb_lower[start:end] > kc_lower[start:end])
+        breaks = np.flatnonzero(~squeeze)
+        if breaks.size:
+            return count + int(end - start - 1 - breaks[-1])
+        # Whole window in squeeze: the run continues further back
+        count += end - start
+        end = start
+    return count
+
+
 class VolatilitySqueezeStrategy(BaseStrategy):
 
     def __init__(
@@ -52,11 +80,12 @@ class VolatilitySqueezeStrategy(BaseStrategy):
         self.momentum_period = momentum_period
         self.atr_period = atr_period
         self.min_squeeze_bars = min_squeeze_bars
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return max(self.bb_period, self.kc_ema_period) + self.momentum_period + 20
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -65,7 +94,7 @@ class VolatilitySqueezeStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs,
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         cache = kwargs.get("indicator_cache")
@@ -90,24 +119,17 @@ class VolatilitySqueezeStrategy(BaseStrategy):
         curr_atr = atr_vals[-1]
 
         # Validate convergence
-        for v in [bb_upper[-1], kc_upper[-1], mom_vals[-1]]:
-            if np.isnan(v):
-                return self._neutral_signal(pair, "Indicators not converged")
+        if any(map(math.isnan, (bb_upper[-1], kc_upper[-1], mom_vals[-1]))):
+            return self._neutral_signal(pair, "Indicators not converged")
         if curr_atr <= 0:
             return self._neutral_signal(pair, "ATR is zero")
 
-        # Detect squeeze: BB inside KC
-        squeeze = (bb_upper < kc_upper) & (bb_lower > kc_lower)
-
-        # Count consecutive squeeze bars ending before current bar
-        # Current bar should NOT be in squeeze (= squeeze just released)
-        curr_in_squeeze = bool(squeeze[-1])
+        # Squeeze = BB inside KC.  Current bar should NOT be in squeeze
+        # (= squeeze just released); only then does the prior run matter.
+        curr_in_squeeze = bool(bb_upper[-1] < kc_upper[-1] and bb_lower[-1] > kc_lower[-1])
         prev_squeeze_count = 0
-        for i in range(len(squeeze) - 2, -1, -1):
-            if squeeze[i]:
-                prev_squeeze_count += 1
-            else:
-                break
+        if not curr_in_squeeze:
+            prev_squeeze_count = _trailing_squeeze_run(bb_upper, bb_lower, kc_upper, kc_lower)
 
         squeeze_just_released = not curr_in_squeeze and prev_squeeze_count >= self.min_squeeze_bars
 
@@ -125,7 +147,7 @@ class VolatilitySqueezeStrategy(BaseStrategy):
         mom_accel_up = (curr_mom - prev_mom) > (prev_mom - prev_mom2)
         mom_accel_down = (curr_mom - prev_mom) < (prev_mom - prev_mom2)
 
-        direction = SignalDirection.NEUTRAL
+        direction = NEUTRAL
         strength = 0.0
         confidence = 0.0
 
@@ -138,7 +160,7 @@ class VolatilitySqueezeStrategy(BaseStrategy):
             if not (long_price_break or long_momentum_persist):
                 return self._neutral_signal(pair, "Weak long squeeze release")
 
-            direction = SignalDirection.LONG
+            direction = LONG
             strength = 0.50
             confidence = 0.45
 
@@ -168,7 +190,7 @@ class VolatilitySqueezeStrategy(BaseStrategy):
             if not (short_price_break or short_momentum_persist):
                 return self._neutral_signal(pair, "Weak short squeeze release")
 
-            direction = SignalDirection.SHORT
+            direction = SHORT
             strength = 0.50
             confidence = 0.45
 
@@ -189,8 +211,8 @@ class VolatilitySqueezeStrategy(BaseStrategy):
         # ---- SL/TP ----
         stop_loss = 0.0
         take_profit = 0.0
-        if direction != SignalDirection.NEUTRAL:
-            side = "long" if direction == SignalDirection.LONG else "short"
+        if direction != NEUTRAL:
+            side = "long" if direction == LONG else "short"
             stop_loss, take_profit = compute_sl_tp(
                 price, curr_atr, side, sl_mult=2.5, tp_mult=4.0,
                 round_trip_fee_pct=fee_pct,
@@ -200,21 +222,21 @@ class VolatilitySqueezeStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
                 "squeeze_bars": prev_squeeze_count,
                 "squeeze_released": bool(squeeze_just_released),
-                "momentum": round(float(curr_mom), 6),
+                "momentum": float(curr_mom),
                 "momentum_rising": bool(mom_rising),
                 "momentum_falling": bool(mom_falling),
-                "bb_upper": round(float(bb_upper[-1]), 4),
-                "bb_lower": round(float(bb_lower[-1]), 4),
-                "kc_upper": round(float(kc_upper[-1]), 4),
-                "kc_lower": round(float(kc_lower[-1]), 4),
-                "atr": round(float(curr_atr), 6),
+                "bb_upper": float(bb_upper[-1]),
+                "bb_lower": float(bb_lower[-1]),
+                "kc_upper": float(kc_upper[-1]),
+                "kc_lower": float(kc_lower[-1]),
+                "atr": float(curr_atr),
             },
         )
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import numpy as np
 
-from src.strategies.base import BaseStrategy, SignalDirection, StrategySignal
+from src.strategies.base import LONG, NEUTRAL, SHORT, BaseStrategy, StrategySignal
 from src.utils.indicators import atr, compute_sl_tp, momentum, volume_ratio
 
 
@@ -90,11 +90,12 @@ class VWAPMomentumAlphaStrategy(BaseStrategy):
         self.pullback_z_high_vol_adjust = pullback_z_high_vol_adjust
         self.pullback_z_low_vol_adjust = pullback_z_low_vol_adjust
         self.slope_min_pct = slope_min_pct
+        self._min_bars = self.min_bars_required()
 
     def min_bars_required(self) -> int:
         return max(self.vwap_window + self.slope_period + 5, 50)
 
-    async def analyze(
+    def analyze(
         self,
         pair: str,
         closes: np.ndarray,
@@ -103,7 +104,7 @@ class VWAPMomentumAlphaStrategy(BaseStrategy):
         volumes: np.ndarray,
         **kwargs
     ) -> StrategySignal:
-        if len(closes) < self.min_bars_required():
+        if len(closes) < self._min_bars:
             return self._neutral_signal(pair, "Insufficient data")
 
         cache = kwargs.get("indicator_cache")
@@ -161,12 +162,12 @@ class VWAPMomentumAlphaStrategy(BaseStrategy):
         pullback_long = trend_up and zscore <= -pullback_z
         pullback_short = trend_down and zscore >= pullback_z
 
-        direction = SignalDirection.NEUTRAL
+        direction = NEUTRAL
         strength = 0.0
         confidence = 0.0
 
         if pullback_long:
-            direction = SignalDirection.LONG
+            direction = LONG
             strength = 0.35 + min(abs(zscore) / max(self.band_std, 1e-6), 0.3)
             if curr_vol_ratio >= self.volume_multiplier:
                 strength += 0.1
@@ -184,7 +185,7 @@ class VWAPMomentumAlphaStrategy(BaseStrategy):
                 confidence += 0.1
 
         elif pullback_short:
-            direction = SignalDirection.SHORT
+            direction = SHORT
             strength = 0.35 + min(abs(zscore) / max(self.band_std, 1e-6), 0.3)
             if curr_vol_ratio >= self.volume_multiplier:
                 strength += 0.1
@@ -201,11 +202,11 @@ class VWAPMomentumAlphaStrategy(BaseStrategy):
             if zscore > 1.0:
                 confidence += 0.1
 
-        if direction == SignalDirection.LONG:
+        if direction == LONG:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "long", 2.0, 3.0, round_trip_fee_pct=fee_pct
             )
-        elif direction == SignalDirection.SHORT:
+        elif direction == SHORT:
             stop_loss, take_profit = compute_sl_tp(
                 curr_price, curr_atr, "short", 2.0, 3.0, round_trip_fee_pct=fee_pct
             )
@@ -217,20 +218,20 @@ class VWAPMomentumAlphaStrategy(BaseStrategy):
             strategy_name=self.name,
             pair=pair,
             direction=direction,
-            strength=min(strength, 1.0),
-            confidence=min(confidence, 1.0),
+            strength=strength,
+            confidence=confidence,
             entry_price=curr_price,
             stop_loss=stop_loss,
             take_profit=take_profit,
             metadata={
-                "vwap": round(curr_vwap, 6),
-                "vwap_std": round(curr_std, 6),
-                "zscore": round(zscore, 4),
-                "vwap_slope": round(vwap_slope, 6),
-                "slope_pct": round(slope_pct, 6),
-                "volume_ratio": round(curr_vol_ratio, 2),
-                "momentum": round(curr_mom, 6),
-                "pullback_z": round(pullback_z, 4),
+                "vwap": float(curr_vwap),
+                "vwap_std": float(curr_std),
+                "zscore": float(zscore),
+                "vwap_slope": float(vwap_slope),
+                "slope_pct": float(slope_pct),
+                "volume_ratio": float(curr_vol_ratio),
+                "momentum": float(curr_mom),
+                "pullback_z": float(pullback_z),
                 "trend_regime": trend_regime,
                 "vol_regime": vol_regime,
             },
@@ -20,6 +20,7 @@ from src.utils.indicators import (
     ema,
     garman_klass_volatility,
     ichimoku,
+    ichimoku_signals,
     keltner_channels,
     keltner_position,
     macd,
@@ -43,6 +44,7 @@ class IndicatorCache:
         lows: np.ndarray,
         volumes: np.ndarray,
         opens: Optional[np.ndarray] = None,
+        atr_buffers: Optional[Dict[int, np.ndarray]] = None,
     ):
         self.closes = closes
         self.highs = highs
@@ -53,6 +55,9 @@ class IndicatorCache:
         self._ema: Dict[int, np.ndarray] = {}
         self._rsi: Dict[int, np.ndarray] = {}
         self._atr: Dict[int, np.ndarray] = {}
+        # Caller-owned ATR output buffers keyed by period, reused across
+        # scans of the same series so atr() writes in place.
+        self._atr_buffers = atr_buffers
         self._adx: Dict[int, np.ndarray] = {}
         self._vol_ratio: Dict[int, np.ndarray] = {}
         self._momentum: Dict[int, np.ndarray] = {}
@@ -67,6 +72,7 @@ class IndicatorCache:
         self._stochastic: Dict[Tuple[int, int, int], Tuple[np.ndarray, np.ndarray]] = {}
         self._supertrend: Dict[Tuple[int, float], Tuple[np.ndarray, np.ndarray]] = {}
         self._ichimoku: Dict[Tuple[int, int, int], Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._ichimoku_signals: Dict[Tuple[int, int, int], Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = {}
         self._choppiness: Dict[int, np.ndarray] = {}
 
     def ema(self, period: int) -> np.ndarray:
@@ -81,7 +87,13 @@ class IndicatorCache:
 
     def atr(self, period: int = 14) -> np.ndarray:
         if period not in self._atr:
-            self._atr[period] = atr(self.highs, self.lows, self.closes, period)
+            out = None
+            if self._atr_buffers is not None:
+                out = self._atr_buffers.get(period)
+                if out is None or out.shape != self.closes.shape:
+                    out = np.empty(len(self.closes), dtype=np.float64)
+                    self._atr_buffers[period] = out
+            self._atr[period] = atr(self.highs, self.lows, self.closes, period, out=out)
         return self._atr[period]
 
     def adx(self, period: int = 14) -> np.ndarray:
@@ -195,6 +207,17 @@ class IndicatorCache:
             )
         return self._ichimoku[key]
 
+    def ichimoku_signals(
+        self, tenkan: int = 9, kijun: int = 26, senkou_b: int = 52
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        key = (tenkan, kijun, senkou_b)
+        if key not in self._ichimoku_signals:
+            tenkan_sen, kijun_sen, _, _, chikou = self.ichimoku(tenkan, kijun, senkou_b)
+            self._ichimoku_signals[key] = ichimoku_signals(
+                tenkan_sen, kijun_sen, chikou, self.closes, kijun
+            )
+        return self._ichimoku_signals[key]
+
     def choppiness(self, period: int = 14) -> np.ndarray:
         if period not in self._choppiness:
             self._choppiness[period] = choppiness_index(
@@ -15,6 +15,15 @@ from typing import Optional, Tuple
 
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional: kernels run as plain Python loops
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (bare or with arguments)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
 
 # ---- Fee-aware SL/TP Calculation ----
 
@@ -66,24 +75,15 @@ def compute_sl_tp(
         return (price + sl_dist, price - tp_dist)
 
 
-def ema(data: np.ndarray, period: int) -> np.ndarray:
-    """
-    Exponential Moving Average — NaN-safe implementation.
-    
-    Skips leading NaN values and starts the EMA from the first
-    valid data window. This allows chaining EMAs (e.g., MACD signal
-    line = EMA of EMA) without NaN propagation.
-    """
-    if len(data) < period:
-        return np.full_like(data, np.nan, dtype=float)
-
-    result = np.full(len(data), np.nan, dtype=float)
+@njit("void(float64[:], int64, float64[:])", nogil=True, cache=True)
+def _ema_kernel(data, period, out):  # pragma: no cover - body runs compiled
+    n = data.shape[0]
     alpha = 2.0 / (period + 1)
 
     # Find the first index where we have `period` consecutive non-NaN values
     start = -1
     count = 0
-    for i in range(len(data)):
+    for i in range(n):
         if np.isnan(data[i]):
             count = 0
         else:
@@ -93,19 +93,36 @@ def ema(data: np.ndarray, period: int) -> np.ndarray:
                 break
 
     if start < 0:
-        return result  # Not enough valid data
+        return  # Not enough valid data
 
-    # Initialize from the first valid window
+    # Initialize from the first valid window (NaN-free by construction)
     seed_end = start + period
-    result[seed_end - 1] = np.nanmean(data[start:seed_end])
+    total = 0.0
+    for i in range(start, seed_end):
+        total += data[i]
+    out[seed_end - 1] = total / period
 
     # Propagate forward
-    for i in range(seed_end, len(data)):
+    for i in range(seed_end, n):
         if np.isnan(data[i]):
-            result[i] = result[i - 1]  # Hold previous value through NaN gaps
+            out[i] = out[i - 1]  # Hold previous value through NaN gaps
         else:
-            result[i] = alpha * data[i] + (1 - alpha) * result[i - 1]
+            out[i] = alpha * data[i] + (1 - alpha) * out[i - 1]
 
+
+def ema(data: np.ndarray, period: int) -> np.ndarray:
+    """
+    Exponential Moving Average — NaN-safe implementation.
+    
+    Skips leading NaN values and starts the EMA from the first
+    valid data window. This allows chaining EMAs (e.g., MACD signal
+    line = EMA of EMA) without NaN propagation.
+    """
+    if len(data) < period:
+        return np.full_like(data, np.nan, dtype=float)
+
+    result = np.full(len(data), np.nan, dtype=float)
+    _ema_kernel(np.asarray(data, dtype=np.float64), int(period), result)
     return result
 
 
@@ -121,6 +138,33 @@ def sma(data: np.ndarray, period: int) -> np.ndarray:
     return result  # L11 FIX: removed redundant slice
 
 
+@njit("void(float64[:], float64[:], int64, float64[:])", nogil=True, cache=True)
+def _rsi_kernel(gains, losses, period, out):  # pragma: no cover - body runs compiled
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(period):
+        avg_gain += gains[i]
+        avg_loss += losses[i]
+    avg_gain /= period
+    avg_loss /= period
+
+    if avg_loss == 0:
+        out[period] = 100.0
+    else:
+        rs = avg_gain / avg_loss
+        out[period] = 100.0 - (100.0 / (1.0 + rs))
+
+    for i in range(period, gains.shape[0]):
+        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
+        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
+
+        if avg_loss == 0:
+            out[i + 1] = 100.0
+        else:
+            rs = avg_gain / avg_loss
+            out[i + 1] = 100.0 - (100.0 / (1.0 + rs))
+
+
 def rsi(closes: np.ndarray, period: int = 14) -> np.ndarray:
     """
     Relative Strength Index.
@@ -133,31 +177,12 @@ def rsi(closes: np.ndarray, period: int = 14) -> np.ndarray:
     if len(closes) < period + 1:
         return np.full(len(closes), np.nan)
 
-    deltas = np.diff(closes)
+    deltas = np.diff(np.asarray(closes, dtype=np.float64))
     gains = np.where(deltas > 0, deltas, 0.0)
     losses = np.where(deltas < 0, -deltas, 0.0)
 
     result = np.full(len(closes), np.nan)
-
-    avg_gain = np.mean(gains[:period])
-    avg_loss = np.mean(losses[:period])
-
-    if avg_loss == 0:
-        result[period] = 100.0
-    else:
-        rs = avg_gain / avg_loss
-        result[period] = 100.0 - (100.0 / (1.0 + rs))
-
-    for i in range(period, len(deltas)):
-        avg_gain = (avg_gain * (period - 1) + gains[i]) / period
-        avg_loss = (avg_loss * (period - 1) + losses[i]) / period
-
-        if avg_loss == 0:
-            result[i + 1] = 100.0
-        else:
-            rs = avg_gain / avg_loss
-            result[i + 1] = 100.0 - (100.0 / (1.0 + rs))
-
+    _rsi_kernel(gains, losses, int(period), result)
     return result
 
 
@@ -270,33 +295,50 @@ def adx(
 
 
 def atr(
-    highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    period: int = 14,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Average True Range - measures volatility.
-    
-    # ENHANCEMENT: Added percentage-based ATR option
-    """
-    if len(closes) < 2:
-        return np.full(len(closes), 0.0)
-
-    tr = np.maximum(
-        highs[1:] - lows[1:],
-        np.maximum(
-            np.abs(highs[1:] - closes[:-1]),
-            np.abs(lows[1:] - closes[:-1])
-        )
-    )
 
-    result = np.full(len(closes), np.nan)
-    if len(tr) >= period:
-        result[period] = np.mean(tr[:period])
-        for i in range(period + 1, len(closes)):
-            idx = i - 1
-            if idx < len(tr):
-                result[i] = (result[i - 1] * (period - 1) + tr[idx]) / period
+    When ``out`` is given (a float64 array shaped like ``closes``) the
+    result is written into it and returned, so callers that recompute
+    ATR every scan can reuse one buffer instead of allocating per call.
 
-    return np.nan_to_num(result, nan=0.0)
+    # ENHANCEMENT: Added percentage-based ATR option
+    """
+    n = len(closes)
+    if out is None:
+        out = np.empty(n, dtype=np.float64)
+    elif out.shape != (n,):
+        raise ValueError(f"out must have shape ({n},), got {out.shape}")
+    out.fill(0.0)
+    if n < 2 or n - 1 < period:
+        return out
+
+    # True range built in place: tr = max(h - l, |h - c_prev|, |l - c_prev|)
+    prev_close = closes[:-1]
+    tr = np.subtract(highs[1:], lows[1:])
+    gap = np.subtract(highs[1:], prev_close)
+    np.abs(gap, out=gap)
+    np.maximum(tr, gap, out=tr)
+    np.subtract(lows[1:], prev_close, out=gap)
+    np.abs(gap, out=gap)
+    np.maximum(tr, gap, out=tr)
+
+    value = float(np.mean(tr[:period]))
+    smoothed = [value]
+    append = smoothed.append
+    for tr_i in tr[period:].tolist():
+        value = (value * (period - 1) + tr_i) / period
+        append(value)
+    out[period:] = smoothed
+
+    np.nan_to_num(out, copy=False, nan=0.0)
+    return out
 
 
 def atr_percent(
@@ -576,10 +618,15 @@ def stochastic(
         else:
             raw_k[i] = 50.0  # No range — neutral
 
-    # %K = smoothed raw_k
-    pct_k = sma(raw_k, smooth)
-    # %D = SMA of %K
-    pct_d = sma(pct_k, d_period)
+    # %K = smoothed raw_k, %D = SMA of %K.  Each SMA runs over the series
+    # from its first defined bar: sma() is cumsum-based, so a leading NaN
+    # would otherwise turn every later value into NaN.
+    pct_k = np.full(n, np.nan)
+    k_start = k_period - 1
+    pct_k[k_start:] = sma(raw_k[k_start:], smooth)
+    pct_d = np.full(n, np.nan)
+    d_start = min(k_start + smooth - 1, n)
+    pct_d[d_start:] = sma(pct_k[d_start:], d_period)
 
     return pct_k, pct_d
 
@@ -588,69 +635,83 @@ def stochastic(
 # Supertrend
 # ------------------------------------------------------------------
 
-def supertrend(
-    highs: np.ndarray,
-    lows: np.ndarray,
-    closes: np.ndarray,
-    period: int = 10,
-    multiplier: float = 3.0,
-) -> Tuple[np.ndarray, np.ndarray]:
-    """Supertrend indicator: (supertrend_line, direction).
-
-    direction: +1 = bullish (price above supertrend), -1 = bearish.
+@njit(
+    "void(float64[:], float64[:], float64[:], int64, float64, float64[:], float64[:])",
+    nogil=True,
+    cache=True,
+)
+def _supertrend_kernel(hl2, closes, atr_vals, period, multiplier, st_line, direction):  # pragma: no cover - body runs compiled
     """
-    n = len(closes)
-    if n < period + 1:
-        return np.full(n, np.nan), np.full(n, 0.0)
-
-    atr_vals = atr(highs, lows, closes, period)
-
-    upper_band = np.full(n, np.nan)
-    lower_band = np.full(n, np.nan)
-    st_line = np.full(n, np.nan)
-    direction = np.full(n, 0.0)
-
-    hl2 = (highs + lows) / 2.0
+    Single pass over the bands, direction and line from bar ``period`` on.
 
+    Band i only depends on band i-1, and direction i on band i, so the
+    tightening rules and the flip logic share one loop.  ``min``/``max``
+    are spelled out to keep the builtins' NaN handling.
+    """
+    n = closes.shape[0]
+    prev_upper = np.nan
+    prev_lower = np.nan
     for i in range(period, n):
         a = atr_vals[i]
         if a <= 0 or np.isnan(a):
-            upper_band[i] = upper_band[i - 1] if i > 0 else hl2[i]
-            lower_band[i] = lower_band[i - 1] if i > 0 else hl2[i]
+            upper = prev_upper if i > 0 else hl2[i]
+            lower = prev_lower if i > 0 else hl2[i]
         else:
             basic_upper = hl2[i] + multiplier * a
             basic_lower = hl2[i] - multiplier * a
 
             # Upper band: only moves down (tightens), never up
-            prev_upper = upper_band[i - 1]
-            if np.isnan(prev_upper):
-                upper_band[i] = basic_upper
+            if np.isnan(prev_upper) or not closes[i - 1] <= prev_upper:
+                upper = basic_upper
             else:
-                upper_band[i] = min(basic_upper, prev_upper) if closes[i - 1] <= prev_upper else basic_upper
+                upper = prev_upper if prev_upper < basic_upper else basic_upper
 
             # Lower band: only moves up (tightens), never down
-            prev_lower = lower_band[i - 1]
-            if np.isnan(prev_lower):
-                lower_band[i] = basic_lower
+            if np.isnan(prev_lower) or not closes[i - 1] >= prev_lower:
+                lower = basic_lower
             else:
-                lower_band[i] = max(basic_lower, prev_lower) if closes[i - 1] >= prev_lower else basic_lower
+                lower = prev_lower if prev_lower > basic_lower else basic_lower
 
-    # Compute direction and supertrend line
-    for i in range(period, n):
         if i == period:
-            # Initialize: bullish if close > upper_band
-            direction[i] = 1.0 if closes[i] > upper_band[i] else -1.0
+            # Initialize: bullish if close > upper band
+            d = 1.0 if closes[i] > upper else -1.0
+        elif direction[i - 1] > 0:
+            # Was bullish — stay bullish unless close drops below lower band
+            d = -1.0 if closes[i] < lower else 1.0
         else:
-            prev_dir = direction[i - 1]
-            if prev_dir > 0:
-                # Was bullish — stay bullish unless close drops below lower band
-                direction[i] = -1.0 if closes[i] < lower_band[i] else 1.0
-            else:
-                # Was bearish — stay bearish unless close rises above upper band
-                direction[i] = 1.0 if closes[i] > upper_band[i] else -1.0
+            # Was bearish — stay bearish unless close rises above upper band
+            d = 1.0 if closes[i] > upper else -1.0
 
-        st_line[i] = lower_band[i] if direction[i] > 0 else upper_band[i]
+        direction[i] = d
+        st_line[i] = lower if d > 0 else upper
+        prev_upper = upper
+        prev_lower = lower
 
+
+def supertrend(
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    period: int = 10,
+    multiplier: float = 3.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Supertrend indicator: (supertrend_line, direction).
+
+    direction: +1 = bullish (price above supertrend), -1 = bearish.
+    """
+    n = len(closes)
+    if n < period + 1:
+        return np.full(n, np.nan), np.full(n, 0.0)
+
+    atr_vals = atr(highs, lows, closes, period)
+
+    st_line = np.full(n, np.nan)
+    direction = np.full(n, 0.0)
+    hl2 = (np.asarray(highs, dtype=np.float64) + np.asarray(lows, dtype=np.float64)) / 2.0
+    _supertrend_kernel(
+        hl2, np.asarray(closes, dtype=np.float64), atr_vals,
+        int(period), float(multiplier), st_line, direction,
+    )
     return st_line, direction
 
 
@@ -658,6 +719,47 @@ def supertrend(
 # Ichimoku Kinko Hyo
 # ------------------------------------------------------------------
 
+@njit("void(float64[:], float64[:], int64, float64[:])", nogil=True, cache=True)
+def _rolling_midpoint_kernel(highs, lows, period, out):  # pragma: no cover - body runs compiled
+    """
+    out[i] = (max(highs[i-period+1:i+1]) + min(lows[i-period+1:i+1])) / 2.
+
+    O(N) via monotonic index deques (fixed int arrays, each index pushed
+    once). Windows touching a NaN stay NaN, matching np.max / np.min.
+    """
+    n = highs.shape[0]
+    if period < 1:
+        return
+    max_q = np.empty(n, dtype=np.int64)
+    min_q = np.empty(n, dtype=np.int64)
+    max_head = max_tail = 0
+    min_head = min_tail = 0
+    last_nan = -1
+    for i in range(n):
+        h = highs[i]
+        lo = lows[i]
+        if np.isnan(h) or np.isnan(lo):
+            last_nan = i
+        else:
+            while max_tail > max_head and highs[max_q[max_tail - 1]] <= h:
+                max_tail -= 1
+            max_q[max_tail] = i
+            max_tail += 1
+            while min_tail > min_head and lows[min_q[min_tail - 1]] >= lo:
+                min_tail -= 1
+            min_q[min_tail] = i
+            min_tail += 1
+
+        lo_idx = i - period + 1
+        if lo_idx < 0 or last_nan >= lo_idx:
+            continue
+        while max_q[max_head] < lo_idx:
+            max_head += 1
+        while min_q[min_head] < lo_idx:
+            min_head += 1
+        out[i] = (highs[max_q[max_head]] + lows[min_q[min_head]]) / 2.0
+
+
 def ichimoku(
     highs: np.ndarray,
     lows: np.ndarray,
@@ -672,32 +774,22 @@ def ichimoku(
     represent current cloud boundaries for use in real-time trading decisions.
     Chikou span is the close shifted back by `kijun` periods.
     """
+    highs = np.asarray(highs, dtype=np.float64)
+    lows = np.asarray(lows, dtype=np.float64)
+    closes = np.asarray(closes, dtype=np.float64)
+    if highs.shape != lows.shape or highs.shape != closes.shape:
+        raise ValueError("highs, lows and closes must have the same shape")
     n = len(closes)
+
     tenkan_sen = np.full(n, np.nan)
     kijun_sen = np.full(n, np.nan)
-
-    for i in range(tenkan - 1, n):
-        hh = np.max(highs[i - tenkan + 1:i + 1])
-        ll = np.min(lows[i - tenkan + 1:i + 1])
-        tenkan_sen[i] = (hh + ll) / 2.0
-
-    for i in range(kijun - 1, n):
-        hh = np.max(highs[i - kijun + 1:i + 1])
-        ll = np.min(lows[i - kijun + 1:i + 1])
-        kijun_sen[i] = (hh + ll) / 2.0
-
-    # Senkou Span A = (Tenkan + Kijun) / 2
-    senkou_a = np.full(n, np.nan)
-    for i in range(n):
-        if not np.isnan(tenkan_sen[i]) and not np.isnan(kijun_sen[i]):
-            senkou_a[i] = (tenkan_sen[i] + kijun_sen[i]) / 2.0
-
-    # Senkou Span B = midpoint of highest high and lowest low over senkou_b periods
     senkou_b_arr = np.full(n, np.nan)
-    for i in range(senkou_b - 1, n):
-        hh = np.max(highs[i - senkou_b + 1:i + 1])
-        ll = np.min(lows[i - senkou_b + 1:i + 1])
-        senkou_b_arr[i] = (hh + ll) / 2.0
+    _rolling_midpoint_kernel(highs, lows, int(tenkan), tenkan_sen)
+    _rolling_midpoint_kernel(highs, lows, int(kijun), kijun_sen)
+    _rolling_midpoint_kernel(highs, lows, int(senkou_b), senkou_b_arr)
+
+    # Senkou Span A = (Tenkan + Kijun) / 2 (NaN until both converge)
+    senkou_a = (tenkan_sen + kijun_sen) / 2.0
 
     # Chikou Span = close shifted back by kijun periods
     chikou = np.full(n, np.nan)
@@ -707,6 +799,40 @@ def ichimoku(
     return tenkan_sen, kijun_sen, senkou_a, senkou_b_arr, chikou
 
 
+def ichimoku_signals(
+    tenkan_sen: np.ndarray,
+    kijun_sen: np.ndarray,
+    chikou: np.ndarray,
+    closes: np.ndarray,
+    kijun: int = 26,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Per-bar Ichimoku events: (tk_bull_cross, tk_bear_cross, chikou_bull, chikou_bear).
+
+    Index i describes bar i: a TK cross between bars i-1 and i, and the
+    chikou value that lands on bar i (``chikou[i - kijun]`` vs the close it
+    is plotted against). NaN comparisons are False, as in scalar checks.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    n = len(closes)
+    tk_bull = np.zeros(n, dtype=bool)
+    tk_bear = np.zeros(n, dtype=bool)
+    if n > 1:
+        prev_t, prev_k = tenkan_sen[:-1], kijun_sen[:-1]
+        curr_t, curr_k = tenkan_sen[1:], kijun_sen[1:]
+        tk_bull[1:] = (prev_t <= prev_k) & (curr_t > curr_k)
+        tk_bear[1:] = (prev_t >= prev_k) & (curr_t < curr_k)
+
+    chikou_bull = np.zeros(n, dtype=bool)
+    chikou_bear = np.zeros(n, dtype=bool)
+    if 0 <= kijun < n:
+        lagged_chikou = chikou[:n - kijun]
+        lagged_close = closes[:n - kijun]
+        chikou_bull[kijun:] = lagged_chikou > lagged_close
+        chikou_bear[kijun:] = lagged_chikou < lagged_close
+
+    return tk_bull, tk_bear, chikou_bull, chikou_bear
+
+
 def choppiness_index(
     highs: np.ndarray, lows: np.ndarray, closes: np.ndarray, period: int = 14
 ) -> np.ndarray:
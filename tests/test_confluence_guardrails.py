@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import time
 
+import numpy as np
+
 from src.ai.confluence import ConfluenceDetector
 from src.exchange.market_data import MarketDataCache
 
@@ -54,3 +56,14 @@ def test_runtime_guardrail_disables_temporarily(monkeypatch):
     monkeypatch.setattr("src.ai.confluence.time.time", lambda: now + 120.0)
     second = _get_strategy_row(detector, "keltner")
     assert second.get("runtime_disabled") is False
+
+
+def test_forget_pairs_releases_atr_buffers():
+    detector = ConfluenceDetector(market_data=MarketDataCache(max_bars=64))
+    for pair in ("BTC/USD", "ETH/USD"):
+        for tf in (1, 5):
+            detector._atr_buffers.setdefault((pair, tf), {})[14] = np.zeros(64)
+
+    detector.forget_pairs({"ETH/USD", "SOL/USD"})
+
+    assert sorted(detector._atr_buffers) == [("BTC/USD", 1), ("BTC/USD", 5)]
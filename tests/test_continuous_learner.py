@@ -0,0 +1,148 @@
+"""Tests for ContinuousLearner online updates and persistence."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+
+from src.ml.continuous_learner import ContinuousLearner, ContinuousStats
+
+FEATURES = ["rsi", "ema_ratio", "volume_ratio"]
+
+
+def _make_learner(tmp_path, **kwargs) -> ContinuousLearner:
+    defaults = {
+        "model_path": str(tmp_path / "cl.joblib"),
+        "feature_names": FEATURES,
+        "save_every_updates": 5,
+        "min_updates_before_predict": 5,
+    }
+    defaults.update(kwargs)
+    return ContinuousLearner(**defaults)
+
+
+def _sample(i: int) -> tuple[dict, float]:
+    win = i % 2 == 0
+    feats = {"rsi": 60.0 if win else 40.0, "ema_ratio": 1.01 if win else 0.99, "volume_ratio": 1.0 + i * 0.01}
+    return feats, 1.0 if win else -1.0
+
+
+@pytest.mark.asyncio
+async def test_predict_requires_min_updates(tmp_path):
+    learner = _make_learner(tmp_path)
+    assert await learner.predict_proba({"rsi": 50.0}) is None
+    for i in range(4):
+        await learner.update(*_sample(i))
+    assert await learner.predict_proba({"rsi": 50.0}) is None
+    await learner.update(*_sample(4))
+    p = await learner.predict_proba({"rsi": 60.0, "ema_ratio": 1.01, "volume_ratio": 1.0})
+    assert p is not None and 0.0 <= p <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_periodic_save_persists_and_reloads(tmp_path):
+    learner = _make_learner(tmp_path)
+    for i in range(10):
+        await learner.update(*_sample(i))
+    assert learner.model_path.exists()
+    assert learner.stats.last_saved_ts > 0
+    assert learner.stats.last_update_ts > 0
+
+    reloaded = _make_learner(tmp_path)
+    assert reloaded.stats.updates == 10
+    assert await reloaded.predict_proba({"rsi": 60.0}) is not None
+
+
+@pytest.mark.asyncio
+async def test_tampered_model_is_not_loaded(tmp_path):
+    learner = _make_learner(tmp_path)
+    for i in range(5):
+        await learner.update(*_sample(i))
+    await learner.force_save()
+    with open(learner.model_path, "ab") as f:
+        f.write(b"tampered")
+
+    reloaded = _make_learner(tmp_path)
+    assert reloaded.stats.updates == 0
+
+
+@pytest.mark.asyncio
+async def test_non_finite_features_are_zeroed(tmp_path):
+    learner = _make_learner(tmp_path)
+    x = learner._vectorize({"rsi": float("nan"), "ema_ratio": float("inf"), "volume_ratio": "bad"})
+    assert x.shape == (1, len(FEATURES))
+    assert not x.any()
+
+
+def _sklearn_reference(n: int):
+    sklearn_linear = pytest.importorskip("sklearn.linear_model")
+    sklearn_pre = pytest.importorskip("sklearn.preprocessing")
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(n, len(FEATURES))) * [1.0, 5.0, 0.1] + [0.0, 2.0, 1.0]
+    Y = (X[:, 0] + 0.2 * X[:, 1] + rng.normal(size=n) > 0.4).astype(np.int64)
+    scaler = sklearn_pre.StandardScaler()
+    model = sklearn_linear.SGDClassifier(
+        loss="log_loss", alpha=0.0005, penalty="l2", learning_rate="optimal", random_state=42,
+    )
+    for i, (x, y) in enumerate(zip(X, Y)):
+        row = x.reshape(1, -1).astype(np.float32)
+        if i < ContinuousLearner._SCALER_WARMUP_SAMPLES:
+            scaler.partial_fit(row)
+        model.partial_fit(scaler.transform(row), [y], classes=[0, 1])
+    return X, Y, scaler, model
+
+
+@pytest.mark.asyncio
+async def test_matches_sklearn_sgd_reference(tmp_path):
+    X, Y, scaler, model = _sklearn_reference(250)
+    learner = _make_learner(tmp_path, save_every_updates=10_000)
+    for x, y in zip(X, Y):
+        await learner.update(dict(zip(FEATURES, x)), 1.0 if y else -1.0)
+
+    for x in X[:10]:
+        expected = model.predict_proba(scaler.transform(x.reshape(1, -1).astype(np.float32)))[0, 1]
+        got = await learner.predict_proba(dict(zip(FEATURES, x)))
+        assert got == pytest.approx(expected, abs=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_loads_legacy_sklearn_checkpoint(tmp_path):
+    joblib = pytest.importorskip("joblib")
+    X, _, scaler, model = _sklearn_reference(60)
+    path = tmp_path / "cl.joblib"
+    joblib.dump({"scaler": scaler, "model": model, "stats": ContinuousStats(seen=60, updates=60)}, path)
+
+    learner = _make_learner(tmp_path)
+    assert learner.stats.updates == 60
+    expected = model.predict_proba(scaler.transform(X[:1].astype(np.float32)))[0, 1]
+    got = await learner.predict_proba(dict(zip(FEATURES, X[0])))
+    assert got == pytest.approx(expected, abs=1e-5)
+
+
+@pytest.mark.asyncio
+async def test_predict_not_blocked_by_inflight_save(tmp_path, monkeypatch):
+    learner = _make_learner(tmp_path, save_every_updates=5, min_updates_before_predict=1)
+    release = threading.Event()
+    entered = threading.Event()
+
+    def _slow_save(payload, path, durable=False):
+        entered.set()
+        release.wait(timeout=5)
+        return None
+
+    monkeypatch.setattr(learner, "_save_payload", _slow_save)
+    for i in range(4):
+        await learner.update(*_sample(i))
+    saving = asyncio.create_task(learner.update(*_sample(4)))
+    try:
+        await asyncio.wait_for(asyncio.to_thread(entered.wait, 5), timeout=5)
+        p = await asyncio.wait_for(learner.predict_proba({"rsi": 60.0}), timeout=1)
+        assert p is not None
+        await asyncio.wait_for(learner.update(*_sample(5)), timeout=1)
+        assert learner.stats.updates == 6
+    finally:
+        release.set()
+        await saving
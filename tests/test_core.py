@@ -38,18 +38,23 @@ from src.strategies.reversal import ReversalStrategy
 from src.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
 from src.strategies.trend import TrendStrategy
 from src.strategies.vwap_momentum_alpha import VWAPMomentumAlphaStrategy
-from src.ai.predictor import TradePredictorFeatures
+from src.ai.predictor import TFLitePredictor, TradePredictorFeatures
 from src.ml.trainer import ModelTrainer
+from src.utils.indicator_cache import IndicatorCache
 from src.utils.indicators import (
     adx,
     atr,
     bb_position,
     bollinger_bands,
     ema,
+    ichimoku,
+    ichimoku_signals,
     momentum,
     order_book_imbalance,
     rsi,
     sma,
+    stochastic,
+    supertrend,
     trend_strength,
     volume_ratio,
 )
@@ -117,6 +122,28 @@ class TestIndicators:
         assert len(valid) > 0
         assert all(v >= 0 for v in valid)
 
+    def test_atr_writes_into_reused_buffer(self):
+        rng = np.random.default_rng(3)
+        closes = 100 + np.cumsum(rng.normal(0, 1, 80))
+        highs = closes + rng.uniform(0, 1, 80)
+        lows = closes - rng.uniform(0, 1, 80)
+        expected = atr(highs, lows, closes, 14)
+
+        buffers: dict = {}
+        first = IndicatorCache(closes, highs, lows, closes, atr_buffers=buffers).atr(14)
+        assert first is buffers[14]
+        np.testing.assert_array_equal(first, expected)
+
+        # The next scan of the same series reuses (and overwrites) the buffer
+        second = IndicatorCache(closes[::-1].copy(), highs[::-1].copy(), lows[::-1].copy(),
+                                closes, atr_buffers=buffers).atr(14)
+        assert second is first
+        np.testing.assert_array_equal(
+            second, atr(highs[::-1], lows[::-1], closes[::-1], 14)
+        )
+        with pytest.raises(ValueError):
+            atr(highs, lows, closes, 14, out=np.empty(10))
+
     def test_adx_range(self):
         highs = np.cumsum(np.random.uniform(0, 2, 100)) + 100
         lows = highs - np.random.uniform(1, 3, 100)
@@ -148,6 +175,106 @@ class TestIndicators:
         assert len(valid) > 0
         assert valid[-1] > 0  # Positive trend
 
+    def test_ema_rsi_kernels_match_reference(self):
+        data = np.array([np.nan, 10.0, 11.0, 12.0, np.nan, 13.0, 12.0, 14.0])
+        result = ema(data, 3)
+        # Seeded from the first NaN-free window [10, 11, 12], held through the gap
+        assert np.isnan(result[:3]).all()
+        assert result[3] == pytest.approx(11.0)
+        assert result[4] == pytest.approx(11.0)
+        assert result[5] == pytest.approx(12.0)
+        assert result[7] == pytest.approx(0.5 * 14.0 + 0.25 * 12.0 + 0.25 * 12.0)
+
+        closes = np.array([1.0, 2.0, 1.0, 3.0, 2.0], dtype=np.float32)
+        r = rsi(closes, 2)
+        assert np.isnan(r[:2]).all()
+        assert r[2] == pytest.approx(50.0)  # avg gain 0.5, avg loss 0.5
+        assert r[3] == pytest.approx(100.0 - 100.0 / (1.0 + 1.25 / 0.25))
+        assert r[4] == pytest.approx(100.0 - 100.0 / (1.0 + 0.625 / 0.625))
+
+
+    def test_stochastic_converges_after_warmup(self):
+        rng = np.random.default_rng(5)
+        closes = 100 + np.cumsum(rng.normal(0, 1, 60))
+        highs, lows = closes + rng.uniform(0, 1, 60), closes - rng.uniform(0, 1, 60)
+
+        pct_k, pct_d = stochastic(highs, lows, closes, 14, 3, 3)
+
+        raw_k = np.array([
+            (closes[i] - lows[i - 13:i + 1].min())
+            / (highs[i - 13:i + 1].max() - lows[i - 13:i + 1].min()) * 100.0
+            for i in range(13, 60)
+        ])
+        expected_k = np.convolve(raw_k, np.ones(3) / 3, mode="valid")
+        expected_d = np.convolve(expected_k, np.ones(3) / 3, mode="valid")
+        # Defined from bar k + smooth - 2 (%K) and k + smooth + d - 3 (%D) on
+        assert np.isnan(pct_k[:15]).all() and np.isnan(pct_d[:17]).all()
+        np.testing.assert_allclose(pct_k[15:], expected_k, rtol=1e-9)
+        np.testing.assert_allclose(pct_d[17:], expected_d, rtol=1e-9)
+
+    def test_ichimoku_kernel_matches_window_reference(self):
+        rng = np.random.default_rng(7)
+        closes = 100 + np.cumsum(rng.normal(0, 1, 120))
+        highs = np.round(closes + rng.uniform(0, 1, 120))  # rounding creates ties
+        lows = np.round(closes - rng.uniform(0, 1, 120))
+        highs[40] = np.nan
+        lows[90] = np.nan
+
+        tenkan, kijun, span_a, span_b, chikou = ichimoku(highs, lows, closes, 9, 26, 52)
+        for period, line in ((9, tenkan), (26, kijun), (52, span_b)):
+            expected = np.full(len(closes), np.nan)
+            for i in range(period - 1, len(closes)):
+                window = slice(i - period + 1, i + 1)
+                expected[i] = (np.max(highs[window]) + np.min(lows[window])) / 2.0
+            np.testing.assert_allclose(line, expected, rtol=1e-12, equal_nan=True)
+        np.testing.assert_allclose(span_a, (tenkan + kijun) / 2.0, equal_nan=True)
+        np.testing.assert_array_equal(chikou[:-26], closes[26:])
+        assert np.isnan(chikou[-26:]).all()
+
+    def test_supertrend_kernel_matches_band_rules(self):
+        rng = np.random.default_rng(9)
+        closes = 100 + np.cumsum(rng.normal(0, 1, 150))
+        highs = closes + rng.uniform(0, 1, 150)
+        lows = closes - rng.uniform(0, 1, 150)
+        highs[60:64] = lows[60:64] = closes[60:64]  # flat bars shrink ATR
+        period, mult = 10, 3.0
+
+        st_line, direction = supertrend(highs, lows, closes, period, mult)
+        atr_vals = atr(highs, lows, closes, period)
+        hl2 = (highs + lows) / 2.0
+        upper = lower = np.nan
+        for i in range(period, len(closes)):
+            basic_upper = hl2[i] + mult * atr_vals[i]
+            basic_lower = hl2[i] - mult * atr_vals[i]
+            tighten_upper = not np.isnan(upper) and closes[i - 1] <= upper
+            tighten_lower = not np.isnan(lower) and closes[i - 1] >= lower
+            upper = min(basic_upper, upper) if tighten_upper else basic_upper
+            lower = max(basic_lower, lower) if tighten_lower else basic_lower
+            if i == period or direction[i - 1] < 0:
+                expected = 1.0 if closes[i] > upper else -1.0
+            else:
+                expected = -1.0 if closes[i] < lower else 1.0
+            assert direction[i] == expected
+            assert st_line[i] == (lower if expected > 0 else upper)
+        assert np.isnan(st_line[:period]).all() and not direction[:period].any()
+        assert (direction[period:] > 0).any() and (direction[period:] < 0).any()
+
+    def test_ichimoku_signals_match_per_bar_checks(self):
+        rng = np.random.default_rng(11)
+        closes = 100 + np.cumsum(rng.normal(0, 1, 150))
+        highs = closes + rng.uniform(0, 1, 150)
+        lows = closes - rng.uniform(0, 1, 150)
+        tenkan, kijun, _, _, chikou = ichimoku(highs, lows, closes, 9, 26, 52)
+        tk_bull, tk_bear, chikou_bull, chikou_bear = ichimoku_signals(
+            tenkan, kijun, chikou, closes, 26
+        )
+        assert tk_bull.any() and tk_bear.any()
+        for i in range(1, len(closes)):
+            assert tk_bull[i] == (tenkan[i - 1] <= kijun[i - 1] and tenkan[i] > kijun[i])
+            assert tk_bear[i] == (tenkan[i - 1] >= kijun[i - 1] and tenkan[i] < kijun[i])
+            lag = i - 26
+            assert chikou_bull[i] == (lag >= 0 and chikou[lag] > closes[lag])
+            assert chikou_bear[i] == (lag >= 0 and chikou[lag] < closes[lag])
 
 # ---- Strategy Tests ----
 
@@ -172,68 +299,155 @@ class TestStrategies:
         volumes = np.random.uniform(80, 120, n)
         return closes, highs, lows, volumes
 
-    @pytest.mark.asyncio
-    async def test_trend_strategy_returns_signal(self):
+    def test_trend_strategy_returns_signal(self):
         strategy = TrendStrategy()
         closes, highs, lows, volumes = self._generate_uptrend()
-        signal = await strategy.analyze("BTC/USD", closes, highs, lows, volumes)
+        signal = strategy.analyze("BTC/USD", closes, highs, lows, volumes)
         assert isinstance(signal, StrategySignal)
         assert signal.strategy_name == "trend"
         assert signal.pair == "BTC/USD"
 
-    @pytest.mark.asyncio
-    async def test_mean_reversion_returns_signal(self):
+    def test_mean_reversion_returns_signal(self):
         strategy = MeanReversionStrategy()
         closes, highs, lows, volumes = self._generate_ranging()
-        signal = await strategy.analyze("ETH/USD", closes, highs, lows, volumes)
+        signal = strategy.analyze("ETH/USD", closes, highs, lows, volumes)
         assert isinstance(signal, StrategySignal)
         assert signal.strategy_name == "mean_reversion"
 
-    @pytest.mark.asyncio
-    async def test_momentum_returns_signal(self):
+    def test_momentum_returns_signal(self):
         strategy = MomentumStrategy()
         closes, highs, lows, volumes = self._generate_uptrend()
-        signal = await strategy.analyze("BTC/USD", closes, highs, lows, volumes)
+        signal = strategy.analyze("BTC/USD", closes, highs, lows, volumes)
         assert isinstance(signal, StrategySignal)
 
-    @pytest.mark.asyncio
-    async def test_breakout_returns_signal(self):
+    def test_breakout_returns_signal(self):
         strategy = BreakoutStrategy()
         closes, highs, lows, volumes = self._generate_uptrend()
-        signal = await strategy.analyze("BTC/USD", closes, highs, lows, volumes)
+        signal = strategy.analyze("BTC/USD", closes, highs, lows, volumes)
         assert isinstance(signal, StrategySignal)
 
-    @pytest.mark.asyncio
-    async def test_reversal_returns_signal(self):
+    def test_reversal_returns_signal(self):
         strategy = ReversalStrategy()
         closes, highs, lows, volumes = self._generate_ranging()
-        signal = await strategy.analyze("BTC/USD", closes, highs, lows, volumes)
+        signal = strategy.analyze("BTC/USD", closes, highs, lows, volumes)
         assert isinstance(signal, StrategySignal)
 
-    @pytest.mark.asyncio
-    async def test_vwap_momentum_alpha_returns_signal(self):
+    def test_vwap_momentum_alpha_returns_signal(self):
         strategy = VWAPMomentumAlphaStrategy()
         closes, highs, lows, volumes = self._generate_uptrend()
-        signal = await strategy.analyze("BTC/USD", closes, highs, lows, volumes)
+        signal = strategy.analyze("BTC/USD", closes, highs, lows, volumes)
         assert isinstance(signal, StrategySignal)
 
-    @pytest.mark.asyncio
-    async def test_rsi_mean_reversion_returns_signal(self):
+    def test_rsi_mean_reversion_returns_signal(self):
         strategy = RSIMeanReversionStrategy()
         closes, highs, lows, volumes = self._generate_ranging()
-        signal = await strategy.analyze("ETH/USD", closes, highs, lows, volumes)
+        signal = strategy.analyze("ETH/USD", closes, highs, lows, volumes)
         assert isinstance(signal, StrategySignal)
 
-    @pytest.mark.asyncio
-    async def test_strategy_insufficient_data(self):
+    def test_strategy_insufficient_data(self):
         strategy = TrendStrategy()
         closes = np.array([100.0, 101.0, 102.0])
         highs = closes + 1
         lows = closes - 1
         volumes = np.array([100.0, 100.0, 100.0])
-        signal = await strategy.analyze("BTC/USD", closes, highs, lows, volumes)
+        signal = strategy.analyze("BTC/USD", closes, highs, lows, volumes)
         assert signal.direction == SignalDirection.NEUTRAL
 
+    def test_signal_scores_clamped_to_unit_interval(self):
+        for raw, expected in ((1.3, 1.0), (-0.05, 0.0), (0.42, 0.42), (float("nan"), 1.0)):
+            signal = StrategySignal("trend", "BTC/USD", SignalDirection.LONG, raw, raw)
+            assert signal.strength == expected and signal.confidence == expected
+
+    def test_signal_timestamp_rendered_on_serialization(self):
+        before = time.time()
+        signal = StrategySignal("trend", "BTC/USD", SignalDirection.LONG, 0.5, 0.5)
+        assert signal.timestamp == ""
+        rendered = datetime.fromisoformat(signal.to_dict()["timestamp"])
+        assert rendered.tzinfo is not None
+        assert before - 1 <= rendered.timestamp() <= time.time() + 1
+
+        stamped = StrategySignal(
+            "trend", "BTC/USD", SignalDirection.LONG, 0.5, 0.5,
+            timestamp="2024-01-01T00:00:00+00:00",
+        )
+        assert stamped.to_dict()["timestamp"] == "2024-01-01T00:00:00+00:00"
+
+    def test_neutral_signals_reused_per_pair_and_reason(self):
+        strategy = TrendStrategy()
+        first = strategy._neutral_signal("BTC/USD", "Insufficient data")
+        created_at = first.created_at
+        again = strategy._neutral_signal("BTC/USD", "Insufficient data")
+        assert again is first
+        assert first.created_at == created_at  # reuse leaves the shared instance alone
+        assert first.to_dict()["timestamp"] == ""
+        assert strategy._neutral_signal("ETH/USD", "Insufficient data") is not first
+        assert strategy._neutral_signal("BTC/USD", "ATR is zero").metadata == {"reason": "ATR is zero"}
+
+    def test_recent_trade_window_ring(self):
+        strategy = TrendStrategy()
+        for i in range(30):
+            regime = "trending" if i % 2 else "ranging"
+            strategy.record_trade_result(float(i - 10), regime, "low_vol", hold_hours=1.0)
+
+        pnls = strategy.recent_pnls()
+        assert pnls.tolist() == [float(i - 10) for i in range(5, 30)]  # oldest first
+        assert strategy.get_stats()["recent_trades"] == 25
+        assert strategy.get_stats()["adaptive_factor"] == round(
+            strategy.adaptive_performance_factor(), 4
+        )
+        assert strategy.avg_winning_hold_hours() == 1.0
+
+        trending = [float(i - 10) for i in range(5, 30) if i % 2]
+        mean, std = np.mean(pnls), np.std(pnls)
+        sharpe_factor = 0.3 + 1.4 / (1.0 + np.exp(-mean / std))
+        regime_factor = 0.6 + 0.8 * sum(p > 0 for p in trending) / len(trending)
+        expected = sharpe_factor * regime_factor * strategy._signal_temperature
+        assert strategy.adaptive_performance_factor("trending", "low_vol") == pytest.approx(
+            max(0.3, min(2.0, expected))
+        )
+        # Unknown regimes match nothing, so the regime factor stays neutral
+        assert strategy.adaptive_performance_factor("unseen") == pytest.approx(
+            max(0.3, min(2.0, sharpe_factor * strategy._signal_temperature))
+        )
+
+        cached_factor = strategy.get_stats()["adaptive_factor"]
+        for _ in range(10):
+            strategy.record_trade_result(-50.0, "trending", "low_vol")
+        assert strategy.get_stats()["adaptive_factor"] < cached_factor
+
+    def test_signal_metadata_sanitized_for_json(self):
+        native = {"tenkan": 1.25, "cross": True, "count": 3, "reason": None}
+        signal = StrategySignal(
+            "ichimoku", "BTC/USD", SignalDirection.LONG, 0.5, 0.5, metadata=native
+        )
+        out = signal.to_dict()["metadata"]
+        assert out == native and out is not native
+
+        mixed = {
+            "nan": np.float64(np.nan),
+            "inf": float("inf"),
+            "nested": [1, np.int64(2), (3.0, np.bool_(True))],
+            "arr": np.array([1.5, np.nan]),
+        }
+        signal.metadata = mixed
+        assert signal.to_dict()["metadata"] == {
+            "nan": None,
+            "inf": None,
+            "nested": [1, 2, [3.0, True]],
+            "arr": [1.5, None],
+        }
+
+    def test_signal_metadata_floats_rounded_on_serialization(self):
+        raw = {"atr": 0.123456789, "k": np.float64(81.23456789), "count": 3}
+        signal = StrategySignal(
+            "stochastic_divergence", "BTC/USD", SignalDirection.LONG, 0.5, 0.5,
+            metadata=raw,
+        )
+        assert signal.to_dict()["metadata"] == {
+            "atr": 0.123457, "k": 81.234568, "count": 3,
+        }
+        assert raw["atr"] == 0.123456789
+
 
 # ---- Exchange/Data Path Tests ----
 
@@ -489,6 +703,21 @@ class TestDatabase:
 
             await db.close()
 
+    @pytest.mark.asyncio
+    async def test_connection_stats(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = DatabaseManager(os.path.join(tmpdir, "test.db"))
+            assert db.get_connection_stats()["connected"] is False
+
+            await db.initialize()
+            stats = db.get_connection_stats()
+            assert stats["connected"] and stats["initialized"]
+            assert stats["statement_cache_size"] == DatabaseManager._STATEMENT_CACHE_SIZE
+            assert stats["write_lock_held"] is False
+
+            await db.close()
+            assert db.get_connection_stats()["connected"] is False
+
     @pytest.mark.asyncio
     async def test_thought_log(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -501,6 +730,14 @@ class TestDatabase:
             assert len(thoughts) == 1
             assert thoughts[0]["message"] == "Test thought"
 
+            await db.insert_thoughts_many([
+                {"category": "test", "message": f"batched {i}", "metadata": {"i": i}}
+                for i in range(3)
+            ])
+            thoughts = await db.get_thoughts(limit=10)
+            assert [t["message"] for t in thoughts[:3]] == ["batched 2", "batched 1", "batched 0"]
+            assert thoughts[0]["metadata"] == {"i": 2}
+
             await db.close()
 
     @pytest.mark.asyncio
@@ -1083,6 +1320,138 @@ class TestMLPipeline:
         expected_sorted = expected[np.argsort(expected[:, 0])]
         assert np.allclose(raw_sorted, expected_sorted, atol=1e-5)
 
+    def test_trainer_missing_features_default_to_zero(self, tmp_path):
+        trainer = ModelTrainer(db=None, model_dir=str(tmp_path), feature_names=["a"], validation_split=0.0)
+        training_data = [
+            {"features": {"a": 4.0}, "label": 0.8},
+            {"features": {"other": 1.0}, "label": 0.0},
+        ]
+
+        X_train, y_train, _, _ = trainer._prepare_data(training_data)
+
+        norm = json.loads((tmp_path / "normalization.json").read_text())
+        assert y_train.tolist() == [1.0, 0.0]
+        assert X_train.shape == (2, 1)
+        assert norm["mean"] == [2.0]
+        assert np.allclose(X_train[:, 0] * norm["std"][0] + 2.0, [4.0, 0.0])
+
+    def test_trainer_drops_rows_with_non_finite_features(self, tmp_path):
+        trainer = ModelTrainer(db=None, model_dir=str(tmp_path), feature_names=["a", "b"])
+        training_data = [
+            {"features": {"a": float(i), "b": 2.0 * i}, "label": float(i % 2)}
+            for i in range(20)
+        ]
+        training_data[3]["features"]["a"] = None
+        training_data[7]["features"]["b"] = float("nan")
+
+        X_train, y_train, X_val, y_val = trainer._prepare_data(training_data)
+
+        assert len(X_train) + len(X_val) == 18
+        assert np.isfinite(X_train).all() and np.isfinite(X_val).all()
+        norm = json.loads((tmp_path / "normalization.json").read_text())
+        assert np.isfinite(norm["mean"]).all() and np.isfinite(norm["std"]).all()
+        kept = [i for i in range(20) if i not in (3, 7)]
+        assert np.concatenate([y_train, y_val]).tolist() == [float(i % 2) for i in kept]
+
+        # Nothing finite left: preparation fails like an empty dataset
+        assert trainer._prepare_data(training_data[3:4])[0] is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("shm_available", [True, False])
+    async def test_trainer_hands_arrays_to_worker(self, tmp_path, monkeypatch, shm_available):
+        class _DB:
+            async def get_ml_training_data(self, min_samples, tenant_id="default"):
+                return [{"features": {"a": float(i)}, "label": float(i % 2)} for i in range(30)]
+
+            async def log_thought(self, *args, **kwargs):
+                pass
+
+        seen = {}
+
+        def _fake_train(X_train, y_train, X_val, y_val, model_dir, epochs, batch_size, min_accuracy):
+            seen["shapes"] = [X_train.shape, y_train.shape, X_val.shape, y_val.shape]
+            seen["first"] = float(X_train[0, 0])
+            seen["min_accuracy"] = min_accuracy
+            return {"val_accuracy": 0.0}
+
+        def _no_shm(arrays):
+            raise OSError("no space left on device")
+
+        monkeypatch.setattr("src.ml.trainer._run_training_process", _fake_train)
+        if not shm_available:
+            monkeypatch.setattr("src.ml.trainer._share_arrays", _no_shm)
+        trainer = ModelTrainer(
+            db=_DB(), model_dir=str(tmp_path), min_samples=20, feature_names=["a"], min_accuracy=0.6
+        )
+        monkeypatch.setattr(trainer, "_get_executor", lambda: None)  # default thread pool
+
+        result = await trainer.train()
+
+        assert result["metrics"] == {"val_accuracy": 0.0}
+        assert seen["shapes"] == [(24, 1), (24,), (6, 1), (6,)]
+        assert seen["first"] == pytest.approx(-11.5 / np.std(np.arange(24)))
+        assert seen["min_accuracy"] == 0.6
+
+    @pytest.mark.asyncio
+    async def test_trainer_deploy_keeps_backup_and_rolls_back(self, tmp_path):
+        trainer = ModelTrainer(db=None, model_dir=str(tmp_path))
+        live = tmp_path / "trade_predictor.tflite"
+        backup = tmp_path / "trade_predictor_backup.tflite"
+        live.write_bytes(b"v1")
+        backup.write_bytes(b"stale")
+        (tmp_path / "trade_predictor_new.tflite").write_bytes(b"v2")
+
+        assert await trainer._deploy_model()
+        assert live.read_bytes() == b"v2"
+        assert backup.read_bytes() == b"v1"
+        assert not (tmp_path / "trade_predictor_new.tflite").exists()
+
+        assert await trainer.rollback_model()
+        assert live.read_bytes() == b"v1"
+
+    def test_predictor_int8_io_roundtrip(self):
+        in_detail = {"dtype": np.int8, "quantization": (0.05, -3)}
+        out_detail = {"dtype": np.int8, "quantization": (1.0 / 256, -128)}
+
+        x = np.array([[0.0, 1.0, -1.0, 100.0]], dtype=np.float32)
+        q = TFLitePredictor._quantize_input(x, in_detail)
+        assert q.dtype == np.int8
+        assert q.tolist() == [[-3, 17, -23, 127]]  # last value saturates
+
+        assert TFLitePredictor._dequantize_output(np.int8(0), out_detail) == pytest.approx(0.5)
+        # Float models pass through untouched
+        f_detail = {"dtype": np.float32, "quantization": (0.0, 0)}
+        assert TFLitePredictor._quantize_input(x, f_detail) is x
+        assert TFLitePredictor._dequantize_output(np.float32(0.25), f_detail) == pytest.approx(0.25)
+
+    def test_trainer_shared_memory_handoff(self):
+        from multiprocessing.shared_memory import SharedMemory
+
+        from src.ml.trainer import _release_segments, _share_arrays
+
+        X = np.arange(12, dtype=np.float32).reshape(4, 3)
+        y = np.array([0.0, 1.0, 1.0, 0.0], dtype=np.float32)
+        empty = np.empty((0, 3), dtype=np.float32)
+
+        segments, descriptors = _share_arrays([X, y, empty])
+        try:
+            assert [d[1] for d in descriptors] == [(4, 3), (4,), (0, 3)]
+            attached = [SharedMemory(name=name) for name, _, _ in descriptors]
+            views = [
+                np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+                for shm, (_, shape, dtype) in zip(attached, descriptors)
+            ]
+            assert np.array_equal(views[0], X)
+            assert np.array_equal(views[1], y)
+            assert views[2].shape == (0, 3)
+            del views
+            _release_segments(attached)
+        finally:
+            _release_segments(segments, unlink=True)
+
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=descriptors[0][0])
+
 
 # ---- Vault Tests ----
 
@@ -53,6 +53,10 @@ class _SettingsEngine:
         self.executor = _SettingsExecutor()
         self.scan_interval = self.config.trading.scan_interval_seconds
         self.db = _SettingsDB()
+        self.monitoring_applied = 0
+
+    def apply_monitoring_config(self) -> None:
+        self.monitoring_applied += 1
 
 
 def _make_client():
@@ -101,6 +105,7 @@ def test_patch_settings_fans_out_to_all_engines(monkeypatch):
         assert eng.risk_manager.max_daily_trades == 11
         assert eng.scan_interval == 17
         assert eng.executor.max_trades_per_hour == 9
+        assert eng.monitoring_applied == 0
         assert eng.db.logs
     assert len(saved_payloads) == 1
     assert saved_payloads[0]["trading"]["scan_interval_seconds"] == 17
@@ -118,6 +123,7 @@ def test_patch_settings_bool_parser_is_strict(monkeypatch):
     assert ok.status_code == 200
     assert e1.config.monitoring.auto_pause_on_drawdown is False
     assert e2.config.monitoring.auto_pause_on_drawdown is False
+    assert e1.monitoring_applied == e2.monitoring_applied == 1
 
     bad = client.patch(
         "/api/v1/settings",
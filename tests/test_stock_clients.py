@@ -0,0 +1,146 @@
+"""Tests for the Alpaca / Polygon HTTP clients against a mocked transport."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import httpx
+import numpy as np
+import pytest
+
+from src.stocks.alpaca_client import AlpacaClient
+from src.stocks.polygon_client import PolygonClient
+
+
+def _attach_transport(client, handler) -> None:
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_submit_market_order_polls_with_backoff(monkeypatch):
+    polls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            return httpx.Response(200, json={"id": "o1", "status": "new", "filled_qty": "0"})
+        polls.append(request.url.path)
+        if len(polls) < 3:
+            return httpx.Response(200, json={"id": "o1", "status": "accepted", "filled_qty": "0"})
+        return httpx.Response(200, json={"id": "o1", "status": "filled", "filled_qty": "5"})
+
+    sleeps: List[float] = []
+
+    async def _fake_sleep(delay):
+        sleeps.append(delay)
+
+    client = AlpacaClient("key", "secret", base_url="https://alpaca.test")
+    _attach_transport(client, handler)
+    monkeypatch.setattr("src.stocks.alpaca_client.asyncio.sleep", _fake_sleep)
+
+    order = await client.submit_market_order("AAPL", 5, "buy", wait_fill_seconds=8.0)
+    await client.close()
+
+    assert order["status"] == "filled"
+    assert polls == ["/v2/orders/o1"] * 3
+    assert sleeps == pytest.approx([0.1, 0.15, 0.225])
+
+
+def _polygon_rows(n: int) -> List[dict]:
+    return [
+        {"t": 1_700_000_000_000 + i * 60_000, "o": 10 + i, "h": 11 + i, "l": 9 + i, "c": 10.5 + i, "v": 1000 * i}
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_polygon_aggregate_bars_parse_and_trim():
+    rows = _polygon_rows(30)
+    rows[-1]["v"] = None  # missing fields fall back to 0.0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"results": rows})
+
+    client = PolygonClient("key", base_url="https://polygon.test")
+    _attach_transport(client, handler)
+
+    bars = await client.get_aggregate_bars("AAPL", multiplier=1, timespan="minute", limit=20)
+    await client.close()
+
+    assert len(bars) == 20
+    assert bars[0] == {
+        "time": 1_700_000_000.0 + 10 * 60,
+        "open": 20.0,
+        "high": 21.0,
+        "low": 19.0,
+        "close": 20.5,
+        "volume": 10_000.0,
+    }
+    assert bars[-1]["volume"] == 0.0
+    assert all(type(v) is float for v in bars[-1].values())
+
+
+@pytest.mark.asyncio
+async def test_polygon_aggregate_bars_soa_matches_list_path():
+    rows = _polygon_rows(25)
+    del rows[3]["h"]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"results": rows})
+
+    client = PolygonClient("key", base_url="https://polygon.test")
+    _attach_transport(client, handler)
+
+    bars = await client.get_aggregate_bars("AAPL", multiplier=5, timespan="minute", limit=20)
+    cols = await client.get_aggregate_bars_soa("AAPL", multiplier=5, timespan="minute", limit=20)
+    await client.close()
+
+    assert list(cols) == ["time", "open", "high", "low", "close", "volume"]
+    for field, arr in cols.items():
+        assert arr.dtype == np.float64 and arr.flags.c_contiguous
+        assert arr.tolist() == [bar[field] for bar in bars]
+
+
+@pytest.mark.asyncio
+async def test_polygon_aggregate_bars_soa_empty_on_error():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500)
+
+    client = PolygonClient("key", base_url="https://polygon.test")
+    _attach_transport(client, handler)
+
+    cols = await client.get_aggregate_bars_soa("AAPL", multiplier=1, timespan="day")
+    await client.close()
+
+    assert set(cols) == {"time", "open", "high", "low", "close", "volume"}
+    assert all(len(arr) == 0 for arr in cols.values())
+
+
+@pytest.mark.asyncio
+async def test_polygon_get_many_aggregate_bars_bounds_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if "/BAD/" in request.url.path:
+            return httpx.Response(404)
+        return httpx.Response(200, json={"results": _polygon_rows(20)})
+
+    client = PolygonClient("key", base_url="https://polygon.test")
+    _attach_transport(client, handler)
+
+    symbols = ["AAPL", "MSFT", "BAD", "NVDA", "AMD", "AAPL"]
+    out = await client.get_many_aggregate_bars(
+        symbols, multiplier=1, timespan="day", limit=20, concurrency=2
+    )
+    await client.close()
+
+    assert list(out) == ["AAPL", "MSFT", "BAD", "NVDA", "AMD"]
+    assert out["BAD"] == []
+    assert all(len(out[s]) == 20 for s in ("AAPL", "MSFT", "NVDA", "AMD"))
+    assert peak == 2
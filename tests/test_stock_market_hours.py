@@ -0,0 +1,50 @@
+"""Tests for the NYSE session calendar used by the stock scan loop."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from src.stocks.market_hours import is_market_open, nyse_holidays, seconds_until_open
+
+
+def test_nyse_holidays_2026():
+    assert sorted(nyse_holidays(2026)) == [
+        date(2026, 1, 1), date(2026, 1, 19), date(2026, 2, 16), date(2026, 4, 3),
+        date(2026, 5, 25), date(2026, 6, 19), date(2026, 7, 3), date(2026, 9, 7),
+        date(2026, 11, 26), date(2026, 12, 25),
+    ]
+
+
+def test_new_year_on_saturday_is_not_observed():
+    # 2022-01-01 was a Saturday: no Dec 31, 2021 closure; Christmas observed on Dec 24
+    assert date(2021, 12, 31) not in nyse_holidays(2021)
+    assert date(2021, 12, 24) in nyse_holidays(2021)
+    assert not any(d.month == 1 and d.day <= 3 for d in nyse_holidays(2022))
+
+
+@pytest.mark.parametrize(
+    "utc, is_open",
+    [
+        (datetime(2026, 10, 16, 13, 29, tzinfo=timezone.utc), False),  # Fri 09:29 EDT
+        (datetime(2026, 10, 16, 13, 30, tzinfo=timezone.utc), True),  # Fri 09:30 EDT
+        (datetime(2026, 10, 16, 19, 59, tzinfo=timezone.utc), True),  # Fri 15:59 EDT
+        (datetime(2026, 10, 16, 20, 0, tzinfo=timezone.utc), False),  # Fri 16:00 EDT
+        (datetime(2026, 10, 17, 15, 0, tzinfo=timezone.utc), False),  # Saturday
+        (datetime(2026, 12, 1, 14, 30, tzinfo=timezone.utc), True),  # Tue 09:30 EST
+        (datetime(2026, 11, 26, 16, 0, tzinfo=timezone.utc), False),  # Thanksgiving
+    ],
+)
+def test_is_market_open(utc, is_open):
+    assert is_market_open(utc) is is_open
+
+
+def test_seconds_until_open_skips_weekends_and_holidays():
+    # Friday 17:00 EDT -> Monday 09:30 EDT
+    assert seconds_until_open(datetime(2026, 10, 16, 21, 0, tzinfo=timezone.utc)) == 64.5 * 3600
+    # Thanksgiving morning -> Friday 09:30 EST
+    assert seconds_until_open(datetime(2026, 11, 26, 12, 0, tzinfo=timezone.utc)) == 26.5 * 3600
+    # Same-day pre-open and during the session
+    assert seconds_until_open(datetime(2026, 10, 16, 13, 0, tzinfo=timezone.utc)) == 1800
+    assert seconds_until_open(datetime(2026, 10, 16, 15, 0, tzinfo=timezone.utc)) == 0.0
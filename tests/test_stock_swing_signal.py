@@ -0,0 +1,345 @@
+"""Tests for the stock swing engine's signal features and classification."""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.core.config import BotConfig
+from src.stocks.swing_engine import StockSwingEngine, _signal_features
+from src.utils.indicators import ema, rsi
+
+
+def _engine() -> StockSwingEngine:
+    return StockSwingEngine(
+        config_override=BotConfig(app={"mode": "paper"}, stocks={"symbols": ["AAPL"]})
+    )
+
+
+@pytest.mark.parametrize("n", [6, 15, 49, 60, 300])
+def test_signal_features_match_indicator_last_values(n):
+    closes = 100 + np.cumsum(np.random.default_rng(n).normal(size=n))
+
+    c, e20, e50, rv, mom = _signal_features(closes, 20, 50, 14, 5)
+
+    ema20, ema50, rsi14 = ema(closes, 20)[-1], ema(closes, 50)[-1], rsi(closes, 14)[-1]
+    assert c == closes[-1]
+    assert e20 == (ema20 if np.isfinite(ema20) else 0.0)
+    assert e50 == (ema50 if np.isfinite(ema50) else 0.0)
+    assert rv == (rsi14 if np.isfinite(rsi14) else 50.0)
+    assert mom == pytest.approx(closes[-1] / closes[-6] - 1.0)
+
+
+def test_signal_features_hold_ema_through_nan_gaps():
+    closes = 100 + np.cumsum(np.random.default_rng(7).normal(size=80))
+    closes[[3, 40, 41]] = np.nan
+
+    _, e20, e50, rv, _ = _signal_features(closes, 20, 50, 14, 5)
+
+    assert e20 == pytest.approx(ema(closes, 20)[-1])
+    assert rv == pytest.approx(rsi(closes, 14)[-1])
+    # No 50-bar NaN-free window: ema() is all-NaN, the kernel reports 0.0
+    assert np.isnan(ema(closes, 50)[-1])
+    assert e50 == 0.0
+
+
+def test_analyze_signal_classification():
+    engine = _engine()
+    rng = np.random.default_rng(3)
+
+    assert engine._analyze_signal(np.linspace(100, 120, 30)) == "hold"  # too few bars
+
+    # Steady uptrend with pullbacks: price above both EMAs, RSI in range
+    up = 100 + np.cumsum(np.where(np.arange(120) % 3 == 2, -0.6, 0.5)) + rng.normal(0, 0.01, 120)
+    assert engine._analyze_signal(up) == "buy"
+    assert engine._analyze_signal(up, symbol="AAPL", bar_times=[1.0, 2.0, 3.0]) == "buy"
+
+    down = np.linspace(150, 100, 120)
+    assert engine._analyze_signal(down) == "exit"
+
+
+def test_incremental_signal_state_tracks_full_recompute():
+    engine = _engine()
+    history = 100 + np.cumsum(np.random.default_rng(11).normal(0, 1.0, 200))
+    times = [86400.0 * i for i in range(200)]
+
+    def _full(closes):
+        _, e20, e50, rv, _ = _signal_features(closes, 20, 50, 14, 5)
+        return e20, e50, rv
+
+    # First sight: state built from the bars before the newest one
+    first = engine._incremental_signal_values("AAPL", history[:120], times[:120])
+    assert first == pytest.approx(_full(history[:120]), rel=1e-12)
+    assert engine._signal_states["AAPL"][0] == times[118]
+
+    # Same bars, newest close revised intraday: state reused, last bar re-applied
+    revised = history[:120].copy()
+    revised[-1] += 0.5
+    values = engine._incremental_signal_values("AAPL", revised, times[:120])
+    assert values == pytest.approx(_full(revised), rel=1e-12)
+
+    # Following days: one bar appended per scan (sliding window) -> one step each
+    for end in range(121, 130):
+        window = history[end - 120:end]
+        values = engine._incremental_signal_values("AAPL", window, times[end - 120:end])
+        # Carried state has the full history, not just the window
+        assert values == pytest.approx(_full(history[:end]), rel=1e-9)
+        assert engine._signal_states["AAPL"][0] == times[end - 2]
+
+    # Gap in the bar series: rebuilt from the window
+    window = history[140:200]
+    values = engine._incremental_signal_values("AAPL", window, times[140:200])
+    assert values == pytest.approx(_full(window), rel=1e-12)
+
+
+class _ScanDB:
+    def __init__(self, open_rows=None):
+        self.open_rows = list(open_rows or [])
+        self.get_open_trades_calls = 0
+        self.direct_thoughts = []
+        self.thought_batches = []
+
+    async def get_open_trades(self, tenant_id: str = "default"):
+        self.get_open_trades_calls += 1
+        return list(self.open_rows)
+
+    async def log_thought(self, *args, **kwargs):
+        self.direct_thoughts.append(args)
+
+    async def insert_thoughts_many(self, thoughts):
+        self.thought_batches.append(list(thoughts))
+
+    async def close(self):
+        pass
+
+
+def _daily_bars(closes):
+    return [
+        {"time": 86400.0 * i, "open": c, "high": c, "low": c, "close": float(c), "volume": 1.0}
+        for i, c in enumerate(closes)
+    ]
+
+
+async def _run_one_scan(engine, monkeypatch, bars_by_symbol):
+    async def _fetch(symbols, limit):
+        return {s: bars_by_symbol[s] for s in symbols if s in bars_by_symbol}
+
+    async def _stop_after_scan(delay):
+        engine._running = False
+
+    engine._fetch_scan_bars = _fetch
+    engine._scan_market_hours_only = False
+    engine._running = True
+    monkeypatch.setattr("src.stocks.swing_engine.asyncio.sleep", _stop_after_scan)
+    await engine._scan_loop()
+
+
+@pytest.mark.asyncio
+async def test_scan_loop_updates_prices_and_opens_on_buy(monkeypatch):
+    engine = StockSwingEngine(
+        config_override=BotConfig(app={"mode": "paper"}, stocks={"symbols": ["AAPL", "MSFT", "TSLA"]})
+    )
+    engine.db = _ScanDB()
+    opened = []
+
+    async def _open_trade(symbol, price):
+        # Orders run under the lock the broker reconcile task takes
+        assert engine._reconcile_lock.locked()
+        opened.append((symbol, price))
+        return True
+
+    engine._open_trade = _open_trade
+    up = 100 + np.cumsum(np.where(np.arange(120) % 3 == 2, -0.6, 0.5))
+    down = np.linspace(150, 100, 130)
+
+    await _run_one_scan(
+        engine, monkeypatch, {"AAPL": _daily_bars(up), "MSFT": _daily_bars(down)}
+    )
+
+    assert opened == [("AAPL", float(up[-1]))]
+    assert engine.market_data.get_latest_price("AAPL") == float(up[-1])
+    assert engine.market_data.get_latest_price("MSFT") == 100.0
+    assert engine.market_data.get_bar_count("MSFT") == 130
+    assert set(engine._signal_states) == {"AAPL", "MSFT"}
+    # Reconcile, backfill and breakers share a single open-trades read
+    assert engine.db.get_open_trades_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_scan_bars_overlaps_requests_and_spaces_starts(monkeypatch):
+    engine = _engine()
+    real_sleep = asyncio.sleep
+    in_flight = peak = 0
+    waits = []
+
+    async def _get_daily_bars(symbol, limit):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await real_sleep(0.01)
+        in_flight -= 1
+        if symbol == "BAD":
+            raise RuntimeError("boom")
+        return _daily_bars([1.0, 2.0])
+
+    async def _record_wait(delay):
+        waits.append(delay)
+        await real_sleep(0)
+
+    engine.polygon.get_daily_bars = _get_daily_bars
+    monkeypatch.setattr("src.stocks.swing_engine.asyncio.sleep", _record_wait)
+
+    out = await engine._fetch_scan_bars(["AAPL", "MSFT", "BAD", "NVDA"], 60)
+
+    assert peak == 4
+    assert out["BAD"] == [] and "BAD" not in engine._bar_cache
+    assert all(len(out[s]) == 2 for s in ("AAPL", "MSFT", "NVDA"))
+    # Free-tier rate (5/min): starts reserved 12s apart, first one immediate
+    assert len(waits) == 3
+    assert sorted(waits) == pytest.approx([12.0, 24.0, 36.0], abs=0.5)
+    # Cached symbols are not refetched
+    assert await engine._fetch_scan_bars(["AAPL"], 60) == {"AAPL": out["AAPL"]}
+
+
+@pytest.mark.asyncio
+async def test_thoughts_are_batched_while_running_and_drained_on_stop():
+    engine = _engine()
+    engine.db = _ScanDB()
+
+    await engine._log_thought("system", "before start")
+    assert engine.db.direct_thoughts == [("system", "before start")]
+
+    engine._thought_task = asyncio.create_task(engine._thought_flusher())
+    for i in range(3):
+        await engine._log_thought("execution", f"queued {i}", severity="warning")
+    # Templates are formatted by the flusher; raw fields land in metadata
+    await engine._log_thought(
+        "execution", "BUY {symbol} qty={qty:.4f}", severity="warning",
+        metadata={"note": "x"}, symbol="AAPL", qty=1.5,
+    )
+    await engine.stop()
+
+    assert len(engine.db.thought_batches) == 1
+    batch = engine.db.thought_batches[0]
+    assert [t["message"] for t in batch] == [
+        "queued 0", "queued 1", "queued 2", "BUY AAPL qty=1.5000",
+    ]
+    assert batch[3]["metadata"] == {"symbol": "AAPL", "qty": 1.5, "note": "x"}
+    assert all(t["tenant_id"] == engine.tenant_id and t["severity"] == "warning" for t in batch)
+    assert all("fields" not in t for t in batch)
+    assert engine._thought_task is None
+
+
+@pytest.mark.asyncio
+async def test_bad_thought_template_does_not_drop_the_batch():
+    engine = _engine()
+    engine.db = _ScanDB()
+    engine._thought_task = asyncio.create_task(engine._thought_flusher())
+
+    await engine._log_thought("execution", "BUY {symbol} qty={qty:.4f}", symbol="AAPL", qty=1.5)
+    await engine._log_thought("execution", "SELL {symbol} qty={qty:.4f}", symbol="MSFT")
+    await engine._log_thought("execution", "BUY {symbol} qty={qty:.4f}", symbol="NVDA", qty="n/a")
+    await engine._log_thought("execution", "queued after")
+    await engine.stop()
+
+    assert len(engine.db.thought_batches) == 1
+    batch = engine.db.thought_batches[0]
+    assert [t["message"] for t in batch] == [
+        "BUY AAPL qty=1.5000",
+        "SELL {symbol} qty={qty:.4f}",
+        "BUY {symbol} qty={qty:.4f}",
+        "queued after",
+    ]
+    assert batch[1]["metadata"] == {"symbol": "MSFT"}
+    assert batch[2]["metadata"] == {"symbol": "NVDA", "qty": "n/a"}
+
+
+@pytest.mark.asyncio
+async def test_scan_loop_skips_decisions_for_pending_symbols(monkeypatch):
+    engine = _engine()
+    engine.db = _ScanDB()
+    engine._pending_opens["AAPL"] = {"order_id": "ord-1"}
+    opened = []
+
+    async def _open_trade(symbol, price):
+        opened.append(symbol)
+        return True
+
+    engine._open_trade = _open_trade
+    up = 100 + np.cumsum(np.where(np.arange(120) % 3 == 2, -0.6, 0.5))
+
+    await _run_one_scan(engine, monkeypatch, {"AAPL": _daily_bars(up)})
+
+    assert opened == []
+    assert engine.market_data.get_latest_price("AAPL") == float(up[-1])
+    assert "AAPL" not in engine._signal_states
+
+
+def test_pairs_are_normalized_deduped_and_frozen():
+    engine = StockSwingEngine(
+        config_override=BotConfig(
+            app={"mode": "paper"}, stocks={"symbols": ["aapl", " MSFT ", "AAPL", "", "tsla"]}
+        )
+    )
+    assert engine.pairs == ("AAPL", "MSFT", "TSLA")
+
+    universe = ["NVDA", "amd", "NVDA"]
+    engine._set_pairs(universe)
+    universe.append("META")  # scanner-owned list mutating later doesn't leak in
+    assert engine.pairs == ("NVDA", "AMD")
+
+
+@pytest.mark.asyncio
+async def test_scan_loop_sleeps_to_open_when_market_closed(monkeypatch):
+    engine = _engine()
+    engine.db = _ScanDB()
+    engine._pending_opens["AAPL"] = {"order_id": "ord-1"}
+    reconciled, sleeps = [], []
+
+    async def _fetch(symbols, limit):
+        raise AssertionError("no bar fetches while closed")
+
+    async def _reconcile_pending_opens(open_rows=None):
+        reconciled.append(open_rows)
+        return False
+
+    async def _sleep(delay):
+        sleeps.append(delay)
+        engine._running = False
+
+    engine._fetch_scan_bars = _fetch
+    engine._reconcile_pending_opens = _reconcile_pending_opens
+    monkeypatch.setattr("src.stocks.swing_engine.is_market_open", lambda: False)
+    monkeypatch.setattr("src.stocks.swing_engine.seconds_until_open", lambda: 600.0)
+    monkeypatch.setattr("src.stocks.swing_engine.asyncio.sleep", _sleep)
+    engine._running = True
+
+    await engine._scan_loop()
+
+    assert sleeps == [600.0]
+    assert reconciled == [None]
+    assert engine._scan_count == 0
+    assert engine.db.get_open_trades_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_open_trades_stay_in_memory_between_resyncs(monkeypatch):
+    engine = _engine()
+    engine.db = _ScanDB(open_rows=[{"trade_id": "S-1", "pair": "aapl", "entry_price": 100.0}])
+    flat = _daily_bars(np.full(120, 100.0))
+
+    await _run_one_scan(engine, monkeypatch, {"AAPL": flat})
+    await _run_one_scan(engine, monkeypatch, {"AAPL": flat})
+
+    assert engine.db.get_open_trades_calls == 1
+    assert list(engine._open_trades) == ["AAPL"]
+
+    # A row written behind the engine's back is picked up at the periodic resync
+    engine.db.open_rows.append({"trade_id": "S-2", "pair": "MSFT", "entry_price": 50.0})
+    engine._scan_count = 59
+    await _run_one_scan(engine, monkeypatch, {"AAPL": flat})
+
+    assert engine.db.get_open_trades_calls == 2
+    assert sorted(engine._open_trades) == ["AAPL", "MSFT"]
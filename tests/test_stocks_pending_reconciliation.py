@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import time
+from datetime import datetime, timezone
 
 import pytest
 
@@ -264,3 +266,219 @@ def test_stock_algorithm_stats_use_real_values():
     assert stats["trades"] == 2
     assert stats["win_rate"] == pytest.approx(0.5)
     assert stats["avg_pnl"] == pytest.approx(2.5)
+
+    # Memoised between trades; callers get their own copy
+    stats["exchange"] = "alpaca"
+    assert "exchange" not in engine.get_algorithm_stats()[0]
+    engine.risk_manager.record_closed_trade(7.0)
+    assert engine.get_algorithm_stats()[0]["trades"] == 3
+
+
+def test_stock_risk_daily_counters_reset_on_utc_day_change(monkeypatch):
+    engine = StockSwingEngine(config_override=_paper_cfg())
+    risk = engine.risk_manager
+    day_start = 20_000 * 86400.0  # 2024-10-04T00:00:00Z
+    monkeypatch.setattr("src.stocks.swing_engine.time.time", lambda: day_start + 3600)
+    risk._daily_reset_epoch_day = 20_000
+    risk.record_closed_trade(-5.0)
+    assert risk.get_risk_report()["daily_trades"] == 1
+    assert risk.daily_reset_date == "2024-10-04"
+
+    monkeypatch.setattr("src.stocks.swing_engine.time.time", lambda: day_start + 86400 + 1)
+    report = risk.get_risk_report()
+    assert report["daily_trades"] == 0 and report["daily_pnl"] == 0.0
+    assert report["consecutive_losses"] == 0
+    assert report["trade_count"] == 1
+    assert risk.daily_reset_date == "2024-10-05"
+
+
+@pytest.mark.asyncio
+async def test_normalize_broker_positions_filters_and_batches_short_warning():
+    engine = StockSwingEngine(config_override=_live_cfg())
+    fake_db = _FakeDB()
+    engine.db = fake_db
+
+    async def _list_open_positions():
+        return [
+            {"symbol": " aapl ", "qty": "2", "avg_entry_price": "150.5"},
+            {"symbol": "O:SPY250117C00500000", "qty": "1", "avg_entry_price": "0", "current_price": "3.2"},
+            {"symbol": "TSLA", "qty": "-3", "avg_entry_price": "200"},
+            {"symbol": "NVDA", "qty": "-1", "avg_entry_price": "100"},
+            {"symbol": "AMD", "qty": "oops", "avg_entry_price": "100"},
+            {"symbol": "MSFT", "qty": "0", "avg_entry_price": "300"},
+            {"symbol": "", "qty": "5", "avg_entry_price": "10"},
+            {"symbol": "IBM", "qty": "1"},
+        ]
+
+    engine.alpaca.list_open_positions = _list_open_positions
+
+    out = await engine._normalize_broker_positions()
+
+    assert list(out) == ["AAPL", "SPY250117C00500000"]
+    assert out["AAPL"]["qty"] == 2.0 and out["AAPL"]["avg_entry_price"] == 150.5
+    assert out["SPY250117C00500000"]["avg_entry_price"] == 3.2
+    assert len(fake_db.logs) == 1
+    assert "TSLA qty=3.0000" in fake_db.logs[0]["message"]
+    assert "NVDA qty=1.0000" in fake_db.logs[0]["message"]
+
+
+@pytest.mark.asyncio
+async def test_maybe_close_trade_hold_windows_use_cached_entry_epoch(monkeypatch):
+    engine = StockSwingEngine(config_override=_paper_cfg())
+    fake_db = _FakeDB()
+    engine.db = fake_db
+    now = time.time()
+
+    def _trade(trade_id: str, age_days: float) -> dict:
+        entry = datetime.fromtimestamp(now - age_days * 86400, tz=timezone.utc)
+        return {
+            "trade_id": trade_id,
+            "pair": "AAPL",
+            "quantity": 1.0,
+            "entry_price": 100.0,
+            "entry_time": entry.isoformat(),
+        }
+
+    young = _trade("S-young", 0.5)
+    assert await engine._maybe_close_trade(young, 101.0, "exit") is False
+    assert engine._entry_epochs["S-young"] == pytest.approx(now - 0.5 * 86400, abs=1e-3)
+
+    # Cached: entry_time is not parsed again on later scans
+    parsed = []
+    real_parse = engine._parse_dt
+    monkeypatch.setattr(engine, "_parse_dt", lambda v: parsed.append(v) or real_parse(v))
+    assert await engine._maybe_close_trade(young, 101.0, "hold") is False
+    assert parsed == []
+
+    assert await engine._maybe_close_trade(_trade("S-held", 2.0), 101.0, "exit") is True
+    engine.market_data.update("AAPL", price=101.0, bars=1)  # timeout closes at latest price
+    assert await engine._maybe_close_trade(_trade("S-old", 8.0), 101.0, "hold") is True
+    assert [row["trade_id"] for row in fake_db.closed] == ["S-held", "S-old"]
+    assert set(engine._entry_epochs) == {"S-young"}
+
+
+@pytest.mark.asyncio
+async def test_broker_reconcile_loop_runs_on_jittered_interval(monkeypatch):
+    engine = StockSwingEngine(config_override=_live_cfg())
+    fake_db = _FakeDB()
+    engine.db = fake_db
+    sleeps = []
+
+    async def _list_open_positions():
+        # Broker fetch happens under the reconcile lock
+        assert engine._reconcile_lock.locked()
+        return [{"symbol": "AAPL", "qty": "1.5", "avg_entry_price": "123.4"}]
+
+    async def _sleep(delay):
+        sleeps.append(delay)
+        engine._running = len(sleeps) < 2
+
+    engine.alpaca.list_open_positions = _list_open_positions
+    monkeypatch.setattr("src.stocks.swing_engine.asyncio.sleep", _sleep)
+    engine._running = True
+
+    await engine._broker_reconcile_loop()
+
+    interval = engine.scan_interval * 4
+    assert len(sleeps) == 2
+    assert all(interval <= d <= interval * 1.05 for d in sleeps)
+    assert len(fake_db.inserted) == 1
+    assert fake_db.inserted[0][0]["pair"] == "AAPL"
+
+
+@pytest.mark.asyncio
+async def test_broker_reconcile_loop_waits_for_open_awaiting_fill(monkeypatch):
+    engine = StockSwingEngine(config_override=_live_cfg())
+    fake_db = _FakeDB()
+    engine.db = fake_db
+    engine._open_trades_loaded = True
+    engine._pending_opens["MSFT"] = {"order_id": "ord-msft"}
+    submitted = asyncio.Event()
+    fill = asyncio.Event()
+    real_sleep = asyncio.sleep
+    sleeps = []
+
+    async def _submit_market_order(**kwargs):
+        submitted.set()
+        await fill.wait()
+        return {"id": "ord-aapl", "status": "filled", "filled_avg_price": "100.0", "filled_qty": "1.0"}
+
+    async def _list_open_positions():
+        # The broker already shows the position while the order waits to fill
+        return [
+            {"symbol": "AAPL", "qty": "1.0", "avg_entry_price": "100.0"},
+            {"symbol": "MSFT", "qty": "2.0", "avg_entry_price": "50.0"},
+        ]
+
+    async def _sleep(delay):
+        sleeps.append(delay)
+        engine._running = len(sleeps) < 2
+
+    async def _scan_open():
+        async with engine._reconcile_lock:
+            return await engine._open_trade("AAPL", 100.0)
+
+    engine.alpaca.submit_market_order = _submit_market_order
+    engine.alpaca.list_open_positions = _list_open_positions
+    open_task = asyncio.create_task(_scan_open())
+    await submitted.wait()
+
+    monkeypatch.setattr("src.stocks.swing_engine.asyncio.sleep", _sleep)
+    engine._running = True
+    loop_task = asyncio.create_task(engine._broker_reconcile_loop())
+    for _ in range(5):
+        await real_sleep(0)
+    assert fake_db.inserted == []  # reconcile pass is blocked behind the open
+
+    fill.set()
+    assert await open_task is True
+    await loop_task
+
+    # One row for AAPL, from the fill; MSFT is left to pending-open resolution
+    assert [row["pair"] for row, _ in fake_db.inserted] == ["AAPL"]
+    assert fake_db.inserted[0][0]["metadata"]["broker_order_id"] == "ord-aapl"
+    assert engine._open_trades["AAPL"] is fake_db.inserted[0][0]
+
+
+@pytest.mark.asyncio
+async def test_open_trade_cache_tracks_persist_and_close():
+    engine = StockSwingEngine(config_override=_paper_cfg())
+    fake_db = _FakeDB()
+    engine.db = fake_db
+
+    assert await engine._open_trade("AAPL", 100.0) is True
+    trade = engine._open_trades["AAPL"]
+    assert trade is fake_db.inserted[0][0]
+
+    assert await engine._close_trade(trade, reason="unit_test", force=True, market_price=101.0)
+    assert engine._open_trades == {}
+
+
+@pytest.mark.asyncio
+async def test_runtime_breakers_use_monitoring_snapshot():
+    engine = StockSwingEngine(config_override=_paper_cfg())
+    engine.db = _FakeDB()
+    for _ in range(3):
+        engine.risk_manager.record_closed_trade(-1.0)
+
+    engine.config.monitoring.consecutive_losses_pause_threshold = 3
+    await engine._apply_runtime_breakers(open_positions=0)
+    assert engine._trading_paused is False  # default threshold (4) still in effect
+
+    engine.apply_monitoring_config()
+    await engine._apply_runtime_breakers(open_positions=0)
+    assert engine._trading_paused is True
+    assert engine._auto_pause_reason == "consecutive_losses"
+
+
+def test_parse_dt_normalizes_iso_shapes_to_utc():
+    parse = StockSwingEngine._parse_dt
+    expected = datetime(2024, 10, 4, 12, 34, 56, tzinfo=timezone.utc)
+    assert parse("2024-10-04T12:34:56Z") == expected
+    assert parse(" 2024-10-04T12:34:56+00:00 ") == expected
+    assert parse("2024-10-04T08:34:56-04:00") == expected
+    assert parse("2024-10-04 12:34:56") == expected  # naive -> UTC
+    assert parse(expected.isoformat()).tzinfo is timezone.utc
+    assert parse("2024-10-04T08:34:56-04:00").tzinfo is timezone.utc
+    assert parse("not a date") is None
+    assert parse("") is None and parse(None) is None
@@ -8,15 +8,15 @@ import numpy as np
 import pytest
 
 from src.strategies.base import StrategySignal
-from src.strategies.ichimoku import IchimokuStrategy
+from src.strategies.ichimoku import IchimokuStrategy, _ichimoku_score
 from src.strategies.keltner import KeltnerStrategy
 from src.strategies.mean_reversion import MeanReversionStrategy
-from src.strategies.order_flow import OrderFlowStrategy
+from src.strategies.order_flow import OrderFlowStrategy, _order_flow_score
 from src.strategies.reversal import ReversalStrategy
 from src.strategies.stochastic_divergence import StochasticDivergenceStrategy
 from src.strategies.supertrend import SupertrendStrategy
 from src.strategies.trend import TrendStrategy
-from src.strategies.volatility_squeeze import VolatilitySqueezeStrategy
+from src.strategies.volatility_squeeze import VolatilitySqueezeStrategy, _trailing_squeeze_run
 
 
 def _make_replay_ohlcv(seed: int, n: int = 340):
@@ -107,22 +107,21 @@ REPLAY_CASES = [
     ReplayCase("ichimoku", IchimokuStrategy, 83, "short", {}),
     ReplayCase("order_flow", OrderFlowStrategy, 42, "long", {"market_data": _FakeMarketData()}),
     ReplayCase("trend", lambda: TrendStrategy(require_fresh_cross=False), 1, "long", {}),
-    ReplayCase("stochastic_divergence", StochasticDivergenceStrategy, 42, "neutral", {}),
+    ReplayCase("stochastic_divergence", StochasticDivergenceStrategy, 42, "long", {}),
     ReplayCase("volatility_squeeze", VolatilitySqueezeStrategy, 120, "long", {}),
     ReplayCase("supertrend", SupertrendStrategy, 22, "short", {}),
     ReplayCase("reversal", ReversalStrategy, 344, "short", {}),
 ]
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("case", REPLAY_CASES, ids=[c.name for c in REPLAY_CASES])
-async def test_strategy_replay_is_deterministic(case: ReplayCase):
+def test_strategy_replay_is_deterministic(case: ReplayCase):
     closes, highs, lows, volumes, opens = _make_replay_ohlcv(case.seed)
 
     snapshots = []
     for _ in range(3):
         strategy = case.strategy_factory()
-        signal = await strategy.analyze(
+        signal = strategy.analyze(
             "BTC/USD",
             closes,
             highs,
@@ -135,3 +134,116 @@ async def test_strategy_replay_is_deterministic(case: ReplayCase):
 
     assert snapshots[0] == snapshots[1] == snapshots[2]
     assert snapshots[0]["direction"] == case.expected_direction
+
+
+def test_ichimoku_signals_long_and_short():
+    # Seeds 157 and 241 end in a long and a short signal at 200 bars
+    strategy = IchimokuStrategy()
+    directions = []
+    for seed in (157, 241):
+        closes, highs, lows, volumes, _ = _make_replay_ohlcv(seed, n=200)
+        signal = strategy.analyze(
+            "BTC/USD", closes, highs, lows, volumes, round_trip_fee_pct=0.004
+        )
+        directions.append(signal.direction.value)
+    assert directions == ["long", "short"]
+
+    closes, highs, lows, volumes, _ = _make_replay_ohlcv(157, n=20)
+    short = strategy.analyze("BTC/USD", closes, highs, lows, volumes)
+    assert short.metadata["reason"] == "Insufficient data"
+
+
+def test_scalar_scoring_helpers_mirror_long_and_short():
+    # Fully confirmed long/short setups score the same with opposite direction
+    long_score = _order_flow_score(2.0, 0.3, True, True, False, 0.5, 0.5)
+    short_score = _order_flow_score(-2.0, 0.3, True, False, True, -0.5, -0.5)
+    assert long_score == pytest.approx((1.0, 0.85, 0.86))
+    assert short_score == pytest.approx((-1.0, 0.85, 0.86))
+    assert _order_flow_score(0.1, 0.3, True, True, True, 0.5, 0.5) == (0.0, 0.0, 0.0)
+
+    direction, strength, confidence, sl_dist, tp_base = _ichimoku_score(
+        100.0, 99.0, 98.0, 99.5, 95.0, 1.0, True, False, True, False
+    )
+    assert direction == 1.0
+    assert strength == pytest.approx(0.75)
+    assert confidence == pytest.approx(0.75)
+    assert sl_dist == pytest.approx(5.0)  # cloud edge is further than 2x ATR
+    assert tp_base == pytest.approx(103.0)
+    assert _ichimoku_score(
+        97.0, 99.0, 98.0, 99.5, 95.0, 1.0, True, True, True, True
+    ) == (0.0, 0.0, 0.0, 0.0, 0.0)  # price inside the cloud
+
+
+def test_supertrend_flips_long_and_short():
+    # Seeds 44 and 0 end in a long and a short flip at 200 bars
+    strategy = SupertrendStrategy()
+    directions = []
+    for seed in (44, 0):
+        closes, highs, lows, volumes, _ = _make_replay_ohlcv(seed, n=200)
+        signal = strategy.analyze(
+            "BTC/USD", closes, highs, lows, volumes, round_trip_fee_pct=0.004
+        )
+        directions.append(signal.direction.value)
+    assert directions == ["long", "short"]
+
+
+def _divergence_reference(prices, pct_k, lookback, bullish):
+    if len(prices) < lookback + 2:
+        return False
+    window, window_k = prices[-lookback:], pct_k[-lookback:]
+    sign = 1.0 if bullish else -1.0
+    extremes = [
+        i for i in range(1, len(window) - 1)
+        if sign * window[i] < sign * window[i - 1] and sign * window[i] < sign * window[i + 1]
+    ]
+    if len(extremes) < 2:
+        return False
+    recent, prior = extremes[-1], extremes[-2]
+    if np.isnan(window_k[recent]) or np.isnan(window_k[prior]):
+        return False
+    if bullish:
+        return bool(window[recent] < window[prior] and window_k[recent] > window_k[prior])
+    return bool(window[recent] > window[prior] and window_k[recent] < window_k[prior])
+
+
+def test_divergence_scan_matches_window_reference():
+    rng = np.random.default_rng(5)
+    found = 0
+    for _ in range(2000):
+        n = int(rng.integers(0, 40))
+        lookback = int(rng.integers(1, 25))
+        prices = np.round(rng.normal(size=n), 1)  # rounding creates ties
+        pct_k = rng.uniform(0, 100, n)
+        if n and rng.random() < 0.2:
+            pct_k[rng.integers(0, n)] = np.nan
+        bull = StochasticDivergenceStrategy._detect_bullish_divergence(prices, pct_k, lookback)
+        bear = StochasticDivergenceStrategy._detect_bearish_divergence(prices, pct_k, lookback)
+        assert bull == _divergence_reference(prices, pct_k, lookback, True)
+        assert bear == _divergence_reference(prices, pct_k, lookback, False)
+        found += bull + bear
+    assert found > 0
+
+
+def test_divergence_scan_accepts_strided_and_object_inputs():
+    rng = np.random.default_rng(11)
+    prices = np.round(rng.normal(size=120), 1)
+    pct_k = rng.uniform(0, 100, 120)
+    for p, k in (
+        (prices[::2], pct_k[::2]),
+        (prices.astype(object), pct_k.tolist()),
+    ):
+        expected = _divergence_reference(
+            np.asarray(p, dtype=float), np.asarray(k, dtype=float), 20, True,
+        )
+        assert StochasticDivergenceStrategy._detect_bullish_divergence(p, k, 20) == expected
+
+
+@pytest.mark.parametrize("run", [0, 1, 5, 63, 64, 65, 200, 299])
+def test_trailing_squeeze_run_spans_tail_windows(run):
+    n = 300
+    inside = np.zeros(n, dtype=bool)
+    inside[n - 1 - run:n - 1] = True  # run ends on the bar before the last
+    kc_upper, kc_lower = np.ones(n), -np.ones(n)
+    bb_upper = np.where(inside, 0.5, 2.0)
+    bb_lower = np.where(inside, -0.5, -2.0)
+    assert _trailing_squeeze_run(bb_upper, bb_lower, kc_upper, kc_lower) == run
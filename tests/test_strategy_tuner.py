@@ -0,0 +1,128 @@
+"""Tests for StrategyTuner per-strategy analysis and persistence."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import Any, Dict, List
+
+import pytest
+import yaml
+
+from src.core.config import ConfigManager
+from src.ml.strategy_tuner import AutoTuner, StrategyTuner
+
+
+class _TunerDB:
+    def __init__(self, trades: List[Dict[str, Any]]):
+        self._trades = trades
+        self.thoughts: List[Dict[str, Any]] = []
+
+    async def get_trade_history(self, limit: int = 500, tenant_id: str = "default"):
+        return self._trades[:limit]
+
+    async def log_thought(self, category, message, severity="info", metadata=None, tenant_id="default"):
+        self.thoughts.append({"category": category, "message": message, "severity": severity, "metadata": metadata})
+
+
+def _trades(strategy: str, pnls: List[float]) -> List[Dict[str, Any]]:
+    return [{"strategy": strategy, "pnl": p} for p in pnls]
+
+
+def _reference_sharpe(pnls: List[float]) -> float:
+    mean = sum(pnls) / len(pnls)
+    var = sum((x - mean) ** 2 for x in pnls) / (len(pnls) - 1)
+    return mean / math.sqrt(var)
+
+
+@pytest.fixture
+def saved_updates(monkeypatch):
+    captured: List[Dict[str, Any]] = []
+    monkeypatch.setattr(
+        "src.ml.strategy_tuner.save_to_yaml", lambda updates, path: captured.append(updates)
+    )
+    monkeypatch.setattr(ConfigManager, "reload", lambda self, path="": self._config)
+    return captured
+
+
+def test_sharpe_matches_sample_std_definition():
+    pnls = [1.0, -0.5, 2.0, 0.25, -1.0, 0.75]
+    assert StrategyTuner._sharpe(pnls) == pytest.approx(_reference_sharpe(pnls))
+    assert StrategyTuner._sharpe([1.0, 2.0]) == 0.0
+    assert StrategyTuner._sharpe([1.0] * 10) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_tune_disables_losing_strategy_and_skips_sparse(saved_updates):
+    losing = [-1.0, -2.0, -1.5, 0.1, -0.8] * 7
+    db = _TunerDB(
+        _trades("keltner", losing)
+        + _trades("trend", [1.0, -1.0] * 3)
+        + [{"strategy": "trend", "pnl": None}]
+    )
+    tuner = StrategyTuner(db, config_path="unused.yaml")
+
+    result = await tuner.tune()
+
+    actions = {c["strategy"]: c["action"] for c in result["changes"]}
+    assert actions == {"keltner": "disable"}
+    assert saved_updates == [{"strategies": {"keltner": {"enabled": False}}}]
+    assert db.thoughts[-1]["severity"] == "info"
+
+
+@pytest.mark.asyncio
+async def test_tune_without_trades_is_noop(saved_updates):
+    tuner = StrategyTuner(_TunerDB([]), config_path="unused.yaml")
+    result = await tuner.tune()
+    assert result["changes"] == []
+    assert saved_updates == []
+
+
+@pytest.mark.asyncio
+async def test_auto_tuner_sleeps_until_deadline(monkeypatch):
+    class _CountingTuner:
+        calls = 0
+
+        async def tune(self):
+            self.calls += 1
+            return {"changes": []}
+
+    delays: List[float] = []
+
+    async def _fake_sleep(delay):
+        delays.append(delay)
+        if len(delays) > 2:
+            raise asyncio.CancelledError
+
+    tuner = _CountingTuner()
+    monkeypatch.setattr("src.ml.strategy_tuner.asyncio.sleep", _fake_sleep)
+    await AutoTuner(tuner, interval_hours=168).run()
+
+    # One wakeup per interval instead of hourly polling
+    assert tuner.calls == 2
+    assert delays[0] == pytest.approx(168 * 3600, abs=5)
+    assert min(delays) > 3600
+
+
+def test_save_to_yaml_merges_strategy_blocks(tmp_path):
+    from src.core.config import save_to_yaml
+
+    path = tmp_path / "config.yaml"
+    path.write_text(
+        "strategies:\n"
+        "  # keep me\n"
+        "  keltner:\n"
+        "    enabled: true\n"
+        "    ema_period: 20\n"
+        "    weight: 0.25\n"
+        "  trend:\n"
+        "    weight: 0.08\n"
+    )
+
+    save_to_yaml({"strategies": {"keltner": {"weight": 0.287}}}, str(path))
+
+    text = path.read_text()
+    data = yaml.safe_load(text)
+    assert data["strategies"]["keltner"] == {"enabled": True, "ema_period": 20, "weight": 0.287}
+    assert data["strategies"]["trend"] == {"weight": 0.08}
+    assert "# keep me" in text